@@ -0,0 +1,148 @@
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Tuple, TypeVar
+
+import redis.asyncio as redis
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+MISSING = object()
+
+
+class LocalTTLCache(Generic[K]):
+    """
+    A bounded, per-process cache with a time-to-live per entry.
+
+    Entries expire `ttl_seconds` after they were stored, and once `max_size`
+    entries are held the least recently used one is evicted. `get` returns
+    `MISSING` on a miss, so cached None values are told apart from misses.
+    Values are copied on the way in and out, so callers may mutate what they get.
+
+    Every invalidation bumps `version`. A caller that loads a value from a slower
+    tier passes the version it saw before the load to `set`, and the value is
+    dropped if an invalidation happened in between, so a racing read never puts
+    a stale value back. While `active` is False (e.g. the invalidation channel is
+    down) the cache is bypassed entirely.
+    """
+
+    def __init__(
+        self, name: str, max_size: int, ttl_seconds: float, active: bool = True
+    ):
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self.active = active
+        self.version = 0
+        self._entries: OrderedDict[K, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Any:
+        if not self.active:
+            return MISSING
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: K, value: Any, version: int | None = None):
+        """Stores a value, unless the cache was invalidated since `version`."""
+        if not self.active or (version is not None and version != self.version):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K):
+        self.version += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self.version += 1
+        self._entries.clear()
+
+
+class CacheInvalidationListener:
+    """
+    Keeps `LocalTTLCache`s coherent across processes through Redis pub/sub.
+
+    `caches` maps a channel to the cache it invalidates. Writers publish the
+    invalidated key on the channel (or `CLEAR_ALL` to drop everything); every
+    process running a listener evicts that key from its own cache. Messages
+    published while a listener is disconnected are lost, so the caches are
+    deactivated until the subscription is back and then cleared.
+    """
+
+    CLEAR_ALL = "*"
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        caches: Dict[str, LocalTTLCache],
+        retry_seconds: float = 1.0,
+    ):
+        self.redis = redis_client
+        self.caches = caches
+        self.retry_seconds = retry_seconds
+        self._task: asyncio.Task | None = None
+        self._log = logger.bind(channels=list(caches))
+
+    def start(self):
+        """Starts the background subscription. Must be called inside a running loop."""
+        if self._task is None:
+            self._set_active(False)
+            self._task = asyncio.create_task(self._run())
+
+    def handle(self, channel: str, data: str):
+        """Applies a single invalidation message to the cache of `channel`."""
+        cache = self.caches[channel]
+        if data == self.CLEAR_ALL:
+            cache.clear()
+        else:
+            cache.invalidate(data)
+
+    def _set_active(self, active: bool):
+        for cache in self.caches.values():
+            cache.clear()
+            cache.active = active
+
+    async def _run(self):
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*self.caches)
+                self._set_active(True)
+                self._log.info("Local cache invalidation listener subscribed")
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._log.error(
+                    "Local cache invalidation listener failed, bypassing cache",
+                    error=str(e),
+                )
+            finally:
+                self._set_active(False)
+                await pubsub.aclose()
+            await asyncio.sleep(self.retry_seconds)
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
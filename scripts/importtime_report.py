@@ -0,0 +1,156 @@
+"""
+Lists the slowest imports of each service's entry point.
+
+Every service is imported in a fresh interpreter with `python -X importtime`,
+from its own directory and with the service's dependencies installed in the
+current environment. The report shows the total import time, the peak RSS of
+the interpreter, the slowest modules by cumulative time and the slowest
+top-level packages by self time. For the backend the plugin discovery run at
+startup is included, since that is where the plugins are imported.
+
+Usage (from the repository root):
+    python scripts/importtime_report.py backend --json before.json
+    python scripts/importtime_report.py backend --baseline before.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SERVICES = {
+    "backend": (
+        "services/backend",
+        "import main; from plugins import get_plugin_manager; get_plugin_manager()",
+    ),
+    "bot": ("services/bot", "import main"),
+    "sentiment_worker": ("services/sentiment_worker", "import main"),
+}
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def run_importtime(service: str, code: str | None = None) -> dict:
+    """
+    Imports a service's entry point in a fresh interpreter with `-X importtime`
+    and returns the parsed timings, the wall time and the peak RSS of the child.
+    """
+    directory, default_code = SERVICES[service]
+    pythonpath = [str(ROOT / "packages" / "kurisu_core" / "src")]
+    if os.environ.get("PYTHONPATH"):
+        pythonpath.append(os.environ["PYTHONPATH"])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(pythonpath))
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", code or default_code],
+        cwd=ROOT / directory,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stderr = process.stderr.read()
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    wall_seconds = time.perf_counter() - started
+
+    modules = []
+    errors = []
+    for line in stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append(
+                {
+                    "module": name,
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                    "depth": len(indent) // 2,
+                }
+            )
+        elif not line.startswith("import time:"):
+            errors.append(line)
+
+    return {
+        "service": service,
+        "returncode": process.returncode,
+        "wall_seconds": wall_seconds,
+        "max_rss_mb": rusage.ru_maxrss / 1024,
+        "total_import_ms": sum(m["cumulative_ms"] for m in modules if m["depth"] == 0),
+        "modules": modules,
+        "errors": errors[-20:],
+    }
+
+
+def package_totals(modules: list) -> list:
+    """Sums the self time of every module under each top-level package."""
+    totals = defaultdict(float)
+    for module in modules:
+        totals[module["module"].split(".")[0]] += module["self_ms"]
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def print_report(report: dict, top: int, baseline: dict | None = None):
+    print(f"== {report['service']} ==")
+    if report["returncode"]:
+        print(f"import failed with exit code {report['returncode']}:")
+        for line in report["errors"]:
+            print(f"  {line}")
+    print(
+        f"total import {report['total_import_ms']:9.1f} ms  "
+        f"wall {report['wall_seconds']:6.2f} s  "
+        f"peak RSS {report['max_rss_mb']:7.1f} MB"
+    )
+    if baseline:
+        import_delta = report["total_import_ms"] - baseline["total_import_ms"]
+        rss_delta = report["max_rss_mb"] - baseline["max_rss_mb"]
+        print(
+            f"vs baseline: import {import_delta:+9.1f} ms  peak RSS {rss_delta:+7.1f} MB"
+        )
+
+    print(f"\nslowest modules (cumulative, top {top}):")
+    for module in sorted(
+        report["modules"], key=lambda m: m["cumulative_ms"], reverse=True
+    )[:top]:
+        print(f"  {module['cumulative_ms']:9.1f} ms  {module['module']}")
+
+    print(f"\nslowest packages (self time, top {top}):")
+    for package, self_ms in package_totals(report["modules"])[:top]:
+        print(f"  {self_ms:9.1f} ms  {package}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "services", nargs="*", choices=list(SERVICES), default=list(SERVICES)
+    )
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--code", help="Statement to time instead of the default")
+    parser.add_argument("--json", dest="json_path", help="Write the raw reports here")
+    parser.add_argument("--baseline", help="A previous --json output to compare with")
+    args = parser.parse_args()
+
+    baselines = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = {report["service"]: report for report in json.load(f)}
+
+    reports = [run_importtime(service, args.code) for service in args.services]
+    for report in reports:
+        print_report(report, args.top, baselines.get(report["service"]))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, HttpUrl, MongoDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +32,31 @@ class AppConfig(BaseSettings):
     redis_url: RedisDsn = Field(..., alias="REDIS_URL")
     redis_password: str | None = Field(default=None, alias="REDIS_PASSWORD")
 
+    sentiment_queue_transport: Literal["list", "stream"] = Field(
+        default="list", alias="SENTIMENT_QUEUE_TRANSPORT"
+    )
+
+    message_buffer_flush_size: int = Field(
+        default=500, alias="MESSAGE_BUFFER_FLUSH_SIZE"
+    )
+    message_buffer_flush_interval_seconds: float = Field(
+        default=1.0, alias="MESSAGE_BUFFER_FLUSH_INTERVAL_SECONDS"
+    )
+    message_buffer_max_size: int = Field(default=20000, alias="MESSAGE_BUFFER_MAX_SIZE")
+    message_buffer_max_attempts: int = Field(
+        default=5, alias="MESSAGE_BUFFER_MAX_ATTEMPTS"
+    )
+
+    config_local_cache_enabled: bool = Field(
+        default=True, alias="CONFIG_LOCAL_CACHE_ENABLED"
+    )
+    config_local_cache_max_size: int = Field(
+        default=1024, alias="CONFIG_LOCAL_CACHE_MAX_SIZE"
+    )
+    config_local_cache_ttl_seconds: float = Field(
+        default=30.0, alias="CONFIG_LOCAL_CACHE_TTL_SECONDS"
+    )
+
     owner_id: int = Field(..., alias="OWNER_ID")
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -21,6 +21,8 @@ from utils.redis_client import close_redis_client, init_redis_client
 from kurisu_core.tracing import setup_tracing
 from utils.asset_service import LocalAssetService
 from kurisu_core.logging_config import setup_structlog
+from plugins.core.messages.service import create_message_write_buffer
+from plugins.core.config.service import create_config_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -68,6 +70,19 @@ async def lifespan(app: FastAPI):
     app.state.redis = await init_redis_client(app.state.settings)
     logger.info("Successfully connected to Redis.")
 
+    app.state.message_buffer = create_message_write_buffer(
+        db, app.state.redis, app.state.settings
+    )
+    app.state.message_buffer.start()
+    logger.info("Message write-behind buffer started.")
+
+    app.state.config_cache, app.state.config_cache_listener = create_config_cache(
+        app.state.redis, app.state.settings
+    )
+    if app.state.config_cache_listener:
+        app.state.config_cache_listener.start()
+        logger.info("Local config cache enabled.")
+
     app.state.llm_client = LLMClient(
         api_key=app.state.settings.llm_api_key,
         base_url=str(app.state.settings.llm_base_url),
@@ -88,6 +103,10 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Application shutting down...")
+    await app.state.message_buffer.close()
+    logger.info("Message write-behind buffer drained.")
+    if app.state.config_cache_listener:
+        await app.state.config_cache_listener.close()
     app.state.mongo_client.close()
     logger.info("MongoDB connection closed.")
     await close_redis_client()
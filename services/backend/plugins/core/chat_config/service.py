@@ -1,24 +1,55 @@
 """Service layer for chat configuration operations."""
 
+import json
 from datetime import UTC, datetime
 from typing import Annotated, Any
 
+import redis.asyncio as redis
 from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from plugins.core.chat_config.models import ChatConfig
 from plugins.core.chat_config.repository import ChatConfigRepository
 from structlog import get_logger
-from utils.dependencies import get_database
+from utils.dependencies import get_database, get_redis_client
 from utils.exceptions import ServiceError
 
 logger = get_logger(__name__)
 
+WRITE_THROUGH_SCRIPT = """
+if redis.call("HEXISTS", KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], ARGV[2], ARGV[3])
+return 1
+"""
 
-class ChatConfigService:
-    """Service for handling chat configuration operations."""
 
-    def __init__(self, repository: ChatConfigRepository):
+class ChatConfigService:
+    """
+    Service for handling chat configuration operations.
+
+    Configs are cached as one Redis hash per chat (`chat_config:{chat_id}`, a
+    JSON-encoded field per parameter). Reads go through the hash and load the
+    whole chat from MongoDB on a miss; the `LOADED_FIELD` marker tells a loaded
+    chat without the parameter apart from a chat that is not cached yet. Writes
+    go to MongoDB and then into the hash, but only if the chat is already cached,
+    so a write never creates a hash without the marker or an expiry. A load only
+    fills fields that are still absent, so it never overwrites a value written
+    concurrently.
+
+    Every change is published on `INVALIDATION_CHANNEL` as "{chat_id}:{param_name}",
+    so that clients caching chat configs can drop the stale value.
+    """
+
+    CACHE_PREFIX = "chat_config:"
+    CACHE_TTL_SECONDS = 3600
+    LOADED_FIELD = "__loaded__"
+    INVALIDATION_CHANNEL = "chat_config_invalidations"
+
+    def __init__(self, repository: ChatConfigRepository, redis_client: redis.Redis):
         self.repository = repository
+        self.redis = redis_client
+        self._write_through_script = redis_client.register_script(WRITE_THROUGH_SCRIPT)
 
     async def set_config(
         self, chat_id: int, param_name: str, param_value: Any
@@ -34,6 +65,8 @@ class ChatConfigService:
             }
 
             await self.repository.upsert_config(query, update)
+            await self._write_through(chat_id, param_name, param_value)
+            await self._publish_invalidation(chat_id, param_name)
             return ChatConfig(
                 chat_id=chat_id, param_name=param_name, param_value=param_value
             )
@@ -43,13 +76,87 @@ class ChatConfigService:
             logger.error("Unexpected error in set_config service", error=str(e))
             raise ServiceError(f"Unexpected error: {e}") from e
 
+    def _cache_key(self, chat_id: int) -> str:
+        return f"{self.CACHE_PREFIX}{chat_id}"
+
+    async def _write_through(self, chat_id: int, param_name: str, param_value: Any):
+        try:
+            await self._write_through_script(
+                keys=[self._cache_key(chat_id)],
+                args=[self.LOADED_FIELD, param_name, json.dumps(param_value)],
+            )
+        except Exception as e:
+            logger.error(
+                "Redis error on write-through, dropping cached chat config",
+                chat_id=chat_id,
+                error=str(e),
+            )
+            try:
+                await self.redis.delete(self._cache_key(chat_id))
+            except Exception as e:
+                logger.error(
+                    "Redis error on DELETE, cached chat config may be stale",
+                    chat_id=chat_id,
+                    error=str(e),
+                )
+
+    async def _load_chat(self, chat_id: int) -> dict[str, Any]:
+        """Reads all parameters of a chat from MongoDB and caches them."""
+        documents = await self.repository.find_all_configs_for_chat(chat_id)
+        configs: dict[str, Any] = {
+            doc.get("param_name"): doc.get("param_value")
+            for doc in documents
+            if doc.get("param_name")
+        }
+        cache_key = self._cache_key(chat_id)
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            for param_name, param_value in configs.items():
+                pipe.hsetnx(cache_key, param_name, json.dumps(param_value))
+            pipe.hset(cache_key, self.LOADED_FIELD, "1")
+            pipe.expire(cache_key, self.CACHE_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(
+                "Redis error caching chat configs", chat_id=chat_id, error=str(e)
+            )
+        return configs
+
+    async def _publish_invalidation(self, chat_id: int, param_name: str):
+        try:
+            await self.redis.publish(
+                self.INVALIDATION_CHANNEL, f"{chat_id}:{param_name}"
+            )
+        except Exception as e:
+            logger.error(
+                "Redis error on PUBLISH",
+                chat_id=chat_id,
+                param_name=param_name,
+                error=str(e),
+            )
+
     async def get_config(self, chat_id: int, param_name: str) -> ChatConfig | None:
         """Get a configuration parameter for a specific chat."""
         try:
-            document = await self.repository.find_one_config(chat_id, param_name)
-            if document:
-                return ChatConfig(**document)
-            return None
+            try:
+                cached_value, loaded = await self.redis.hmget(
+                    self._cache_key(chat_id), [param_name, self.LOADED_FIELD]
+                )
+            except Exception as e:
+                logger.error("Redis error on HMGET", chat_id=chat_id, error=str(e))
+                cached_value, loaded = None, None
+            if loaded is not None:
+                if cached_value is None:
+                    return None
+                param_value = json.loads(cached_value)
+            else:
+                configs = await self._load_chat(chat_id)
+                if param_name not in configs:
+                    return None
+                param_value = configs[param_name]
+            return ChatConfig(
+                chat_id=chat_id, param_name=param_name, param_value=param_value
+            )
         except ServiceError:
             raise
         except Exception as e:
@@ -59,13 +166,18 @@ class ChatConfigService:
     async def get_all_configs_for_chat(self, chat_id: int) -> dict[str, Any]:
         """Get all configuration parameters for a specific chat."""
         try:
-            documents = await self.repository.find_all_configs_for_chat(chat_id)
-            configs: dict[str, Any] = {
-                doc.get("param_name"): doc.get("param_value")
-                for doc in documents
-                if doc.get("param_name")
+            try:
+                cached = await self.redis.hgetall(self._cache_key(chat_id))
+            except Exception as e:
+                logger.error("Redis error on HGETALL", chat_id=chat_id, error=str(e))
+                cached = {}
+            if self.LOADED_FIELD not in cached:
+                return await self._load_chat(chat_id)
+            return {
+                param_name: json.loads(value)
+                for param_name, value in cached.items()
+                if param_name != self.LOADED_FIELD
             }
-            return configs
         except ServiceError:
             raise
         except Exception as e:
@@ -89,5 +201,6 @@ async def get_chat_config_repository(
 
 async def get_chat_config_service(
     repository: Annotated[ChatConfigRepository, Depends(get_chat_config_repository)],
+    redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
 ) -> ChatConfigService:
-    return ChatConfigService(repository)
+    return ChatConfigService(repository, redis_client)
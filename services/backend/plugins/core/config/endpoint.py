@@ -3,7 +3,12 @@ from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from .models import ConfigGetResponse, SetConfigRequest
+from .models import (
+    ConfigGetResponse,
+    ResolveBatchRequest,
+    ResolveBatchResponse,
+    SetConfigRequest,
+)
 from .service import ConfigService, get_config_service
 
 router = APIRouter()
@@ -37,6 +42,22 @@ async def resolve_config(
     return {"key": key, "value": value}
 
 
+@router.post(
+    "/resolve-batch",
+    response_model=ResolveBatchResponse,
+    summary="Resolve several configuration values (get or create)",
+    description="Fetches the values of several configuration keys in one call. Keys that do not exist are created with their provided default value.",
+)
+async def resolve_config_batch(
+    request: ResolveBatchRequest,
+    service: Annotated[ConfigService, Depends(get_config_service)],
+):
+    values = await service.get_or_create_many(
+        {item.key: (item.default, item.description) for item in request.items}
+    )
+    return ResolveBatchResponse(values=values)
+
+
 @router.post(
     "",
     response_model=ConfigGetResponse,
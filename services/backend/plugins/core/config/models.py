@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
 
 from pydantic import BaseModel, Field
 
@@ -37,3 +37,23 @@ class ConfigGetResponse(BaseModel):
     value: Any
     description: str | None
     updated_at: datetime
+
+
+class ResolveConfigItem(BaseModel):
+    """A key to resolve, with the default it is created with if missing."""
+
+    key: str
+    default: Any = None
+    description: str | None = None
+
+
+class ResolveBatchRequest(BaseModel):
+    """Request model for resolving several configuration keys at once."""
+
+    items: List[ResolveConfigItem]
+
+
+class ResolveBatchResponse(BaseModel):
+    """Resolved values, keyed by configuration key."""
+
+    values: Dict[str, Any]
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
 from pymongo.errors import PyMongoError
 from structlog import get_logger
 from utils.exceptions import ServiceError
@@ -28,6 +29,50 @@ class ConfigRepository:
                 f"Database error while getting config for key '{key}'"
             ) from e
 
+    async def get_configs(self, keys: List[str]) -> Dict[str, ConfigItem]:
+        """Retrieves the existing configuration items among `keys` in one query."""
+        try:
+            cursor = self._collection.find({"key": {"$in": keys}})
+            docs = await cursor.to_list(length=None)
+            return {doc["key"]: ConfigItem(**doc) for doc in docs}
+        except PyMongoError as e:
+            logger.error("DB error getting configs", keys=keys, error=str(e))
+            raise ServiceError("Database error while getting configs") from e
+
+    async def insert_missing_configs(
+        self, defaults: Dict[str, Tuple[Any, str]]
+    ) -> Dict[str, ConfigItem]:
+        """
+        Creates the given keys with their default value and description in one
+        bulk write, leaving keys that already exist (e.g. created concurrently)
+        untouched, and returns the stored items.
+        """
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"key": key},
+                {
+                    "$setOnInsert": {
+                        "key": key,
+                        "value": value,
+                        "description": description,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            )
+            for key, (value, description) in defaults.items()
+        ]
+        try:
+            await self._collection.bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            logger.error(
+                "DB error inserting configs", keys=list(defaults), error=str(e)
+            )
+            raise ServiceError("Database error while creating configs") from e
+        return await self.get_configs(list(defaults))
+
     async def upsert_config(
         self, key: str, value: Any, description: str | None
     ) -> ConfigItem:
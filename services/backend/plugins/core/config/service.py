@@ -1,11 +1,12 @@
 import json
 import time
-from typing import Annotated, Any
+from typing import Annotated, Any, Dict, List, Tuple
 import redis.asyncio as redis
-from fastapi import Depends
+from fastapi import Depends, Request
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from structlog import get_logger
 from utils.dependencies import get_database, get_redis_client
+from utils.local_cache import MISSING, CacheInvalidationListener, LocalTTLCache
 from .models import ConfigGetResponse, SetConfigRequest
 from .repository import ConfigRepository
 
@@ -16,15 +17,26 @@ class ConfigService:
     """
     Service layer for managing configurations with a caching layer.
     Orchestrates reads/writes between Redis cache and MongoDB persistence.
+
+    With a `local_cache`, hot reads are served from process memory in front of
+    Redis. Writes and explicit invalidations publish the key on
+    `INVALIDATION_CHANNEL`, where every replica's listener evicts it.
     """
 
     CACHE_PREFIX = "config:"
     DEFAULT_CACHE_TTL_SECONDS = 60
     TTL_CONFIG_KEY = "core/config.ttl_seconds"
+    INVALIDATION_CHANNEL = "config_invalidations"
 
-    def __init__(self, repository: ConfigRepository, redis_client: redis.Redis):
+    def __init__(
+        self,
+        repository: ConfigRepository,
+        redis_client: redis.Redis,
+        local_cache: LocalTTLCache | None = None,
+    ):
         self.repository = repository
         self.redis = redis_client
+        self.local_cache = local_cache
         self._current_ttl: int | None = None
         self._ttl_last_refreshed: float = 0
         self._ttl_refresh_interval: int = 10
@@ -33,7 +45,8 @@ class ConfigService:
         """
         Gets the current cache TTL.
         It caches the TTL value itself for a short period to avoid checking Redis/DB
-        on every single request, making it highly efficient.
+        on every single request, making it highly efficient. The TTL is stored
+        before a value loaded from the DB is cached, since caching needs the TTL.
         """
         now = time.time()
         if (
@@ -41,34 +54,124 @@ class ConfigService:
             and (now - self._ttl_last_refreshed) < self._ttl_refresh_interval
         ):
             return self._current_ttl
-        ttl_value = await self.get(
-            self.TTL_CONFIG_KEY, default=self.DEFAULT_CACHE_TTL_SECONDS
-        )
+        version = self._local_version()
+        ttl_value = await self._get_cached(self.TTL_CONFIG_KEY, version)
+        config_item = None
+        if ttl_value is MISSING:
+            config_item = await self.repository.get_config(self.TTL_CONFIG_KEY)
+            ttl_value = config_item.value if config_item else None
         if not isinstance(ttl_value, int) or ttl_value <= 0:
             ttl_value = self.DEFAULT_CACHE_TTL_SECONDS
         self._current_ttl = ttl_value
         self._ttl_last_refreshed = now
+        if config_item:
+            await self._cache_value(self.TTL_CONFIG_KEY, config_item.value, version)
         return self._current_ttl
 
-    async def get(self, key: str, default: Any = None) -> Any:
-        cache_key = f"{self.CACHE_PREFIX}{key}"
+    def _local_version(self) -> int | None:
+        return self.local_cache.version if self.local_cache is not None else None
+
+    async def _get_cached(self, key: str, version: int | None) -> Any:
+        """
+        Looks a key up in the local cache, then in Redis.
+        Returns `MISSING` if neither holds it.
+        """
+        if self.local_cache is not None:
+            value = self.local_cache.get(key)
+            if value is not MISSING:
+                return value
         try:
-            cached_value = await self.redis.get(cache_key)
-            if cached_value is not None:
-                logger.debug("Config cache hit", key=key)
-                return json.loads(cached_value)
+            cached_value = await self.redis.get(f"{self.CACHE_PREFIX}{key}")
         except Exception as e:
             logger.error("Redis error on GET", key=key, error=str(e))
+            return MISSING
+        if cached_value is None:
+            return MISSING
+        logger.debug("Config cache hit", key=key)
+        value = json.loads(cached_value)
+        if self.local_cache is not None:
+            self.local_cache.set(key, value, version)
+        return value
+
+    async def _cache_value(self, key: str, value: Any, version: int | None):
+        """Stores a value loaded from the database in Redis and the local cache."""
+        ttl = await self._get_current_ttl()
+        try:
+            await self.redis.set(f"{self.CACHE_PREFIX}{key}", json.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.error("Redis error on SET", key=key, error=str(e))
+        if self.local_cache is not None:
+            self.local_cache.set(key, value, version)
+
+    async def _get_many_cached(
+        self, keys: List[str], version: int | None
+    ) -> Dict[str, Any]:
+        """
+        Looks keys up in the local cache, then the rest in Redis with one MGET.
+        Keys held by neither are left out of the result.
+        """
+        found: Dict[str, Any] = {}
+        remaining = []
+        for key in keys:
+            value = (
+                self.local_cache.get(key) if self.local_cache is not None else MISSING
+            )
+            if value is MISSING:
+                remaining.append(key)
+            else:
+                found[key] = value
+        if not remaining:
+            return found
+        try:
+            cached_values = await self.redis.mget(
+                [f"{self.CACHE_PREFIX}{key}" for key in remaining]
+            )
+        except Exception as e:
+            logger.error("Redis error on MGET", keys=remaining, error=str(e))
+            return found
+        for key, cached_value in zip(remaining, cached_values):
+            if cached_value is None:
+                continue
+            found[key] = json.loads(cached_value)
+            if self.local_cache is not None:
+                self.local_cache.set(key, found[key], version)
+        return found
+
+    async def _cache_values(self, values: Dict[str, Any], version: int | None):
+        """Stores values loaded from the database in Redis with one pipeline."""
+        ttl = await self._get_current_ttl()
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(f"{self.CACHE_PREFIX}{key}", json.dumps(value), ex=ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(
+                "Redis error on pipelined SET", keys=list(values), error=str(e)
+            )
+        if self.local_cache is not None:
+            for key, value in values.items():
+                self.local_cache.set(key, value, version)
+
+    async def _broadcast_invalidation(self, key: str):
+        """Evicts a key from the local cache of this and every other replica."""
+        if self.local_cache is not None:
+            self.local_cache.invalidate(key)
+        try:
+            await self.redis.publish(self.INVALIDATION_CHANNEL, key)
+        except Exception as e:
+            logger.error("Redis error on PUBLISH", key=key, error=str(e))
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        version = self._local_version()
+        value = await self._get_cached(key, version)
+        if value is not MISSING:
+            return value
         logger.debug("Config cache miss", key=key)
         config_item = await self.repository.get_config(key)
         if not config_item:
             return default
-        value_to_cache = json.dumps(config_item.value)
-        try:
-            ttl = await self._get_current_ttl()
-            await self.redis.set(cache_key, value_to_cache, ex=ttl)
-        except Exception as e:
-            logger.error("Redis error on SET", key=key, error=str(e))
+        await self._cache_value(key, config_item.value, version)
         return config_item.value
 
     async def get_or_create(
@@ -78,23 +181,14 @@ class ConfigService:
         Retrieves a config value. If it doesn't exist, it creates it
         with the provided default value and description, then returns the value.
         """
-        cache_key = f"{self.CACHE_PREFIX}{key}"
-        try:
-            cached_value = await self.redis.get(cache_key)
-            if cached_value is not None:
-                logger.debug("Config cache hit on get_or_create", key=key)
-                return json.loads(cached_value)
-        except Exception as e:
-            logger.error("Redis error on GET in get_or_create", key=key, error=str(e))
+        version = self._local_version()
+        value = await self._get_cached(key, version)
+        if value is not MISSING:
+            return value
         logger.debug("Config cache miss on get_or_create", key=key)
         config_item = await self.repository.get_config(key)
         if config_item:
-            value_to_cache = json.dumps(config_item.value)
-            try:
-                ttl = await self._get_current_ttl()
-                await self.redis.set(cache_key, value_to_cache, ex=ttl)
-            except Exception as e:
-                logger.error("Redis error on SET after DB find", key=key, error=str(e))
+            await self._cache_value(key, config_item.value, version)
             return config_item.value
         logger.info("Config key not found, creating with default value", key=key)
         new_config_item = await self.repository.upsert_config(
@@ -102,14 +196,60 @@ class ConfigService:
             value=default,
             description=description or f"Auto-initialized config for {key}",
         )
-        value_to_cache = json.dumps(new_config_item.value)
-        try:
-            ttl = await self._get_current_ttl()
-            await self.redis.set(cache_key, value_to_cache, ex=ttl)
-        except Exception as e:
-            logger.error("Redis error on SET after create", key=key, error=str(e))
+        await self._cache_value(key, new_config_item.value, version)
         return new_config_item.value
 
+    async def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Retrieves several config values with at most one Redis and one database
+        round trip. Keys that don't exist map to `default`.
+        """
+        version = self._local_version()
+        values = await self._get_many_cached(keys, version)
+        missing = [key for key in keys if key not in values]
+        if missing:
+            logger.debug("Config cache miss on get_many", keys=missing)
+            items = await self.repository.get_configs(missing)
+            loaded = {key: item.value for key, item in items.items()}
+            if loaded:
+                await self._cache_values(loaded, version)
+            values.update(loaded)
+        return {key: values.get(key, default) for key in keys}
+
+    async def get_or_create_many(
+        self, defaults: Dict[str, Tuple[Any, str | None]]
+    ) -> Dict[str, Any]:
+        """
+        Batched `get_or_create`. `defaults` maps each key to the default value and
+        description it is created with if it doesn't exist yet. Cache misses are
+        read with a single database query and missing keys are created with a
+        single bulk write.
+        """
+        version = self._local_version()
+        values = await self._get_many_cached(list(defaults), version)
+        missing = [key for key in defaults if key not in values]
+        if missing:
+            logger.debug("Config cache miss on get_or_create_many", keys=missing)
+            items = await self.repository.get_configs(missing)
+            to_create = {
+                key: (
+                    defaults[key][0],
+                    defaults[key][1] or f"Auto-initialized config for {key}",
+                )
+                for key in missing
+                if key not in items
+            }
+            if to_create:
+                logger.info(
+                    "Config keys not found, creating with default values",
+                    keys=list(to_create),
+                )
+                items.update(await self.repository.insert_missing_configs(to_create))
+            loaded = {key: item.value for key, item in items.items()}
+            await self._cache_values(loaded, version)
+            values.update(loaded)
+        return {key: values.get(key, default) for key, (default, _) in defaults.items()}
+
     async def set(self, request: SetConfigRequest) -> ConfigGetResponse:
         config_item = await self.repository.upsert_config(
             request.key, request.value, request.description
@@ -123,11 +263,12 @@ class ConfigService:
                 logger.info("TTL config key was updated, forcing refresh on next call.")
         except Exception as e:
             logger.error("Redis error on DELETE", key=request.key, error=str(e))
-        return ConfigGetResponse.model_validate(config_item)
+        await self._broadcast_invalidation(request.key)
+        return ConfigGetResponse.model_validate(config_item.model_dump())
 
     async def get_full_config_item(self, key: str) -> ConfigGetResponse | None:
         item = await self.repository.get_config(key)
-        return ConfigGetResponse.model_validate(item) if item else None
+        return ConfigGetResponse.model_validate(item.model_dump()) if item else None
 
     async def get_all_configs(self) -> list[ConfigGetResponse]:
         """
@@ -138,7 +279,10 @@ class ConfigService:
         return [ConfigGetResponse.model_validate(item.model_dump()) for item in items]
 
     async def clear_cache_for_key(self, key: str) -> bool:
-        """Invalidates the Redis cache for a specific configuration key."""
+        """
+        Invalidates the Redis cache for a specific configuration key, and the
+        local cache of every replica.
+        """
         cache_key = f"{self.CACHE_PREFIX}{key}"
         try:
             deleted_count = await self.redis.delete(cache_key)
@@ -149,10 +293,11 @@ class ConfigService:
                 logger.info(
                     "TTL config key cache was cleared, forcing refresh on next call."
                 )
-            return deleted_count > 0
         except Exception as e:
             logger.error("Redis error on explicit DELETE", key=key, error=str(e))
-            return False
+            deleted_count = 0
+        await self._broadcast_invalidation(key)
+        return deleted_count > 0
 
 
 async def get_config_collection(
@@ -167,8 +312,35 @@ async def get_config_repository(
     return ConfigRepository(collection)
 
 
+def get_config_cache(request: Request) -> LocalTTLCache | None:
+    """Dependency to get the process-wide config cache, if it is enabled."""
+    return request.app.state.config_cache
+
+
 async def get_config_service(
     repository: Annotated[ConfigRepository, Depends(get_config_repository)],
     redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
+    local_cache: Annotated[LocalTTLCache | None, Depends(get_config_cache)],
 ) -> ConfigService:
-    return ConfigService(repository, redis_client)
+    return ConfigService(repository, redis_client, local_cache)
+
+
+def create_config_cache(
+    redis_client: redis.Redis, settings
+) -> Tuple[LocalTTLCache | None, CacheInvalidationListener | None]:
+    """
+    Builds the process-wide config cache and the listener that keeps it in sync
+    with the other replicas. Called once from the application lifespan, which
+    owns the listener's start and shutdown.
+    """
+    if not settings.config_local_cache_enabled:
+        return None, None
+    cache = LocalTTLCache(
+        name="config",
+        max_size=settings.config_local_cache_max_size,
+        ttl_seconds=settings.config_local_cache_ttl_seconds,
+    )
+    listener = CacheInvalidationListener(
+        redis_client, {ConfigService.INVALIDATION_CHANNEL: cache}
+    )
+    return cache, listener
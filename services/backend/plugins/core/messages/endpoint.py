@@ -1,7 +1,8 @@
 from typing import Annotated, Any, Dict
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends
 import structlog
-from .service import MessageService, get_message_service
+from utils.write_buffer import WriteBehindBuffer, get_message_buffer
+from .models import SaveMessagesBatchRequest
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
@@ -10,12 +11,12 @@ logger = structlog.get_logger(__name__)
 @router.post("/save", status_code=202)
 async def save_message(
     message_data: Dict[str, Any],
-    background_tasks: BackgroundTasks,
-    service: Annotated[MessageService, Depends(get_message_service)],
+    buffer: Annotated[WriteBehindBuffer, Depends(get_message_buffer)],
 ):
     """
-    Accepts a message from the bot, saves it, and queues it for further
-    processing in the background. Returns immediately with 202 Accepted.
+    Accepts a message from the bot and hands it to the shared write-behind
+    buffer, which persists and queues it for further processing.
+    Returns immediately with 202 Accepted, or 429 if the buffer is full.
     """
     correlation_id = message_data.get("correlation_id")
     chat_id = message_data.get("chat", {}).get("id")
@@ -29,6 +30,22 @@ async def save_message(
 
     logger.info("Received message to save")
 
-    background_tasks.add_task(service.save_and_process_message, message_data)
+    buffer.add(message_data)
 
     return {"status": "accepted"}
+
+
+@router.post("/save-batch", status_code=202)
+async def save_messages_batch(
+    request: SaveMessagesBatchRequest,
+    buffer: Annotated[WriteBehindBuffer, Depends(get_message_buffer)],
+):
+    """
+    Accepts a batch of messages buffered by the bot and hands them to the shared
+    write-behind buffer. Returns 202 Accepted, or 429 if the buffer is full.
+    """
+    logger.info("Received message batch to save", batch_size=len(request.messages))
+
+    buffer.add_many(request.messages)
+
+    return {"status": "accepted", "count": len(request.messages)}
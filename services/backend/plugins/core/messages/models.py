@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
 from pydantic import BaseModel, Field
 
 
@@ -6,3 +9,11 @@ class SentimentQueueJob(BaseModel):
 
     id: str = Field(alias="_id")
     text: str
+    date: datetime | None = None
+    chat_id: int | None = None
+
+
+class SaveMessagesBatchRequest(BaseModel):
+    """Request body for saving several raw Telegram messages in one call."""
+
+    messages: List[Dict[str, Any]] = Field(..., min_length=1, max_length=1000)
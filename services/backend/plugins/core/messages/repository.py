@@ -1,14 +1,22 @@
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, List
 from bson import ObjectId
 from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorCollection
-from pymongo.errors import PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
 import structlog
 from utils.dependencies import get_messages_collection
 from utils.exceptions import ServiceError
 
 logger = structlog.get_logger(__name__)
 
+DUPLICATE_KEY_ERROR = 11000
+
+
+def _is_duplicate_id(write_error: Dict[str, Any]) -> bool:
+    return write_error.get("code") == DUPLICATE_KEY_ERROR and write_error.get(
+        "keyPattern", {"_id": 1}
+    ) == {"_id": 1}
+
 
 class MessageRepository:
     """Handles database operations for storing messages."""
@@ -25,6 +33,48 @@ class MessageRepository:
             logger.error("Database error during message insert", error=str(e))
             raise ServiceError(f"Message insert database error: {e}") from e
 
+    async def save_many(self, messages: List[Dict[str, Any]]) -> List[ObjectId | None]:
+        """
+        Saves a batch of messages with a single unordered insert_many.
+        Returns the inserted id for each input message, or None where that
+        particular document was rejected by the server. A duplicate `_id` counts
+        as saved: it means the document was inserted by an earlier attempt of
+        the same batch.
+        """
+        if not messages:
+            return []
+        try:
+            result = await self._collection.insert_many(messages, ordered=False)
+            return list(result.inserted_ids)
+        except BulkWriteError as e:
+            failed_indexes = {
+                err["index"]
+                for err in e.details.get("writeErrors", [])
+                if not _is_duplicate_id(err)
+            }
+            if failed_indexes:
+                logger.error(
+                    "Partial failure during batched message insert",
+                    batch_size=len(messages),
+                    failed_count=len(failed_indexes),
+                )
+            else:
+                logger.info(
+                    "Batched message insert found documents from an earlier attempt",
+                    batch_size=len(messages),
+                )
+            return [
+                None if idx in failed_indexes else message.get("_id")
+                for idx, message in enumerate(messages)
+            ]
+        except PyMongoError as e:
+            logger.error(
+                "Database error during batched message insert",
+                batch_size=len(messages),
+                error=str(e),
+            )
+            raise ServiceError(f"Batched message insert database error: {e}") from e
+
 
 def get_message_repository(
     collection: Annotated[AsyncIOMotorCollection, Depends(get_messages_collection)],
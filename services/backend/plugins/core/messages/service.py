@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, List
 import redis.asyncio as redis
 from fastapi import Depends
+from motor.motor_asyncio import AsyncIOMotorDatabase
 import structlog
+from config import settings
 from utils.dependencies import get_redis_client
+from utils.write_buffer import WriteBehindBuffer
 from .models import SentimentQueueJob
 from .repository import MessageRepository, get_message_repository
 
@@ -17,6 +20,7 @@ class MessageService:
     """
 
     SENTIMENT_QUEUE_NAME = "sentiment_analysis_queue"
+    SENTIMENT_STREAM_NAME = "sentiment_analysis_stream"
 
     def __init__(
         self,
@@ -43,6 +47,22 @@ class MessageService:
             return False
         return True
 
+    async def _enqueue_for_analysis(self, jobs: List[str]):
+        """
+        Pushes serialized jobs to the sentiment transport in one round trip.
+        Uses a single LPUSH for the list transport, or a pipeline of XADDs when
+        the Redis Streams transport is enabled.
+        """
+        if not jobs:
+            return
+        if settings.sentiment_queue_transport == "stream":
+            pipe = self.redis.pipeline(transaction=False)
+            for job in jobs:
+                pipe.xadd(self.SENTIMENT_STREAM_NAME, {"data": job})
+            await pipe.execute()
+        else:
+            await self.redis.lpush(self.SENTIMENT_QUEUE_NAME, *jobs)
+
     def _convert_dates(self, message_data: Dict[str, Any]):
         """
         Recursively find and convert date strings to datetime objects for DB storage.
@@ -58,6 +78,18 @@ class MessageService:
                     logger.warning("Could not parse date string", key=key, value=value)
                     pass
 
+    @staticmethod
+    def _build_job(inserted_id: Any, message_data: Dict[str, Any]) -> str:
+        """Serializes the sentiment queue job for a saved message."""
+        date = message_data.get("date")
+        job = SentimentQueueJob(
+            _id=str(inserted_id),
+            text=message_data.get("text") or message_data.get("caption", ""),
+            date=date if isinstance(date, datetime) else None,
+            chat_id=(message_data.get("chat") or {}).get("id"),
+        )
+        return job.model_dump_json(by_alias=True)
+
     async def save_and_process_message(self, message_data: Dict[str, Any]) -> str:
         """
         Saves a message to MongoDB and, if it's valid, enqueues it for
@@ -72,16 +104,71 @@ class MessageService:
         logger.info("Message saved to database")
 
         if self._is_valid_for_analysis(message_data):
-            content = message_data.get("text") or message_data.get("caption", "")
-            job = SentimentQueueJob(_id=str(inserted_id), text=content)
-
-            await self.redis.lpush(self.SENTIMENT_QUEUE_NAME, job.model_dump_json())
+            await self._enqueue_for_analysis(
+                [self._build_job(inserted_id, message_data)]
+            )
             logger.info("Message enqueued for sentiment analysis")
 
         return str(inserted_id)
 
+    async def save_and_process_messages(
+        self, messages: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Batched variant of `save_and_process_message`. Writes all messages with a
+        single unordered insert and pushes every analysable one to the sentiment
+        queue in one LPUSH.
+
+        Safe to retry with the same list: documents inserted by an earlier
+        attempt keep the `_id` the driver assigned them and are reported as
+        saved again, so a retry after a failed enqueue still queues their jobs.
+        """
+        for message_data in messages:
+            self._convert_dates(message_data)
+
+        inserted_ids = await self.repository.save_many(messages)
+
+        jobs = []
+        for message_data, inserted_id in zip(messages, inserted_ids):
+            if inserted_id is None or not self._is_valid_for_analysis(message_data):
+                continue
+            jobs.append(self._build_job(inserted_id, message_data))
+
+        saved_ids = [str(i) for i in inserted_ids if i is not None]
+        logger.info(
+            "Message batch saved to database",
+            batch_size=len(messages),
+            saved_count=len(saved_ids),
+        )
+
+        if jobs:
+            await self._enqueue_for_analysis(jobs)
+            logger.info(
+                "Message batch enqueued for sentiment analysis", count=len(jobs)
+            )
+
+        return saved_ids
+
 
 def get_message_service(
     service: Annotated[MessageService, Depends(MessageService)],
 ) -> MessageService:
     return service
+
+
+def create_message_write_buffer(
+    database: AsyncIOMotorDatabase, redis_client: redis.Redis, settings
+) -> WriteBehindBuffer:
+    """
+    Builds the application-wide write-behind buffer for incoming messages.
+    Called once from the application lifespan, which owns its start and shutdown.
+    """
+    service = MessageService(MessageRepository(database.messages), redis_client)
+    return WriteBehindBuffer(
+        name="messages",
+        flush_func=service.save_and_process_messages,
+        flush_size=settings.message_buffer_flush_size,
+        flush_interval_seconds=settings.message_buffer_flush_interval_seconds,
+        max_size=settings.message_buffer_max_size,
+        max_attempts=settings.message_buffer_max_attempts,
+    )
@@ -1,11 +1,10 @@
 """Dick business logic and raw data generation service."""
 
+import math
 import random
 from io import BytesIO
 from typing import Any
 
-import matplotlib.pyplot as plt
-import numpy as np
 from plugins.fun.dick.constants import (
     AVG_GIRTH_ERECT,
     AVG_GIRTH_FLACCID,
@@ -31,8 +30,8 @@ def calculate_dong_attributes() -> dict[str, Any]:
     length_flaccid = generate_normal(AVG_LENGTH_FLACCID, STD_LENGTH_FLACCID, 5, 15)
     girth_flaccid = generate_normal(AVG_GIRTH_FLACCID, STD_GIRTH_FLACCID, 6, 13)
 
-    volume_erect = np.pi * (girth_erect / (2 * np.pi)) ** 2 * length_erect
-    volume_flaccid = np.pi * (girth_flaccid / (2 * np.pi)) ** 2 * length_flaccid
+    volume_erect = math.pi * (girth_erect / (2 * math.pi)) ** 2 * length_erect
+    volume_flaccid = math.pi * (girth_flaccid / (2 * math.pi)) ** 2 * length_flaccid
 
     rigidity = random.uniform(0, 100)
     stamina = random.uniform(1, 60)
@@ -77,6 +76,10 @@ def calculate_satisfaction_rating(
 
 
 def plot_attributes(attributes: dict[str, Any]) -> BytesIO:
+    """Renders the attribute charts. matplotlib and numpy are loaded on first use."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     fig = plt.figure(figsize=(16, 16))
     fig.suptitle("Атрибуты пениса", fontsize=16)
     ax_radar = fig.add_subplot(221, projection="polar")
@@ -1,17 +1,21 @@
 from io import BytesIO
+from typing import TYPE_CHECKING
 
-import magic
-import wand.color
-import wand.drawing
-import wand.image
-from PIL import Image, ImageOps, ImageSequence
 from structlog import get_logger
 from utils.exceptions import BadRequestError
 
+if TYPE_CHECKING:
+    import wand.image
+
 log = get_logger(__name__)
 
 
 class MagikService:
+    """
+    Image effects backed by ImageMagick (wand), Pillow and libmagic. They are
+    imported inside the methods that use them, so they load on first use.
+    """
+
     def __init__(self):
         self.supported_mimes = [
             "image/png",
@@ -22,6 +26,8 @@ class MagikService:
         log.info("MagikService initialized")
 
     def _validate_mime(self, media_bytes: BytesIO):
+        import magic
+
         media_bytes.seek(0)
         mime_type = magic.from_buffer(media_bytes.read(2048), mime=True)
         media_bytes.seek(0)
@@ -29,7 +35,7 @@ class MagikService:
             raise BadRequestError(f"Unsupported image format: {mime_type}")
         return mime_type == "image/gif"
 
-    def _process_gif_frames(self, image: wand.image.Image, process_func, *args):
+    def _process_gif_frames(self, image: "wand.image.Image", process_func, *args):
         frames = []
         for frame in image.sequence:
             with frame.clone() as img:
@@ -38,6 +44,8 @@ class MagikService:
         return frames
 
     def _save_gif(self, frames) -> BytesIO:
+        import wand.image
+
         output = BytesIO()
         with wand.image.Image() as gif:
             gif.sequence.extend(frames)
@@ -48,7 +56,7 @@ class MagikService:
         output.seek(0)
         return output
 
-    def _save_image(self, image: wand.image.Image) -> BytesIO:
+    def _save_image(self, image: "wand.image.Image") -> BytesIO:
         output = BytesIO()
         image.format = "png"
         image.save(file=output)
@@ -56,6 +64,8 @@ class MagikService:
         return output
 
     def do_magik(self, img_bytes: BytesIO, scale: int) -> tuple[BytesIO, str]:
+        import wand.image
+
         is_gif = self._validate_mime(img_bytes)
         with wand.image.Image(blob=img_bytes.getvalue()) as img:
             if is_gif:
@@ -67,7 +77,7 @@ class MagikService:
                 result_bytes = self._save_image(processed_img)
                 return result_bytes, "image/png"
 
-    def _apply_magik_effect(self, image: wand.image.Image, scale: int):
+    def _apply_magik_effect(self, image: "wand.image.Image", scale: int):
         image.transform(resize="800x800>")
         image.liquid_rescale(
             width=int(image.width * 0.5),
@@ -84,6 +94,8 @@ class MagikService:
         return image
 
     def do_pixelate(self, img_bytes: BytesIO, pixels: int) -> tuple[BytesIO, str]:
+        from PIL import Image, ImageSequence
+
         is_gif = self._validate_mime(img_bytes)
         img = Image.open(img_bytes)
 
@@ -113,8 +125,8 @@ class MagikService:
             return output, "image/png"
 
     def _mirror_side(
-        self, img: wand.image.Image, side: str, axis: str
-    ) -> wand.image.Image:
+        self, img: "wand.image.Image", side: str, axis: str
+    ) -> "wand.image.Image":
         half_dim = int(img.width / 2) if side == "vertical" else int(img.height / 2)
 
         crop_params = {
@@ -143,6 +155,8 @@ class MagikService:
         return img
 
     def do_mirror(self, img_bytes: BytesIO, effect: str) -> tuple[BytesIO, str]:
+        import wand.image
+
         is_gif = self._validate_mime(img_bytes)
 
         effects_map = {
@@ -166,6 +180,8 @@ class MagikService:
     def do_transform(
         self, img_bytes: BytesIO, transform_type: str
     ) -> tuple[BytesIO, str]:
+        from PIL import Image, ImageOps
+
         self._validate_mime(img_bytes)
         img = Image.open(img_bytes)
 
@@ -184,6 +200,8 @@ class MagikService:
         return output, "image/png"
 
     def do_rotate(self, img_bytes: BytesIO, degrees: int) -> tuple[BytesIO, str]:
+        from PIL import Image
+
         self._validate_mime(img_bytes)
         img = Image.open(img_bytes).convert("RGBA")
         rotated = img.rotate(degrees, expand=True)
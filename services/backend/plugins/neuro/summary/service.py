@@ -100,17 +100,6 @@ class SummaryService:
         except ValueError:
             raise BadRequestError("Invalid date format. Please use YYYY-MM-DD.")
 
-        min_messages = await self.config.get_or_create(
-            "neuro/summary.min_messages_threshold",
-            default=60,
-            description="Minimum messages in a day for a summary to be generated.",
-        )
-        model = await self.config.get_or_create(
-            "neuro/summary.model_name",
-            default="openai/gpt-4o-mini",
-            description="LLM model used for chat summarization.",
-        )
-
         try:
             with open(DEFAULT_PROMPT_PATH, "r", encoding="utf-8") as f:
                 default_prompt_text = f.read()
@@ -122,11 +111,25 @@ class SummaryService:
                 "Server is misconfigured: Default summary prompt is missing."
             )
 
-        system_prompt = await self.config.get_or_create(
-            "neuro/summary.system_prompt",
-            default=default_prompt_text,
-            description="The system prompt for the chat summarization LLM.",
+        config = await self.config.get_or_create_many(
+            {
+                "neuro/summary.min_messages_threshold": (
+                    60,
+                    "Minimum messages in a day for a summary to be generated.",
+                ),
+                "neuro/summary.model_name": (
+                    "openai/gpt-4o-mini",
+                    "LLM model used for chat summarization.",
+                ),
+                "neuro/summary.system_prompt": (
+                    default_prompt_text,
+                    "The system prompt for the chat summarization LLM.",
+                ),
+            }
         )
+        min_messages = config["neuro/summary.min_messages_threshold"]
+        model = config["neuro/summary.model_name"]
+        system_prompt = config["neuro/summary.system_prompt"]
 
         roast_enabled = await self.config.get(
             f"chat_config:{chat_id}:summary_roast_enabled", default=True
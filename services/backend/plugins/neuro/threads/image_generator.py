@@ -6,6 +6,9 @@ This module contains the logic for:
 2.  Sanitizing text from the LLM to prevent HTML injection vulnerabilities.
 3.  Rendering the sanitized content into an HTML template using Jinja2.
 4.  Converting the final HTML into a PNG image using the imgkit library.
+
+Jinja2, Pillow and imgkit are imported where they are used, so they are only
+loaded once a thread image is actually generated.
 """
 
 import html
@@ -14,9 +17,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import imgkit
-from jinja2 import Environment, FileSystemLoader
-from PIL import Image
 from structlog import get_logger
 from utils.asset_service import AssetService
 from utils.exceptions import NotFoundError, ServiceError
@@ -44,6 +44,8 @@ class BaseImageGenerator(ABC):
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template not found: {self.template_path}")
 
+        from jinja2 import Environment, FileSystemLoader
+
         loader = FileSystemLoader(searchpath=templates_root)
         self.jinja_env = Environment(loader=loader, autoescape=True)
 
@@ -59,6 +61,8 @@ class BaseImageGenerator(ABC):
         if not assets:
             return None
 
+        from PIL import Image
+
         asset = assets[0]
         try:
             with Image.open(asset.path) as img:
@@ -109,6 +113,8 @@ class BaseImageGenerator(ABC):
 
     def generate(self, response: LLMStoryResponse, post_id: str) -> bytes:
         """Generates a PNG image from the LLM response."""
+        import imgkit
+
         template = self.jinja_env.get_template(self.template_path.name)
         context = self._prepare_context(post_id, response)
         html_content = template.render(context)
@@ -23,26 +23,35 @@ class TranscribeService:
     async def transcribe_audio(
         self, file: UploadFile, duration: float
     ) -> TranscribeResponse:
-        min_duration = await self.config.get_or_create(
-            "utilities/transcribe.min_duration_seconds",
-            5,
-            "Min audio duration for transcription.",
-        )
-        max_duration = await self.config.get_or_create(
-            "utilities/transcribe.max_duration_seconds",
-            600,
-            "Max audio duration for transcription.",
-        )
-        model_name = await self.config.get_or_create(
-            "utilities/transcribe.model_name",
-            "fal-ai/wizper",
-            "Fal.ai model for transcription (e.g., fal-ai/wizper).",
-        )
-        blocked_texts = await self.config.get_or_create(
-            "utilities/transcribe.blocked_texts",
-            ["DimaTorzok", "Субтитры делал", "Субтитры сделал", "Продолжение следует"],
-            "List of phrases to block from transcription results.",
+        config = await self.config.get_or_create_many(
+            {
+                "utilities/transcribe.min_duration_seconds": (
+                    5,
+                    "Min audio duration for transcription.",
+                ),
+                "utilities/transcribe.max_duration_seconds": (
+                    600,
+                    "Max audio duration for transcription.",
+                ),
+                "utilities/transcribe.model_name": (
+                    "fal-ai/wizper",
+                    "Fal.ai model for transcription (e.g., fal-ai/wizper).",
+                ),
+                "utilities/transcribe.blocked_texts": (
+                    [
+                        "DimaTorzok",
+                        "Субтитры делал",
+                        "Субтитры сделал",
+                        "Продолжение следует",
+                    ],
+                    "List of phrases to block from transcription results.",
+                ),
+            }
         )
+        min_duration = config["utilities/transcribe.min_duration_seconds"]
+        max_duration = config["utilities/transcribe.max_duration_seconds"]
+        model_name = config["utilities/transcribe.model_name"]
+        blocked_texts = config["utilities/transcribe.blocked_texts"]
 
         if not min_duration <= duration <= max_duration:
             logger.warning("Audio duration out of bounds", duration=duration)
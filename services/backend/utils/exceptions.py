@@ -26,3 +26,10 @@ class LLMError(ServiceError):
 
     def __init__(self, detail: str = "LLM interaction failed", status_code: int = 502):
         super().__init__(detail, status_code=status_code)
+
+
+class TooManyRequestsError(ServiceError):
+    """Raised when the service is temporarily saturated and the client should retry."""
+
+    def __init__(self, detail: str = "Too many requests, please retry later"):
+        super().__init__(detail, status_code=429)
@@ -1,7 +1,5 @@
 from io import BytesIO
-import fal_client.client
 import structlog
-import fal_client
 from pydantic import BaseModel, ValidationError
 from utils.exceptions import ServiceError
 from utils.fal_models import FalImageGenerationOutput
@@ -21,6 +19,7 @@ class FalAIError(ServiceError):
 class FalAIClient:
     """
     A centralized client for the Fal.run API, using the official fal-client library.
+    The library is imported on the first call rather than at application startup.
     """
 
     def __init__(self):
@@ -33,6 +32,9 @@ class FalAIClient:
         Uploads an audio file in-memory, submits it for transcription,
         and awaits the result.
         """
+        import fal_client
+        import fal_client.client
+
         log = logger.bind(model_id=model_id, filename=filename, language=language)
         try:
             log.info("Uploading audio file to Fal.ai storage via client library")
@@ -80,6 +82,9 @@ class FalAIClient:
         Submits an image generation job using the fal-client library
         and returns a structured response.
         """
+        import fal_client
+        import fal_client.client
+
         log = logger.bind(model_id=model_id)
         try:
             log.info("Submitting image generation job via client library")
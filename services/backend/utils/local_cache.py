@@ -0,0 +1,35 @@
+from typing import Any
+
+from kurisu_core import local_cache
+from kurisu_core.local_cache import MISSING
+from prometheus_client import Counter
+
+LOCAL_CACHE_LOOKUPS = Counter(
+    "kurisu_backend_local_cache_lookups_total",
+    "Lookups in an in-process cache, by outcome.",
+    ["cache", "outcome"],
+)
+LOCAL_CACHE_INVALIDATIONS = Counter(
+    "kurisu_backend_local_cache_invalidations_total",
+    "Invalidation messages applied to an in-process cache.",
+    ["cache"],
+)
+
+
+class LocalTTLCache(local_cache.LocalTTLCache):
+    """The shared `kurisu_core` cache, counting hits and misses in Prometheus."""
+
+    def get(self, key) -> Any:
+        value = super().get(key)
+        if self.active:
+            outcome = "miss" if value is MISSING else "hit"
+            LOCAL_CACHE_LOOKUPS.labels(self.name, outcome).inc()
+        return value
+
+
+class CacheInvalidationListener(local_cache.CacheInvalidationListener):
+    """The shared `kurisu_core` listener, counting applied invalidations."""
+
+    def handle(self, channel: str, data: str):
+        super().handle(channel, data)
+        LOCAL_CACHE_INVALIDATIONS.labels(self.caches[channel].name).inc()
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+import structlog
+from fastapi import Request
+from prometheus_client import Counter, Gauge, Histogram
+from utils.exceptions import ServiceError, TooManyRequestsError
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+BUFFER_DEPTH = Gauge(
+    "kurisu_backend_write_buffer_depth",
+    "Number of items waiting in a write-behind buffer.",
+    ["buffer"],
+)
+BUFFER_LAST_FLUSH_SECONDS = Gauge(
+    "kurisu_backend_write_buffer_last_flush_seconds",
+    "Duration of the most recent write-behind buffer flush.",
+    ["buffer"],
+)
+BUFFER_FLUSH_SECONDS = Histogram(
+    "kurisu_backend_write_buffer_flush_seconds",
+    "Latency of write-behind buffer flushes.",
+    ["buffer"],
+)
+BUFFER_FLUSHED_ITEMS = Counter(
+    "kurisu_backend_write_buffer_flushed_items_total",
+    "Items handed to the flush callback of a write-behind buffer.",
+    ["buffer", "outcome"],
+)
+BUFFER_REJECTED_ITEMS = Counter(
+    "kurisu_backend_write_buffer_rejected_items_total",
+    "Items rejected because a write-behind buffer was full.",
+    ["buffer"],
+)
+
+
+def _item_id(item: Any) -> Any:
+    """Identifies a buffered item in logs without dumping its payload."""
+    return item.get("_id") if isinstance(item, dict) else None
+
+
+class WriteBehindBuffer(Generic[T]):
+    """
+    A bounded, in-process write-behind buffer shared by all requests.
+
+    Items are accumulated in memory and handed to `flush_func` in chunks of at most
+    `flush_size`, either as soon as a chunk is full or once `flush_interval_seconds`
+    has elapsed. When `max_size` items are pending, new writes are rejected with a
+    429 so that callers back off instead of growing memory without bound.
+    A failed flush puts its chunk back at the head of the buffer and is retried on
+    the next cycle. After `max_attempts` failed flushes the chunk is logged and
+    dropped, so that one bad chunk cannot block every later write.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_func: Callable[[list[T]], Awaitable[Any]],
+        flush_size: int,
+        flush_interval_seconds: float,
+        max_size: int,
+        max_attempts: int = 5,
+    ):
+        self.name = name
+        self._flush_func = flush_func
+        self.flush_size = max(1, flush_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_size = max(self.flush_size, max_size)
+        self.max_attempts = max(1, max_attempts)
+        self._head_attempts = 0
+        self._items: list[T] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+        self._log = logger.bind(buffer=name)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: T):
+        """Buffers a single item. See `add_many`."""
+        self.add_many([item])
+
+    def add_many(self, items: list[T]):
+        """
+        Buffers items for the next flush.
+
+        Raises:
+            TooManyRequestsError: If accepting the items would exceed `max_size`.
+            ServiceError: If the buffer is shutting down.
+        """
+        if self._closing:
+            raise ServiceError("Service is shutting down", status_code=503)
+        if len(self._items) + len(items) > self.max_size:
+            BUFFER_REJECTED_ITEMS.labels(self.name).inc(len(items))
+            self._log.warning(
+                "Write buffer full, rejecting items",
+                depth=len(self._items),
+                rejected=len(items),
+            )
+            raise TooManyRequestsError(
+                "Write buffer is full, please retry in a moment."
+            )
+        self._items.extend(items)
+        BUFFER_DEPTH.labels(self.name).set(len(self._items))
+        if len(self._items) >= self.flush_size:
+            self._wakeup.set()
+
+    def start(self):
+        """Starts the background flush loop. Must be called inside a running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self._log.info(
+                "Write buffer started",
+                flush_size=self.flush_size,
+                flush_interval_seconds=self.flush_interval_seconds,
+                max_size=self.max_size,
+            )
+
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.flush_interval_seconds
+                )
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                self._log.exception("Unexpected error in write buffer loop")
+
+    async def flush(self) -> bool:
+        """
+        Flushes everything currently buffered, chunk by chunk.
+        Returns False if a chunk failed and was put back for a later retry;
+        a chunk that reaches `max_attempts` is dropped and flushing goes on.
+        """
+        async with self._flush_lock:
+            while self._items:
+                chunk = self._items[: self.flush_size]
+                del self._items[: self.flush_size]
+                start = time.perf_counter()
+                try:
+                    await self._flush_func(chunk)
+                except Exception as e:
+                    BUFFER_FLUSHED_ITEMS.labels(self.name, "error").inc(len(chunk))
+                    self._head_attempts += 1
+                    if self._head_attempts >= self.max_attempts:
+                        self._head_attempts = 0
+                        BUFFER_FLUSHED_ITEMS.labels(self.name, "dropped").inc(
+                            len(chunk)
+                        )
+                        self._log.error(
+                            "Write buffer chunk failed too many times, dropping it",
+                            attempts=self.max_attempts,
+                            chunk_size=len(chunk),
+                            first_id=_item_id(chunk[0]),
+                            last_id=_item_id(chunk[-1]),
+                            error=str(e),
+                        )
+                        continue
+                    self._items[:0] = chunk
+                    self._log.error(
+                        "Write buffer flush failed, will retry",
+                        chunk_size=len(chunk),
+                        depth=len(self._items),
+                        attempt=self._head_attempts,
+                        error=str(e),
+                    )
+                    return False
+                finally:
+                    elapsed = time.perf_counter() - start
+                    BUFFER_FLUSH_SECONDS.labels(self.name).observe(elapsed)
+                    BUFFER_LAST_FLUSH_SECONDS.labels(self.name).set(elapsed)
+                    BUFFER_DEPTH.labels(self.name).set(len(self._items))
+                self._head_attempts = 0
+                BUFFER_FLUSHED_ITEMS.labels(self.name, "ok").inc(len(chunk))
+            return True
+
+    async def close(self, drain_attempts: int = 3):
+        """Stops accepting writes, stops the flush loop and drains what is left."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task:
+            await self._task
+            self._task = None
+        for _ in range(drain_attempts):
+            if await self.flush():
+                break
+        if self._items:
+            self._log.error(
+                "Write buffer could not be fully drained on shutdown",
+                lost_items=len(self._items),
+            )
+        else:
+            self._log.info("Write buffer drained")
+
+
+def get_message_buffer(request: Request) -> WriteBehindBuffer:
+    """
+    FastAPI dependency provider for the message write-behind buffer.
+    Retrieves the singleton instance from the application state.
+    """
+    return request.app.state.message_buffer
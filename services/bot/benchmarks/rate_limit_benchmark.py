@@ -0,0 +1,112 @@
+"""
+Compares the old INCR + EXPIRE rate limiter with the GCRA Lua script.
+
+Runs --checks rate-limit checks spread over --keys keys, --concurrency at a
+time, with both implementations against the same Redis, and reports checks
+per second, p50/p99 latency and the number of round trips each one made. The
+old limiter needs a second round trip for the first request in a window and a
+third (TTL) for every denied request; the script always needs one.
+
+Usage (from services/bot):
+    python -m benchmarks.rate_limit_benchmark --redis-url redis://localhost:6379/15
+    python -m benchmarks.rate_limit_benchmark  # in-process fakeredis, no network
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+from redis.asyncio import Redis
+
+from utils.rate_limiter import RateLimiter
+
+KEY_PREFIX = "rate_limit_benchmark"
+
+
+async def incr_expire_check(
+    client: Redis, key: str, limit: int, seconds: int
+) -> Tuple[bool, int]:
+    """The previous fixed-window limiter. Returns (allowed, round trips)."""
+    count = await client.incr(key)
+    round_trips = 1
+    if count == 1:
+        await client.expire(key, seconds)
+        round_trips += 1
+    if count > limit:
+        await client.ttl(key)
+        return False, round_trips + 1
+    return True, round_trips
+
+
+async def run(
+    name: str,
+    check: Callable[[str], Awaitable[Tuple[bool, int]]],
+    checks: int,
+    keys: int,
+    concurrency: int,
+):
+    latencies: List[float] = []
+    totals = {"allowed": 0, "round_trips": 0}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            allowed, round_trips = await check(f"{KEY_PREFIX}:{name}:{i % keys}")
+            latencies.append(time.perf_counter() - started)
+            totals["allowed"] += allowed
+            totals["round_trips"] += round_trips
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(checks)))
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:13s} {checks / elapsed:9.0f} checks/s  "
+        f"p50 {quantiles[49] * 1000:6.3f} ms  p99 {quantiles[98] * 1000:6.3f} ms  "
+        f"round trips/check {totals['round_trips'] / checks:4.2f}  "
+        f"allowed {totals['allowed']}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url")
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--seconds", type=int, default=60)
+    args = parser.parse_args()
+
+    if args.redis_url:
+        client = Redis.from_url(args.redis_url, decode_responses=True)
+    else:
+        import fakeredis
+
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    limiter = RateLimiter(client)
+
+    async def gcra_check(key: str) -> Tuple[bool, int]:
+        result = await limiter.hit(key, args.limit, args.seconds)
+        return result.allowed, 1
+
+    try:
+        await run(
+            "incr+expire",
+            lambda key: incr_expire_check(client, key, args.limit, args.seconds),
+            args.checks,
+            args.keys,
+            args.concurrency,
+        )
+        await run("gcra-script", gcra_check, args.checks, args.keys, args.concurrency)
+    finally:
+        async for key in client.scan_iter(f"{KEY_PREFIX}:*"):
+            await client.delete(key)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
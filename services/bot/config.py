@@ -22,6 +22,19 @@ class Config(BaseSettings):
     redis_url: RedisDsn = Field(..., alias="REDIS_URL")
     redis_password: str | None = Field(default=None, alias="REDIS_PASSWORD")
 
+    message_batch_size: int = Field(default=100, alias="MESSAGE_BATCH_SIZE")
+    message_batch_max_age_seconds: float = Field(
+        default=2.0, alias="MESSAGE_BATCH_MAX_AGE_SECONDS"
+    )
+    message_batch_max_buffered: int = Field(
+        default=10000, alias="MESSAGE_BATCH_MAX_BUFFERED"
+    )
+
+    config_cache_max_size: int = Field(default=4096, alias="CONFIG_CACHE_MAX_SIZE")
+    config_cache_ttl_seconds: float = Field(
+        default=60.0, alias="CONFIG_CACHE_TTL_SECONDS"
+    )
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     @property
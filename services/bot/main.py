@@ -6,6 +6,8 @@ from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 from pyrogram.client import Client
 from pyrogram.sync import idle
 from jobs.manager import init_scheduled_jobs
+from utils.config_cache import config_cache_listener
+from utils.message_batcher import message_sender
 from kurisu_core.logging_config import setup_structlog
 from kurisu_core.tracing import setup_tracing
 
@@ -29,10 +31,13 @@ async def main():
     async with app:
         logger.info("Client connected. Initializing scheduled jobs...")
         init_scheduled_jobs(app)
+        config_cache_listener.start()
         logger.info(
             f"Bot '{credentials.bot.name}' started successfully. Waiting for updates..."
         )
         await idle()
+        await config_cache_listener.close()
+        await message_sender.close()
 
     logger.info("Bot shutting down.")
 
@@ -1,4 +1,4 @@
-"""Messages plugin for bot that sends all messages to the backend API."""
+"""Messages plugin for bot that sends all messages to the backend API in batches."""
 
 import json
 import uuid
@@ -8,7 +8,7 @@ from opentelemetry import trace
 from opentelemetry.propagate import inject
 from pyrogram import Client, filters
 from pyrogram.enums import ChatType
-from utils.api_client import backend_client
+from utils.message_batcher import message_sender
 from utils.message_utils import get_message_content, get_user_identifier
 
 log = structlog.get_logger(__name__)
@@ -23,7 +23,7 @@ def serialize_message(obj: object) -> dict:
 async def message(client: Client, message):
     """Log all incoming messages by sending them to the backend API."""
     tracer = trace.get_tracer(__name__)
-    with tracer.start_as_current_span("save_message_via_api") as span:
+    with tracer.start_as_current_span("buffer_message_for_api") as span:
         try:
             correlation_id = str(uuid.uuid4())
             message_data = serialize_message(message)
@@ -35,15 +35,9 @@ async def message(client: Client, message):
             inject(trace_context)
             message_data["trace_context"] = trace_context
 
-            span.set_attribute("http.method", "POST")
-            span.set_attribute(
-                "http.url", f"{backend_client._client.base_url}/core/messages/save"
-            )
             span.set_attribute("messaging.message_id", message.id)
 
-            await backend_client.post(
-                "/core/messages/save", message=message, json=message_data
-            )
+            await message_sender.add(message_data)
 
             user_identifier = get_user_identifier(message)
             msg_content = get_message_content(message)
@@ -51,7 +45,7 @@ async def message(client: Client, message):
                 "DM" if message.chat.type == ChatType.PRIVATE else message.chat.title
             )
             log.info(
-                "Message sent to backend API",
+                "Message buffered for backend API",
                 chat_title=chat_title,
                 chat_id=message.chat.id,
                 user_identifier=user_identifier,
@@ -60,4 +54,4 @@ async def message(client: Client, message):
                 correlation_id=correlation_id,
             )
         except Exception:
-            log.exception("Failed to send message to backend API")
+            log.exception("Failed to buffer message for backend API")
@@ -1,16 +1,19 @@
 from typing import Any
 import structlog
+from kurisu_core.local_cache import MISSING
 from pyrogram.enums import ChatType
 from pyrogram.types import Message
 from .api_client import backend_client
+from .config_cache import chat_config_cache
 
 log = structlog.get_logger(__name__)
 
 
 async def get_chat_config(message: Message, key: str, default: Any = None) -> Any:
     """
-    Fetches a specific configuration value for a chat directly from the backend API.
-    The backend is the single source of truth for configuration.
+    Fetches a specific configuration value for a chat from the backend API.
+    The backend is the single source of truth for configuration; responses are
+    cached locally until the backend publishes a change for the chat parameter.
     Args:
         message: The Pyrogram message object.
         key: The configuration key to fetch (e.g., 'nsfw_enabled').
@@ -21,10 +24,16 @@ async def get_chat_config(message: Message, key: str, default: Any = None) -> An
     if message.chat.type == ChatType.PRIVATE:
         return default if default is not None else True
 
+    cache_key = f"{message.chat.id}:{key}"
+    response = chat_config_cache.get(cache_key)
+    if response is not MISSING:
+        return response.get("param_value", default)
+    version = chat_config_cache.version
     try:
         response = await backend_client.get(
             f"/core/chat_config/{message.chat.id}/{key}", message=message
         )
+        chat_config_cache.set(cache_key, response, version)
         return response.get("param_value", default)
     except Exception:
         log.error(
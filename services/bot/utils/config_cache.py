@@ -0,0 +1,24 @@
+from config import credentials
+from kurisu_core.local_cache import CacheInvalidationListener, LocalTTLCache
+
+from .redis_utils import redis_client
+
+CONFIG_CHANNEL = "config_invalidations"
+CHAT_CONFIG_CHANNEL = "chat_config_invalidations"
+
+config_cache = LocalTTLCache(
+    "config",
+    credentials.config_cache_max_size,
+    credentials.config_cache_ttl_seconds,
+    active=False,
+)
+chat_config_cache = LocalTTLCache(
+    "chat_config",
+    credentials.config_cache_max_size,
+    credentials.config_cache_ttl_seconds,
+    active=False,
+)
+config_cache_listener = CacheInvalidationListener(
+    redis_client,
+    {CONFIG_CHANNEL: config_cache, CHAT_CONFIG_CHANNEL: chat_config_cache},
+)
@@ -1,10 +1,12 @@
 import json
-from typing import Any
+from typing import Any, Dict, Tuple
 
 import structlog
+from kurisu_core.local_cache import MISSING
 from pyrogram.types import Message
 
 from .api_client import backend_client
+from .config_cache import config_cache
 from .exceptions import APIError
 
 log = structlog.get_logger(__name__)
@@ -17,8 +19,13 @@ async def get_config(
     Fetches a configuration value from the backend using the 'resolve' endpoint.
 
     If the key does not exist on the backend, it will be created using the
-    provided default value and description.
+    provided default value and description. Resolved values are cached locally
+    until the backend publishes a change.
     """
+    cached = config_cache.get(key)
+    if cached is not MISSING:
+        return cached
+    version = config_cache.version
     try:
         default_json = json.dumps(default)
         params = {"default": default_json}
@@ -29,7 +36,9 @@ async def get_config(
             f"/core/config/resolve/{key}", message=message, params=params
         )
 
-        return response.get("value", default)
+        value = response.get("value", default)
+        config_cache.set(key, value, version)
+        return value
 
     except APIError as e:
         log.error(
@@ -48,3 +57,60 @@ async def get_config(
             exc_info=True,
         )
         return default
+
+
+async def get_configs(
+    defaults: Dict[str, Tuple[Any, str | None]], message: Message
+) -> Dict[str, Any]:
+    """
+    Fetches several configuration values from the backend in one request, using
+    the 'resolve-batch' endpoint.
+
+    `defaults` maps each key to the default value and description it is created
+    with if it does not exist on the backend. Only keys missing from the local
+    cache are requested. On errors the local defaults are returned.
+    """
+    fallback = {key: default for key, (default, _) in defaults.items()}
+    values = {}
+    for key in defaults:
+        cached = config_cache.get(key)
+        if cached is not MISSING:
+            values[key] = cached
+    if len(values) == len(defaults):
+        return values
+    version = config_cache.version
+    try:
+        response = await backend_client.post(
+            "/core/config/resolve-batch",
+            message=message,
+            json={
+                "items": [
+                    {"key": key, "default": default, "description": description}
+                    for key, (default, description) in defaults.items()
+                    if key not in values
+                ]
+            },
+        )
+        resolved = response.get("values", {})
+        for key, value in resolved.items():
+            config_cache.set(key, value, version)
+        values.update(resolved)
+        return {key: values.get(key, default) for key, default in fallback.items()}
+
+    except APIError as e:
+        log.error(
+            "API error resolving configs, using local defaults",
+            keys=list(defaults),
+            status_code=e.status_code,
+            detail=e.detail,
+            correlation_id=e.correlation_id,
+        )
+        return fallback
+    except Exception as e:
+        log.error(
+            "Unhandled error resolving configs, using local defaults",
+            keys=list(defaults),
+            error=str(e),
+            exc_info=True,
+        )
+        return fallback
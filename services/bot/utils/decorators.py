@@ -1,4 +1,5 @@
 import functools
+import math
 import uuid
 from typing import Any, Literal
 
@@ -9,14 +10,17 @@ from pyrogram.types import Message
 from pyrogram.enums import ChatType
 from utils.chat_config import get_chat_config
 
-from .config_client import get_config
+from .config_client import get_configs
 from .exceptions import APIError
+from .rate_limiter import RateLimiter
 from .redis_utils import redis_client
 
 log = structlog.get_logger(__name__)
 
 OWNER_ID = credentials.owner_id
 
+rate_limiter = RateLimiter(redis_client)
+
 
 def owner_only(func):
     """
@@ -145,23 +149,29 @@ def rate_limit(
 ):
     """
     A decorator factory for rate-limiting commands based on dynamic config.
+
+    Allows `limit` calls per `seconds` window and key, with GCRA semantics:
+    a full burst is allowed, then capacity refills evenly over the window.
     """
 
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(client: Client, message: Message, *args, **kwargs):
-            seconds = await get_config(
-                f"{config_key_prefix}.seconds",
+            config = await get_configs(
+                {
+                    f"{config_key_prefix}.seconds": (
+                        default_seconds,
+                        f"Rate limit window in seconds for {func.__name__}.",
+                    ),
+                    f"{config_key_prefix}.limit": (
+                        default_limit,
+                        f"Number of allowed requests in the window for {func.__name__}.",
+                    ),
+                },
                 message,
-                default=default_seconds,
-                description=f"Rate limit window in seconds for {func.__name__}.",
-            )
-            limit = await get_config(
-                f"{config_key_prefix}.limit",
-                message,
-                default=default_limit,
-                description=f"Number of allowed requests in the window for {func.__name__}.",
             )
+            seconds = config[f"{config_key_prefix}.seconds"]
+            limit = config[f"{config_key_prefix}.limit"]
 
             if key == "user":
                 if not message.from_user:
@@ -173,25 +183,21 @@ def rate_limit(
             redis_key = f"ratelimit:{func.__name__}:{key}:{key_id}"
 
             try:
-                request_count = await redis_client.incr(redis_key)
-                if request_count == 1:
-                    await redis_client.expire(redis_key, seconds)
-
-                if request_count > limit:
-                    ttl = await redis_client.ttl(redis_key)
+                result = await rate_limiter.hit(redis_key, limit, seconds)
+                if not result.allowed:
+                    retry_after = math.ceil(result.retry_after)
 
                     log.info(
                         "Rate limit exceeded",
                         func_name=func.__name__,
                         rate_limit_key=key,
                         key_id=key_id,
-                        ttl=ttl,
-                        request_count=request_count,
+                        retry_after=retry_after,
                         command=message.text,
                     )
-                    if not silent and ttl > 0:
+                    if not silent and retry_after > 0:
                         await message.reply_text(
-                            f"⏳ Пожалуйста, подождите {ttl} секунд перед повторным использованием этой команды."
+                            f"⏳ Пожалуйста, подождите {retry_after} секунд перед повторным использованием этой команды."
                         )
                     return
             except Exception:
@@ -0,0 +1,187 @@
+"""Buffers outgoing messages and ships them to the backend in batches."""
+
+import asyncio
+import time
+from typing import Any
+
+import structlog
+from config import credentials
+
+from .api_client import backend_client
+from .exceptions import APIError
+
+log = structlog.get_logger(__name__)
+
+
+class MessageBatchSender:
+    """
+    Collects serialized messages and sends them to `/core/messages/save-batch`.
+
+    A batch is flushed as soon as it reaches `max_size` messages, or when the
+    oldest buffered message is older than `max_age_seconds`, whichever comes first.
+
+    When the backend pushes back (429) or is unavailable (5xx, network errors),
+    the batch is put back at the head of the buffer and sending pauses with an
+    exponential backoff. At most `max_buffered` messages are kept; beyond that
+    the oldest ones are dropped. Other rejections drop the batch.
+    """
+
+    BATCH_ENDPOINT = "/core/messages/save-batch"
+
+    def __init__(
+        self,
+        max_size: int,
+        max_age_seconds: float,
+        max_buffered: int = 10000,
+        initial_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0,
+    ):
+        self.max_size = max(1, max_size)
+        self.max_age_seconds = max_age_seconds
+        self.max_buffered = max(self.max_size, max_buffered)
+        self.initial_backoff_seconds = initial_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._buffer: list[dict[str, Any]] = []
+        self._oldest_at: float | None = None
+        self._backoff_seconds = 0.0
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+        self._flusher_task: asyncio.Task | None = None
+
+    def _ensure_flusher(self):
+        """Starts the age-based flusher on first use, inside the running loop."""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_periodically())
+
+    async def add(self, message_data: dict[str, Any]):
+        """Buffers a message, flushing immediately if the batch is full."""
+        self._ensure_flusher()
+        batch = None
+        async with self._lock:
+            if not self._buffer:
+                self._oldest_at = time.monotonic()
+            self._buffer.append(message_data)
+            self._drop_overflow()
+            if len(self._buffer) >= self.max_size and not self._backing_off():
+                batch = self._take_batch()
+        if batch:
+            await self._send(batch, reason="size")
+
+    def _backing_off(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        batch = self._buffer[: self.max_size]
+        del self._buffer[: self.max_size]
+        self._oldest_at = time.monotonic() if self._buffer else None
+        return batch
+
+    def _drop_overflow(self):
+        overflow = len(self._buffer) - self.max_buffered
+        if overflow > 0:
+            del self._buffer[:overflow]
+            log.error(
+                "Message buffer full, dropping oldest messages",
+                dropped=overflow,
+                max_buffered=self.max_buffered,
+            )
+
+    async def _requeue(self, batch: list[dict[str, Any]]):
+        self._backoff_seconds = min(
+            max(self._backoff_seconds * 2, self.initial_backoff_seconds),
+            self.max_backoff_seconds,
+        )
+        self._retry_at = time.monotonic() + self._backoff_seconds
+        async with self._lock:
+            self._buffer[:0] = batch
+            self._drop_overflow()
+            if self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+
+    async def _flush_periodically(self):
+        interval = max(self.max_age_seconds / 2, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            batch = None
+            async with self._lock:
+                if not self._backing_off() and (
+                    len(self._buffer) >= self.max_size
+                    or (
+                        self._oldest_at is not None
+                        and time.monotonic() - self._oldest_at >= self.max_age_seconds
+                    )
+                ):
+                    batch = self._take_batch()
+            if batch:
+                await self._send(batch, reason="age")
+
+    async def _send(self, batch: list[dict[str, Any]], reason: str) -> bool:
+        """
+        Sends a batch. Returns False if it was put back for a later retry.
+        """
+        try:
+            await backend_client.post(self.BATCH_ENDPOINT, json={"messages": batch})
+            self._backoff_seconds = 0.0
+            log.info(
+                "Message batch sent to backend", batch_size=len(batch), reason=reason
+            )
+        except APIError as e:
+            if e.status_code == 429 or e.status_code >= 500:
+                await self._requeue(batch)
+                log.warning(
+                    "Backend unavailable, message batch requeued",
+                    batch_size=len(batch),
+                    status_code=e.status_code,
+                    retry_in_seconds=self._backoff_seconds,
+                    correlation_id=e.correlation_id,
+                )
+                return False
+            log.error(
+                "Backend rejected message batch",
+                batch_size=len(batch),
+                status_code=e.status_code,
+                detail=e.detail,
+                correlation_id=e.correlation_id,
+            )
+        except Exception:
+            log.exception("Failed to send message batch", batch_size=len(batch))
+        return True
+
+    async def flush(self) -> bool:
+        """
+        Sends everything currently buffered, batch by batch.
+        Returns False if a batch was put back for a later retry.
+        """
+        while True:
+            async with self._lock:
+                batch = self._take_batch()
+            if not batch:
+                return True
+            if not await self._send(batch, reason="flush"):
+                return False
+
+    async def close(self, drain_attempts: int = 3):
+        """Stops the background flusher and drains the buffer."""
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        for _ in range(drain_attempts):
+            if await self.flush():
+                break
+            await asyncio.sleep(self._backoff_seconds)
+        if self._buffer:
+            log.error(
+                "Message buffer could not be drained on shutdown",
+                lost_messages=len(self._buffer),
+            )
+
+
+message_sender = MessageBatchSender(
+    max_size=credentials.message_batch_size,
+    max_age_seconds=credentials.message_batch_max_age_seconds,
+    max_buffered=credentials.message_batch_max_buffered,
+)
@@ -0,0 +1,62 @@
+from typing import NamedTuple
+
+from redis.asyncio import Redis
+
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+if not now then
+    local time = redis.call("TIME")
+    now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+end
+local interval = period / limit
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+    return {0, tostring(allow_at - now)}
+end
+redis.call("SET", KEYS[1], tostring(new_tat), "PX", math.ceil((new_tat - now) * 1000))
+return {1, "0"}
+"""
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    retry_after: float
+
+
+class RateLimiter:
+    """
+    A GCRA (token bucket) rate limiter evaluated atomically in Redis.
+
+    Each key stores a single "theoretical arrival time". A request is allowed
+    if it does not push that time more than `period_seconds` ahead of now, so
+    `limit` requests may arrive in a burst and capacity then refills evenly,
+    one request every `period_seconds / limit`. The check and the update run
+    in one Lua script, i.e. one round trip (EVALSHA), and the key always
+    carries an expiry. Time comes from the Redis server, so all bot processes
+    share one clock.
+    """
+
+    def __init__(self, client: Redis):
+        self._script = client.register_script(GCRA_SCRIPT)
+
+    async def hit(
+        self, key: str, limit: int, period_seconds: float, now: float | None = None
+    ) -> RateLimitResult:
+        """
+        Records a request for `key` if the limit allows it.
+
+        Returns whether it was allowed and, if not, the seconds until the next
+        request would be. `now` overrides the server clock (for tests).
+        """
+        if limit <= 0:
+            return RateLimitResult(False, float(period_seconds))
+        args = [limit, period_seconds] + ([] if now is None else [now])
+        allowed, retry_after = await self._script(keys=[key], args=args)
+        return RateLimitResult(bool(allowed), float(retry_after))
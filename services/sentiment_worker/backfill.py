@@ -0,0 +1,227 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+import redis.asyncio as redis
+import structlog
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from dedupe import JobDeduper
+from transport import SentimentQueue
+
+logger = structlog.get_logger(__name__)
+
+UNANALYZED_INDEX_NAME = "unanalyzed_messages_by_id"
+
+
+@dataclass
+class BackfillProgress:
+    """
+    Progress of the current backfill run, used for logs and the ETA.
+
+    `estimated_total` is the size of the whole collection, read from its
+    metadata, so the remaining count and the ETA are upper bounds.
+    """
+
+    estimated_total: int = 0
+    scanned: int = 0
+    enqueued: int = 0
+    skipped: int = 0
+    last_id: str | None = None
+    started_at: float = field(default_factory=time.monotonic)
+    finished: bool = False
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.scanned / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def remaining(self) -> int:
+        return max(self.estimated_total - self.scanned, 0)
+
+    @property
+    def eta_seconds(self) -> float | None:
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return self.remaining / rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        eta = self.eta_seconds
+        return {
+            "scanned": self.scanned,
+            "enqueued": self.enqueued,
+            "skipped": self.skipped,
+            "estimated_total": self.estimated_total,
+            "percent": (
+                round(100 * self.scanned / self.estimated_total, 2)
+                if self.estimated_total
+                else 100.0
+            ),
+            "docs_per_sec": round(self.rate, 1),
+            "eta_seconds": round(eta) if eta is not None else None,
+            "last_id": self.last_id,
+        }
+
+
+class BackfillScanner:
+    """
+    Enqueues historical messages that were never analysed.
+
+    The scan walks the collection in `_id` order from a checkpoint persisted in
+    Redis, so a restart resumes where the previous run stopped instead of
+    starting over. Unanalysed messages are served by a partial index, and the
+    text is projected in the same query, so each batch costs a single indexed
+    range read. Jobs the deduper reports as pending are skipped and the cursor
+    still advances past them. When the transport is backed up, the scanner waits
+    instead of growing the queue.
+    """
+
+    name = "backfill"
+    checkpoint_key = "sentiment_backfill_state"
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        redis_client: redis.Redis,
+        queue: SentimentQueue,
+        deduper: JobDeduper,
+        batch_size: int = 1000,
+        max_queue_depth: int = 10000,
+        progress_interval_seconds: float = 30.0,
+    ):
+        self.collection = collection
+        self.redis = redis_client
+        self.queue = queue
+        self.deduper = deduper
+        self.batch_size = batch_size
+        self.max_queue_depth = max_queue_depth
+        self.progress_interval_seconds = progress_interval_seconds
+        self.progress = BackfillProgress()
+
+    async def ensure_index(self):
+        """
+        Creates the partial index over unanalysed messages. Partial filters cannot
+        use `$exists: false`, so the filter matches `sentiment: null`, which also
+        covers documents missing the field. The `_id` key pattern cannot carry a
+        partial filter, so the index leads with `sentiment` (always null in it)
+        and then orders by `_id` for the range scan.
+        """
+        await self.collection.create_index(
+            [("sentiment", 1), ("_id", 1)],
+            name=UNANALYZED_INDEX_NAME,
+            partialFilterExpression={"sentiment": None},
+        )
+
+    def _range_filter(self, after: ObjectId | None) -> Dict[str, Any]:
+        query: Dict[str, Any] = {"sentiment": None}
+        if after is not None:
+            query["_id"] = {"$gt": after}
+        return query
+
+    def _batch_filter(self, after: ObjectId | None) -> Dict[str, Any]:
+        return {
+            **self._range_filter(after),
+            "_": "Message",
+            "chat.type": {"$ne": "ChatType.PRIVATE"},
+            "from_user.is_bot": {"$ne": True},
+            "$or": [
+                {"text": {"$nin": [None, ""]}},
+                {"caption": {"$nin": [None, ""]}},
+            ],
+        }
+
+    async def load_checkpoint(self) -> ObjectId | None:
+        last_id = await self.redis.hget(self.checkpoint_key, "last_id")
+        return ObjectId(last_id) if last_id else None
+
+    async def save_checkpoint(self, last_id: ObjectId | None):
+        if last_id is None:
+            await self.redis.hdel(self.checkpoint_key, "last_id")
+            return
+        await self.redis.hset(
+            self.checkpoint_key,
+            mapping={"last_id": str(last_id), "updated_at": int(time.time())},
+        )
+
+    projection: Tuple[str, ...] = ("_id", "text", "caption", "date", "chat.id")
+
+    async def _read_batch(self, after: ObjectId | None) -> List[Dict[str, Any]]:
+        projection = dict.fromkeys((*self.projection, *self.deduper.projection), 1)
+        cursor = (
+            self.collection.find(self._batch_filter(after), projection)
+            .sort("_id", 1)
+            .limit(self.batch_size)
+        )
+        return await cursor.to_list(length=self.batch_size)
+
+    async def _wait_for_queue_room(self, is_running: Callable[[], bool]):
+        while is_running() and await self.queue.depth() > self.max_queue_depth:
+            await asyncio.sleep(1)
+
+    async def _enqueue_new(self, docs: List[Dict[str, Any]]) -> int:
+        candidates = []
+        for doc in docs:
+            doc["text"] = doc.get("text") or doc.get("caption") or ""
+            if not doc["text"].startswith("/"):
+                candidates.append(doc)
+        new_docs = await self.deduper.claim(candidates)
+        if not new_docs:
+            return 0
+
+        await self.queue.enqueue([json.dumps(self._payload(doc)) for doc in new_docs])
+        return len(new_docs)
+
+    def _payload(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "_id": str(doc["_id"]),
+            "text": doc["text"],
+            "date": doc["date"].isoformat() if doc.get("date") else None,
+            "chat_id": doc.get("chat", {}).get("id"),
+            **{f: doc[f] for f in self.deduper.projection if f in doc},
+        }
+
+    def _log_progress(self, message: str):
+        logger.info(message, scan=self.name, **self.progress.snapshot())
+
+    async def run(self, is_running: Callable[[], bool]):
+        """Scans until the end of the collection or until `is_running` turns false."""
+        await self.ensure_index()
+        last_id = await self.load_checkpoint()
+        self.progress = BackfillProgress(
+            estimated_total=await self.collection.estimated_document_count(),
+            last_id=str(last_id) if last_id else None,
+        )
+        self._log_progress(
+            "Resuming scan from checkpoint."
+            if last_id
+            else "Starting scan from the beginning of the collection."
+        )
+
+        last_report = time.monotonic()
+        while is_running():
+            await self._wait_for_queue_room(is_running)
+            docs = await self._read_batch(last_id)
+            if not docs:
+                self.progress.finished = True
+                await self.save_checkpoint(None)
+                await self.deduper.reset()
+                self._log_progress("Scan finished.")
+                return
+
+            enqueued = await self._enqueue_new(docs)
+            last_id = docs[-1]["_id"]
+            await self.save_checkpoint(last_id)
+
+            self.progress.scanned += len(docs)
+            self.progress.enqueued += enqueued
+            self.progress.skipped += len(docs) - enqueued
+            self.progress.last_id = str(last_id)
+
+            if time.monotonic() - last_report >= self.progress_interval_seconds:
+                last_report = time.monotonic()
+                self._log_progress("Scan progress")
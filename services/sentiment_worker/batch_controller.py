@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+
+@dataclass
+class BatchDecision:
+    """One evaluation of the batch size controller."""
+
+    previous: int
+    size: int
+    action: str
+    reason: str
+    queue_depth: int
+    seconds_per_item: float | None
+    memory_headroom: float
+
+    def as_log_fields(self) -> Dict[str, Any]:
+        return {
+            "previous": self.previous,
+            "size": self.size,
+            "action": self.action,
+            "reason": self.reason,
+            "queue_depth": self.queue_depth,
+            "seconds_per_item": (
+                round(self.seconds_per_item, 6)
+                if self.seconds_per_item is not None
+                else None
+            ),
+            "memory_headroom": round(self.memory_headroom, 3),
+        }
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses how many jobs the read stage pops per batch.
+
+    Small batches keep latency low when only live traffic is flowing, large
+    batches maximise throughput while a backlog is being drained. Each decision
+    looks at the transport depth, the smoothed inference time per item and the
+    free memory fraction, and stays within [min_size, max_size]:
+
+    - memory headroom below `min_memory_headroom` halves the size;
+    - a batch projected to take longer than `target_batch_seconds` shrinks to
+      what fits in that budget;
+    - a queue shorter than the current size shrinks to the queue depth, so a
+      burst of live messages is spread over the pipeline stages instead of
+      landing in one large batch;
+    - a queue holding more than two batches grows the size by `growth`, as long
+      as the larger batch still fits the time budget.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_size: int,
+        max_size: int,
+        target_batch_seconds: float = 2.0,
+        min_memory_headroom: float = 0.15,
+        growth: float = 1.5,
+        smoothing: float = 0.3,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size = self._clamp(initial)
+        self.target_batch_seconds = target_batch_seconds
+        self.min_memory_headroom = min_memory_headroom
+        self.growth = growth
+        self.smoothing = smoothing
+        self.seconds_per_item: float | None = None
+
+    def _clamp(self, size: float) -> int:
+        return int(min(self.max_size, max(self.min_size, size)))
+
+    def observe(self, items: int, seconds: float):
+        """Feeds the time the models took for a batch of `items` texts."""
+        if items <= 0:
+            return
+        per_item = seconds / items
+        if self.seconds_per_item is None:
+            self.seconds_per_item = per_item
+        else:
+            self.seconds_per_item += self.smoothing * (per_item - self.seconds_per_item)
+
+    def _budget_size(self) -> float | None:
+        if not self.seconds_per_item:
+            return None
+        return self.target_batch_seconds / self.seconds_per_item
+
+    def decide(self, queue_depth: int, memory_headroom: float) -> BatchDecision:
+        """Updates `size` from the current observations and returns the decision."""
+        previous = self.size
+        budget = self._budget_size()
+
+        if memory_headroom < self.min_memory_headroom:
+            target, reason = previous / 2, "low_memory"
+        elif budget is not None and previous > budget:
+            target, reason = budget, "over_time_budget"
+        elif queue_depth < previous:
+            target, reason = queue_depth, "short_queue"
+        elif queue_depth > 2 * previous:
+            grown = previous * self.growth
+            if budget is not None and grown > budget:
+                target, reason = budget, "time_budget_limit"
+            else:
+                target, reason = grown, "backlog"
+        else:
+            target, reason = previous, "steady"
+
+        self.size = self._clamp(target)
+        if self.size > previous:
+            action = "grow"
+        elif self.size < previous:
+            action = "shrink"
+        else:
+            action = "hold"
+        return BatchDecision(
+            previous=previous,
+            size=self.size,
+            action=action,
+            reason=reason,
+            queue_depth=queue_depth,
+            seconds_per_item=self.seconds_per_item,
+            memory_headroom=memory_headroom,
+        )
+
+
+def system_memory_headroom() -> float:
+    """Fraction of host memory still available, from /proc/meminfo when present."""
+    try:
+        fields = dict(
+            line.split(":", 1)
+            for line in Path("/proc/meminfo").read_text().splitlines()
+        )
+        total = int(fields["MemTotal"].split()[0])
+        available = int(fields["MemAvailable"].split()[0])
+    except (OSError, KeyError, ValueError):
+        return 1.0
+    return available / total if total else 1.0
+
+
+def cuda_memory_headroom(device: Any) -> float:
+    """
+    Fraction of GPU memory usable by the next batch. Memory cached by the torch
+    allocator but not holding tensors counts as free.
+    """
+    import torch
+
+    free, total = torch.cuda.mem_get_info(device)
+    cached = torch.cuda.memory_reserved(device) - torch.cuda.memory_allocated(device)
+    return (free + cached) / total if total else 1.0
@@ -0,0 +1 @@
+"""Offline benchmarks for the sentiment worker. Run them as modules from the service directory."""
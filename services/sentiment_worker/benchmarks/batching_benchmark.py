@@ -0,0 +1,110 @@
+"""
+Compares micro-batching strategies for the sentiment worker on the synthetic chat corpus.
+
+Without --with-models it only plans batches and reports padded tokens, padding
+waste, forward passes and the largest batch (a proxy for peak activation memory).
+With --with-models it also runs ModelCoordinator with each strategy and reports docs/sec.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.batching_benchmark --docs 1024 --tokenizer <model name>
+    python -m benchmarks.batching_benchmark --docs 1024 --with-models --device cpu
+"""
+
+import argparse
+import math
+import os
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import generate_messages
+from ml.batching import bucket_by_length, padded_tokens, token_budget_batches
+
+MAX_LENGTH = 512
+
+
+def approximate_lengths(texts: List[str]) -> List[int]:
+    """Rough WordPiece length for Russian text when no tokenizer is available."""
+    return [min(MAX_LENGTH, 2 + math.ceil(len(t.split()) * 1.6)) for t in texts]
+
+
+def tokenizer_lengths(texts: List[str], model_name: str) -> List[int]:
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    encoded = tokenizer(texts, max_length=MAX_LENGTH, truncation=True)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def strategies(args) -> Dict[str, Callable[[List[int]], List[List[int]]]]:
+    return {
+        "whole popped batch": lambda lengths: [list(range(len(lengths)))],
+        f"sorted chunks of {args.rows}": lambda lengths: bucket_by_length(
+            lengths, args.rows
+        ),
+        f"token budget {args.max_tokens}": lambda lengths: token_budget_batches(
+            lengths, max_tokens=args.max_tokens, max_rows=args.rows
+        ),
+    }
+
+
+def report_plan(name: str, lengths: List[int], batches: List[List[int]]):
+    real = sum(lengths)
+    padded = padded_tokens(lengths, batches)
+    peak = max(len(b) * max(lengths[i] for i in b) for b in batches)
+    print(
+        f"{name:<28} passes={len(batches):5d} padded={padded:9d} "
+        f"waste={(padded - real) / padded:6.1%} peak_batch_tokens={peak:8d}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1024)
+    parser.add_argument("--rows", type=int, default=64)
+    parser.add_argument("--max-tokens", type=int, default=16384)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tokenizer", default=None)
+    parser.add_argument("--with-models", action="store_true")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    args = parser.parse_args()
+
+    texts = generate_messages(args.docs, seed=args.seed)
+    if args.tokenizer:
+        lengths = tokenizer_lengths(texts, args.tokenizer)
+    else:
+        lengths = approximate_lengths(texts)
+    lengths_sorted = sorted(lengths)
+    print(
+        f"docs={len(texts)} tokens={sum(lengths)} "
+        f"p50={lengths_sorted[len(lengths) // 2]} "
+        f"p95={lengths_sorted[int(len(lengths) * 0.95)]} max={lengths_sorted[-1]}"
+    )
+
+    plans = strategies(args)
+    for name, plan in plans.items():
+        report_plan(name, lengths, plan(lengths))
+
+    if not args.with_models:
+        return
+
+    from ml.coordinator import ModelCoordinator
+
+    coordinator = ModelCoordinator(
+        sentiment_model_name=args.sentiment_model,
+        topics_model_name=args.topics_model,
+        device_str=args.device,
+        inference_batch_size=args.rows,
+        max_batch_tokens=args.max_tokens,
+    )
+    for name, plan in plans.items():
+        coordinator.plan_batches = plan
+        started = time.perf_counter()
+        coordinator.analyze_batch(texts)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<28} {elapsed:8.3f}s  {len(texts) / elapsed:10.1f} docs/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Synthetic Russian group-chat corpus used by the worker benchmarks.
+
+The length mix approximates what the worker sees in practice: a large share of
+one- or two-word replies, a body of ordinary sentences, some longer messages and
+a thin tail of pasted walls of text. Everything is seeded, so runs are comparable.
+"""
+
+import random
+from typing import List
+
+SHORT_REPLIES = [
+    "ок",
+    "да",
+    "нет",
+    "+",
+    "ахах",
+    "ахахаха",
+    "лол",
+    "кек",
+    "спс",
+    "понял",
+    "жиза",
+    "база",
+    "ну да",
+    "хз",
+    "😂",
+    "🔥🔥🔥",
+    "👍",
+    "норм",
+    "согл",
+    "гг",
+]
+
+WORDS = [
+    "я",
+    "ты",
+    "он",
+    "она",
+    "мы",
+    "они",
+    "это",
+    "что",
+    "как",
+    "где",
+    "когда",
+    "почему",
+    "потому",
+    "что",
+    "просто",
+    "вообще",
+    "сегодня",
+    "вчера",
+    "завтра",
+    "опять",
+    "снова",
+    "реально",
+    "кстати",
+    "короче",
+    "блин",
+    "типа",
+    "наверное",
+    "работа",
+    "учеба",
+    "пары",
+    "сессия",
+    "препод",
+    "начальник",
+    "проект",
+    "дедлайн",
+    "отпуск",
+    "зарплата",
+    "игра",
+    "катка",
+    "сервер",
+    "патч",
+    "билд",
+    "релиз",
+    "баг",
+    "фича",
+    "код",
+    "питон",
+    "бот",
+    "чат",
+    "канал",
+    "хороший",
+    "плохой",
+    "странный",
+    "нормальный",
+    "смешной",
+    "грустный",
+    "новый",
+    "старый",
+    "быстрый",
+    "думаю",
+    "знаю",
+    "видел",
+    "слышал",
+    "написал",
+    "скинул",
+    "посмотрел",
+    "купил",
+    "сделал",
+    "пошел",
+    "кто-нибудь",
+    "может",
+    "подскажет",
+    "есть",
+    "ли",
+    "смысл",
+    "брать",
+    "или",
+    "лучше",
+    "подождать",
+    "мне",
+    "кажется",
+    "что",
+    "это",
+    "вообще",
+    "не",
+    "то",
+    "о",
+    "чем",
+    "мы",
+    "говорили",
+    "изначально",
+]
+
+EXTRAS = [
+    "https://t.me/some_channel/12345",
+    "https://youtu.be/dQw4w9WgXcQ",
+    "@not_salieri",
+    "@kurisu_bot",
+    "😂😂😂",
+    "🤡",
+    "!!!",
+    "???",
+]
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    if rng.random() < 0.15:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(EXTRAS))
+    text = " ".join(words)
+    return text[:1].upper() + text[1:]
+
+
+def generate_messages(count: int, seed: int = 42) -> List[str]:
+    """Generates `count` synthetic chat messages with a realistic length mix."""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.35:
+            messages.append(rng.choice(SHORT_REPLIES))
+        elif roll < 0.80:
+            n_words = max(3, min(40, int(rng.lognormvariate(2.2, 0.6))))
+            messages.append(_sentence(rng, n_words))
+        elif roll < 0.95:
+            messages.append(_sentence(rng, rng.randint(40, 150)))
+        else:
+            paragraphs = [
+                _sentence(rng, rng.randint(60, 200)) for _ in range(rng.randint(2, 5))
+            ]
+            messages.append("\n\n".join(paragraphs))
+    return messages
@@ -0,0 +1,143 @@
+"""
+Compares the backfill dedupe strategies at a given number of pending messages.
+
+Without --redis-url it prints the estimated Redis memory for each strategy.
+With --redis-url it fills every structure with --ids synthetic ObjectIds in
+backfill-sized batches against a real Redis, then reports claim throughput,
+MEMORY USAGE of the key and (for the Bloom filter) the observed false-positive
+rate on ids that were never added. The bitmap strategy is measured on its Redis
+side only: sequence assignment via INCRBY plus BITFIELD reads and writes.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.dedupe_benchmark --ids 10000000
+    python -m benchmarks.dedupe_benchmark --ids 10000000 --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from dedupe import BloomDeduper, SetDeduper, bloom_parameters, get_bits, set_bits
+
+SET_BYTES_PER_MEMBER = 80
+KEY_PREFIX = "dedupe_benchmark"
+
+
+def synthetic_ids(start: int, count: int) -> List[str]:
+    return [f"68a1b2c3{i:016x}" for i in range(start, start + count)]
+
+
+def human_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:8.1f} {unit}"
+        size /= 1024
+    return f"{size:8.1f} TB"
+
+
+def print_estimates(ids: int, error_rate: float):
+    bloom_bits, bloom_hashes = bloom_parameters(ids, error_rate)
+    print(f"estimated memory for {ids:,} pending messages")
+    print(f"  set     {human_bytes(ids * SET_BYTES_PER_MEMBER)}  (~80 B/member)")
+    print(f"  bitmap  {human_bytes(ids / 8)}  (1 bit/sequence)")
+    print(
+        f"  bloom   {human_bytes(bloom_bits / 8)}  "
+        f"(k={bloom_hashes}, p={error_rate}, {bloom_bits / ids:.1f} bits/member)"
+    )
+
+
+async def fill(
+    name: str,
+    ids: int,
+    batch: int,
+    claim: Callable[[int, int], Awaitable[int]],
+) -> float:
+    started = time.perf_counter()
+    claimed = 0
+    for offset in range(0, ids, batch):
+        claimed += await claim(offset, min(batch, ids - offset))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<7} claimed={claimed:,} in {elapsed:7.1f}s "
+        f"({ids / elapsed:10.0f} ids/sec)"
+    )
+    return elapsed
+
+
+async def run_redis(args):
+    import redis.asyncio as redis
+
+    client = redis.from_url(args.redis_url, decode_responses=True)
+    keys = {
+        "set": f"{KEY_PREFIX}:set",
+        "bitmap": f"{KEY_PREFIX}:bitmap",
+        "seq": f"{KEY_PREFIX}:seq",
+        "bloom": f"{KEY_PREFIX}:bloom",
+    }
+    await client.delete(*keys.values())
+
+    set_deduper = SetDeduper(client, keys["set"])
+    bloom = BloomDeduper(client, keys["bloom"], args.ids, args.error_rate)
+
+    async def claim_set(offset: int, count: int) -> int:
+        docs = [{"_id": i} for i in synthetic_ids(offset, count)]
+        return len(await set_deduper.claim(docs))
+
+    async def claim_bitmap(offset: int, count: int) -> int:
+        last = await client.incrby(keys["seq"], count)
+        seqs = list(range(last - count + 1, last + 1))
+        bits = await get_bits(client, keys["bitmap"], seqs)
+        new = [seq for seq, bit in zip(seqs, bits) if not bit]
+        await set_bits(client, keys["bitmap"], new)
+        return len(new)
+
+    async def claim_bloom(offset: int, count: int) -> int:
+        docs = [{"_id": i} for i in synthetic_ids(offset, count)]
+        return len(await bloom.claim(docs))
+
+    await fill("set", args.ids, args.batch, claim_set)
+    await fill("bitmap", args.ids, args.batch, claim_bitmap)
+    await fill("bloom", args.ids, args.batch, claim_bloom)
+
+    for name in ("set", "bitmap", "bloom"):
+        usage = await client.memory_usage(keys[name], samples=0)
+        print(f"{name:<7} MEMORY USAGE {human_bytes(usage or 0)}")
+
+    probes = synthetic_ids(args.ids, args.probes)
+    false_positives = 0
+    for offset in range(0, len(probes), args.batch):
+        chunk = probes[offset : offset + args.batch]
+        offsets = [o for message_id in chunk for o in bloom.offsets(message_id)]
+        bits = await get_bits(client, keys["bloom"], offsets)
+        false_positives += sum(
+            all(bits[i * bloom.hashes : (i + 1) * bloom.hashes])
+            for i in range(len(chunk))
+        )
+    print(
+        f"bloom   false positives {false_positives}/{len(probes)} "
+        f"({false_positives / len(probes):.4%}, target {args.error_rate:.4%})"
+    )
+
+    if not args.keep:
+        await client.delete(*keys.values())
+    await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    parser.add_argument("--probes", type=int, default=100_000)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    print_estimates(args.ids, args.error_rate)
+    if args.redis_url:
+        asyncio.run(run_redis(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures how much traffic the rule-based fast path takes off the models and how
+well it agrees with them.
+
+Reports the skip ratio (share of texts the fast path labels), its throughput,
+and, on the texts it labels, how often its label matches the full sentiment
+model's top label, broken down per fast-path label. With `--labelled`, a JSON
+lines file of {"text": ..., "label": ...} records, the accuracy of both the fast
+path and the model on those texts is reported as well; without it the synthetic
+corpus is used.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.fast_path_benchmark --docs 4096
+    python -m benchmarks.fast_path_benchmark --labelled validation.jsonl
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+
+from benchmarks.corpus import generate_messages
+from benchmarks.preprocessing_benchmark import load_labelled, top_label
+from ml.coordinator import ModelCoordinator
+from ml.fast_path import FastPathClassifier
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--labelled")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    args = parser.parse_args()
+
+    if args.labelled:
+        texts, labels = load_labelled(args.labelled)
+    else:
+        texts, labels = generate_messages(args.docs, seed=args.seed), None
+
+    classifier = FastPathClassifier()
+    started = time.perf_counter()
+    fast_labels = classifier(texts)
+    elapsed = time.perf_counter() - started
+    handled = [i for i, label in enumerate(fast_labels) if label is not None]
+    print(
+        f"fast path {elapsed * 1000:8.1f}ms  {len(texts) / elapsed:10.0f} docs/sec  "
+        f"skip_ratio={len(handled) / len(texts):6.2%} ({len(handled)}/{len(texts)})"
+    )
+    if not handled:
+        return
+
+    coordinator = ModelCoordinator(
+        sentiment_model_name=args.sentiment_model,
+        topics_model_name=args.topics_model,
+        device_str=args.device,
+    )
+    model_labels = [
+        top_label(result["sentiment"])
+        for result in coordinator.analyze_batch([texts[i] for i in handled])
+    ]
+
+    totals, agreed = Counter(), Counter()
+    for i, model_label in zip(handled, model_labels):
+        totals[fast_labels[i]] += 1
+        agreed[fast_labels[i]] += fast_labels[i] == model_label
+    for label in sorted(totals):
+        print(
+            f"  {label:<11} texts={totals[label]:6d} "
+            f"model_agreement={agreed[label] / totals[label]:6.2%}"
+        )
+    print(f"model_agreement={sum(agreed.values()) / len(handled):6.2%}")
+
+    if labels is not None:
+        fast_correct = sum(fast_labels[i] == labels[i] for i in handled)
+        model_correct = sum(
+            label == labels[i] for i, label in zip(handled, model_labels)
+        )
+        print(
+            f"on fast-path texts: fast_path_accuracy={fast_correct / len(handled):6.2%} "
+            f"model_accuracy={model_correct / len(handled):6.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compares the PyTorch, ONNX Runtime fp32 and ONNX Runtime int8 inference backends
+on the synthetic chat corpus.
+
+For every backend it reports docs/sec for ModelCoordinator.analyze_batch, and for
+the ONNX backends how far the results drift from PyTorch: the largest sentiment
+probability difference, how often the top sentiment label agrees and how often
+the set of detected sensitive topics is identical.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.onnx_benchmark --docs 1024 --threads 4
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Dict, List
+
+from benchmarks.corpus import generate_messages
+from ml.backends import BackendConfig
+from ml.coordinator import ModelCoordinator
+
+
+def top_label(scores: Dict[str, float]) -> str:
+    return max(scores, key=scores.get)
+
+
+def compare(reference: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> str:
+    max_diff = 0.0
+    same_label = 0
+    same_topics = 0
+    for expected, actual in zip(reference, results):
+        for label, score in expected["sentiment"].items():
+            max_diff = max(max_diff, abs(score - actual["sentiment"][label]))
+        same_label += top_label(expected["sentiment"]) == top_label(actual["sentiment"])
+        same_topics += set(expected["sensitive_topics"]) == set(
+            actual["sensitive_topics"]
+        )
+    return (
+        f"max_sentiment_diff={max_diff:.4f} "
+        f"label_agreement={same_label / len(reference):6.2%} "
+        f"topics_agreement={same_topics / len(reference):6.2%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rows", type=int, default=64)
+    parser.add_argument("--max-tokens", type=int, default=16384)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--onnx-dir", default="/tmp/kurisu-onnx-benchmark")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    args = parser.parse_args()
+
+    if args.threads > 0:
+        import torch
+
+        torch.set_num_threads(args.threads)
+
+    texts = generate_messages(args.docs, seed=args.seed)
+    backends = {
+        "torch cpu": BackendConfig(kind="torch"),
+        "onnx fp32": BackendConfig(
+            kind="onnx",
+            onnx_dir=args.onnx_dir,
+            quantize=False,
+            num_threads=args.threads,
+        ),
+        "onnx int8": BackendConfig(
+            kind="onnx", onnx_dir=args.onnx_dir, quantize=True, num_threads=args.threads
+        ),
+    }
+
+    reference = None
+    for name, config in backends.items():
+        coordinator = ModelCoordinator(
+            sentiment_model_name=args.sentiment_model,
+            topics_model_name=args.topics_model,
+            device_str="cpu",
+            inference_batch_size=args.rows,
+            max_batch_tokens=args.max_tokens,
+            backend_config=config,
+        )
+        coordinator.analyze_batch(texts[: args.rows])
+        started = time.perf_counter()
+        results = coordinator.analyze_batch(texts)
+        elapsed = time.perf_counter() - started
+
+        line = f"{name:<10} {elapsed:8.3f}s  {len(texts) / elapsed:10.1f} docs/sec"
+        if reference is None:
+            reference = results
+        else:
+            line += "  " + compare(reference, results)
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measures what TextPreprocessor saves before tokenization and whether it changes
+the sentiment labels.
+
+Token statistics compare the sentiment tokenizer's untruncated token counts on
+the raw and on the preprocessed texts (total, mean, p95, max and how many texts
+exceed the model's max length), plus how many texts are dropped outright.
+
+The parity check runs ModelCoordinator with and without the preprocessor and
+reports how often the top sentiment label agrees. With `--labelled`, a JSON
+lines file of {"text": ..., "label": ...} records (e.g. exported from messages
+with a reviewed sentiment), the accuracy of both runs is reported as well;
+without it the synthetic corpus is used and only agreement is reported.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.preprocessing_benchmark --docs 2048
+    python -m benchmarks.preprocessing_benchmark --labelled sample.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List
+
+from transformers import AutoTokenizer
+
+from benchmarks.corpus import generate_messages
+from ml.coordinator import ModelCoordinator
+from ml.preprocessing import TextPreprocessor
+from ml.sentiment import SentimentModel
+
+
+def top_label(scores: Dict[str, float]) -> str:
+    return max(scores, key=scores.get)
+
+
+def load_labelled(path: str) -> tuple[List[str], List[str]]:
+    texts, labels = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                texts.append(record["text"])
+                labels.append(record["label"])
+    return texts, labels
+
+
+def token_stats(tokenizer, texts: List[str], max_length: int) -> str:
+    if not texts:
+        return "no texts"
+    lengths = sorted(len(ids) for ids in tokenizer(texts)["input_ids"])
+    p95 = lengths[min(len(lengths) - 1, int(len(lengths) * 0.95))]
+    over = sum(length > max_length for length in lengths)
+    return (
+        f"texts={len(lengths):6d} tokens={sum(lengths):9d} "
+        f"mean={sum(lengths) / len(lengths):7.1f} p95={p95:5d} "
+        f"max={lengths[-1]:6d} over_{max_length}={over}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2048)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--labelled")
+    parser.add_argument("--max-chars", type=int, default=1000)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--skip-parity", action="store_true")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    args = parser.parse_args()
+
+    if args.labelled:
+        texts, labels = load_labelled(args.labelled)
+    else:
+        texts, labels = generate_messages(args.docs, seed=args.seed), None
+
+    preprocessor = TextPreprocessor(max_chars=args.max_chars)
+    started = time.perf_counter()
+    cleaned = preprocessor(texts)
+    elapsed = time.perf_counter() - started
+    kept = [text for text in cleaned if text is not None]
+    print(
+        f"preprocess {elapsed * 1000:8.1f}ms  {len(texts) / elapsed:10.0f} docs/sec  "
+        f"dropped={len(texts) - len(kept)}"
+    )
+
+    tokenizer = AutoTokenizer.from_pretrained(args.sentiment_model, use_fast=True)
+    print("raw          ", token_stats(tokenizer, texts, SentimentModel.max_length))
+    print("preprocessed ", token_stats(tokenizer, kept, SentimentModel.max_length))
+
+    if args.skip_parity:
+        return
+
+    runs = {}
+    for name, processor in (("raw", None), ("preprocessed", preprocessor)):
+        coordinator = ModelCoordinator(
+            sentiment_model_name=args.sentiment_model,
+            topics_model_name=args.topics_model,
+            device_str=args.device,
+            preprocessor=processor,
+        )
+        started = time.perf_counter()
+        results = coordinator.analyze_batch(texts)
+        elapsed = time.perf_counter() - started
+        runs[name] = [top_label(result["sentiment"]) for result in results]
+        line = f"{name:<13} {elapsed:8.3f}s  {len(texts) / elapsed:10.1f} docs/sec"
+        if labels is not None:
+            correct = sum(p == e for p, e in zip(runs[name], labels))
+            line += f"  accuracy={correct / len(labels):6.2%}"
+        print(line)
+
+    agree = sum(a == b for a, b in zip(runs["raw"], runs["preprocessed"]))
+    print(f"label_agreement={agree / len(texts):6.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures how sentiment worker throughput scales with the number of inference processes.
+
+For every process count the synthetic corpus is split into worker-sized batches
+that are all submitted to an InferencePool at once, the same way the worker keeps
+one batch in flight per process. Torch threads are split evenly between the
+processes unless --torch-threads is given.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.scaling_benchmark --docs 4096 --processes 1 2 4 8
+    python -m benchmarks.scaling_benchmark --backend onnx --share-weights
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from functools import partial
+
+from benchmarks.corpus import generate_messages
+from inference_pool import InferencePool
+from ml.backends import BackendConfig
+from ml.coordinator import ModelCoordinator
+
+
+async def run_batches(pool: InferencePool, batches):
+    return await asyncio.gather(*(pool.analyze(batch) for batch in batches))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=4096)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--torch-threads", type=int, default=0)
+    parser.add_argument("--share-weights", action="store_true")
+    parser.add_argument("--backend", choices=["torch", "onnx"], default="torch")
+    parser.add_argument("--onnx-dir", default="/tmp/kurisu-onnx-benchmark")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    args = parser.parse_args()
+
+    texts = generate_messages(args.docs, seed=args.seed)
+    batches = [texts[i : i + args.batch] for i in range(0, len(texts), args.batch)]
+    factory = partial(
+        ModelCoordinator,
+        sentiment_model_name=args.sentiment_model,
+        topics_model_name=args.topics_model,
+        device_str="cpu",
+        backend_config=BackendConfig(kind=args.backend, onnx_dir=args.onnx_dir),
+    )
+
+    print(f"docs={len(texts)} batches={len(batches)} cpus={os.cpu_count()}")
+    baseline = None
+    for processes in args.processes:
+        pool = InferencePool(
+            factory,
+            processes=processes,
+            torch_threads=args.torch_threads,
+            share_weights=args.share_weights and args.backend == "torch",
+        )
+        asyncio.run(run_batches(pool, batches[:processes]))
+        started = time.perf_counter()
+        asyncio.run(run_batches(pool, batches))
+        elapsed = time.perf_counter() - started
+        pool.shutdown()
+
+        throughput = len(texts) / elapsed
+        baseline = baseline or throughput
+        print(
+            f"processes={processes:2d} torch_threads={pool.torch_threads:3d} "
+            f"{elapsed:8.3f}s {throughput:10.1f} docs/sec "
+            f"speedup={throughput / baseline:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
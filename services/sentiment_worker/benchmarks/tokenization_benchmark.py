@@ -0,0 +1,117 @@
+"""
+Compares the legacy "each model tokenizes for itself" path with the shared,
+length-bucketed tokenization in ModelCoordinator.
+
+Usage (from services/sentiment_worker):
+    python -m benchmarks.tokenization_benchmark --docs 2000 --device cpu
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, List
+
+from benchmarks.corpus import generate_messages
+from ml.coordinator import ModelCoordinator
+
+
+def _time(label: str, fn: Callable[[], object], docs: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<44} {best:8.3f}s  {docs / best:10.1f} docs/sec")
+    return best
+
+
+def _legacy_tokenize(coordinator: ModelCoordinator, texts: List[str], batch: int):
+    for i in range(0, len(texts), batch):
+        chunk = texts[i : i + batch]
+        coordinator.sentiment_model.tokenizer(
+            chunk, max_length=512, padding=True, truncation=True, return_tensors="pt"
+        )
+        coordinator.topics_model.tokenizer(
+            chunk, max_length=256, padding=True, truncation=True, return_tensors="pt"
+        )
+
+
+def _shared_tokenize(coordinator: ModelCoordinator, texts: List[str]):
+    sentiment_ids, topics_ids = coordinator.tokenize(texts)
+    for bucket in coordinator.plan_batches([len(ids) for ids in sentiment_ids]):
+        coordinator._pad(
+            coordinator.sentiment_model.tokenizer, [sentiment_ids[i] for i in bucket]
+        )
+        coordinator._pad(
+            coordinator.topics_model.tokenizer, [topics_ids[i] for i in bucket]
+        )
+
+
+def _legacy_analyze(coordinator: ModelCoordinator, texts: List[str], batch: int):
+    for i in range(0, len(texts), batch):
+        chunk = texts[i : i + batch]
+        coordinator.sentiment_model.predict(chunk)
+        coordinator.topics_model.predict(chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--sentiment-model", default=os.getenv("SENTIMENT_MODEL"))
+    parser.add_argument("--topics-model", default=os.getenv("SENSITIVE_TOPICS_MODEL"))
+    parser.add_argument(
+        "--skip-inference",
+        action="store_true",
+        help="Only measure tokenization and padding.",
+    )
+    args = parser.parse_args()
+
+    coordinator = ModelCoordinator(
+        sentiment_model_name=args.sentiment_model,
+        topics_model_name=args.topics_model,
+        device_str=args.device,
+        inference_batch_size=args.batch_size,
+    )
+    texts = generate_messages(args.docs)
+    print(
+        f"docs={args.docs} batch_size={args.batch_size} device={coordinator.device} "
+        f"shared_tokenizer={coordinator.shared_tokenizer is not None}"
+    )
+
+    before = _time(
+        "tokenize: per-model, fixed chunks",
+        lambda: _legacy_tokenize(coordinator, texts, args.batch_size),
+        args.docs,
+        args.repeat,
+    )
+    after = _time(
+        "tokenize: shared, length-bucketed",
+        lambda: _shared_tokenize(coordinator, texts),
+        args.docs,
+        args.repeat,
+    )
+    print(f"tokenization speedup: x{before / after:.2f}")
+
+    if args.skip_inference:
+        return
+
+    before = _time(
+        "end-to-end: per-model, fixed chunks",
+        lambda: _legacy_analyze(coordinator, texts, args.batch_size),
+        args.docs,
+        args.repeat,
+    )
+    after = _time(
+        "end-to-end: ModelCoordinator.analyze_batch",
+        lambda: coordinator.analyze_batch(texts),
+        args.docs,
+        args.repeat,
+    )
+    print(f"end-to-end speedup: x{before / after:.2f}")
+
+
+if __name__ == "__main__":
+    main()
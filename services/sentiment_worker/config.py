@@ -1,3 +1,6 @@
+import socket
+from typing import List, Literal
+
 from pydantic import Field, MongoDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,7 +18,119 @@ class WorkerConfig(BaseSettings):
     sensitive_topics_model: str = Field(alias="SENSITIVE_TOPICS_MODEL")
 
     batch_size: int = Field(default=64, alias="SENTIMENT_BATCH_SIZE")
+    adaptive_batch_size: bool = Field(default=False, alias="SENTIMENT_ADAPTIVE_BATCH")
+    batch_size_min: int = Field(default=16, alias="SENTIMENT_BATCH_MIN")
+    batch_size_max: int = Field(default=2048, alias="SENTIMENT_BATCH_MAX")
+    target_batch_seconds: float = Field(
+        default=2.0, alias="SENTIMENT_TARGET_BATCH_SECONDS"
+    )
+    min_memory_headroom: float = Field(
+        default=0.15, alias="SENTIMENT_MIN_MEMORY_HEADROOM"
+    )
+    batch_controller_interval_seconds: float = Field(
+        default=10.0, alias="SENTIMENT_BATCH_CONTROLLER_INTERVAL"
+    )
+    model_version: str | None = Field(default=None, alias="SENTIMENT_MODEL_VERSION")
     model_device: str = Field(default="gpu", alias="SENTIMENT_MODEL_DEVICE")
+    inference_backend: Literal["torch", "onnx"] = Field(
+        default="torch", alias="SENTIMENT_INFERENCE_BACKEND"
+    )
+    onnx_dir: str = Field(default="/opt/kurisu/cache/onnx", alias="SENTIMENT_ONNX_DIR")
+    onnx_quantize: bool = Field(default=True, alias="SENTIMENT_ONNX_QUANTIZE")
+    onnx_threads: int = Field(default=0, alias="SENTIMENT_ONNX_THREADS")
+    weights_dir: str = Field(
+        default="/opt/kurisu/cache/weights", alias="SENTIMENT_WEIGHTS_DIR"
+    )
+    mmap_weights: bool = Field(default=False, alias="SENTIMENT_MMAP_WEIGHTS")
+    partial_startup: bool = Field(default=False, alias="SENTIMENT_PARTIAL_STARTUP")
+    inference_processes: int = Field(default=1, alias="SENTIMENT_INFERENCE_PROCESSES")
+    torch_threads: int = Field(default=0, alias="SENTIMENT_TORCH_THREADS")
+    share_weights: bool = Field(default=False, alias="SENTIMENT_SHARE_WEIGHTS")
+    inference_batch_size: int = Field(
+        default=64, alias="SENTIMENT_INFERENCE_BATCH_SIZE"
+    )
+    max_batch_tokens: int = Field(default=16384, alias="SENTIMENT_MAX_BATCH_TOKENS")
+    bucket_boundaries: List[int] = Field(
+        default=[16, 32, 64, 128, 256, 512], alias="SENTIMENT_BUCKET_BOUNDARIES"
+    )
+    fast_path_enabled: bool = Field(default=False, alias="SENTIMENT_FAST_PATH")
+    preprocess_enabled: bool = Field(default=False, alias="SENTIMENT_PREPROCESS")
+    preprocess_max_chars: int = Field(
+        default=1000, alias="SENTIMENT_PREPROCESS_MAX_CHARS"
+    )
+
+    cache_enabled: bool = Field(default=True, alias="SENTIMENT_CACHE_ENABLED")
+    cache_max_entries: int = Field(default=100_000, alias="SENTIMENT_CACHE_MAX_ENTRIES")
+    cache_max_text_length: int = Field(
+        default=256, alias="SENTIMENT_CACHE_MAX_TEXT_LENGTH"
+    )
+    cache_redis_enabled: bool = Field(default=False, alias="SENTIMENT_CACHE_REDIS")
+    cache_redis_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, alias="SENTIMENT_CACHE_REDIS_TTL_SECONDS"
+    )
+
+    rollups_enabled: bool = Field(default=True, alias="SENTIMENT_ROLLUPS_ENABLED")
+    rollup_marker_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, alias="SENTIMENT_ROLLUP_MARKER_TTL_SECONDS"
+    )
+
+    pipeline_prefetch_batches: int = Field(
+        default=2, alias="SENTIMENT_PIPELINE_PREFETCH_BATCHES"
+    )
+    pipeline_stats_interval_seconds: float = Field(
+        default=60.0, alias="SENTIMENT_PIPELINE_STATS_INTERVAL"
+    )
+
+    dedupe_strategy: Literal["set", "bitmap", "bloom"] = Field(
+        default="set", alias="SENTIMENT_DEDUPE_STRATEGY"
+    )
+    dedupe_bloom_capacity: int = Field(
+        default=10_000_000, alias="SENTIMENT_DEDUPE_BLOOM_CAPACITY"
+    )
+    dedupe_bloom_error_rate: float = Field(
+        default=0.001, alias="SENTIMENT_DEDUPE_BLOOM_ERROR_RATE"
+    )
+
+    backfill_share: float = Field(default=0.1, alias="SENTIMENT_BACKFILL_SHARE")
+    backfill_batch_size: int = Field(
+        default=1000, alias="SENTIMENT_BACKFILL_BATCH_SIZE"
+    )
+    backfill_max_queue_depth: int = Field(
+        default=10000, alias="SENTIMENT_BACKFILL_MAX_QUEUE_DEPTH"
+    )
+    backfill_progress_interval_seconds: float = Field(
+        default=30.0, alias="SENTIMENT_BACKFILL_PROGRESS_INTERVAL"
+    )
+
+    reprocess_enabled: bool = Field(default=False, alias="SENTIMENT_REPROCESS")
+    reprocess_rate_per_second: float = Field(
+        default=50.0, alias="SENTIMENT_REPROCESS_RATE"
+    )
+    reprocess_batch_size: int = Field(
+        default=200, alias="SENTIMENT_REPROCESS_BATCH_SIZE"
+    )
+    reprocess_max_queue_depth: int = Field(
+        default=1000, alias="SENTIMENT_REPROCESS_MAX_QUEUE_DEPTH"
+    )
+
+    metrics_port: int = Field(default=9102, alias="SENTIMENT_METRICS_PORT")
+    metrics_sample_interval_seconds: float = Field(
+        default=5.0, alias="SENTIMENT_METRICS_SAMPLE_INTERVAL"
+    )
+
+    queue_transport: Literal["list", "stream"] = Field(
+        default="list", alias="SENTIMENT_QUEUE_TRANSPORT"
+    )
+    stream_consumer_name: str = Field(
+        default_factory=socket.gethostname, alias="SENTIMENT_STREAM_CONSUMER"
+    )
+    stream_block_ms: int = Field(default=5000, alias="SENTIMENT_STREAM_BLOCK_MS")
+    stream_claim_idle_ms: int = Field(
+        default=60000, alias="SENTIMENT_STREAM_CLAIM_IDLE_MS"
+    )
+    stream_max_deliveries: int = Field(
+        default=5, alias="SENTIMENT_STREAM_MAX_DELIVERIES"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,159 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Tuple
+
+import structlog
+
+from ml.coordinator import ModelCoordinator
+
+logger = structlog.get_logger(__name__)
+
+CoordinatorFactory = Callable[[], ModelCoordinator]
+
+_process_coordinator: ModelCoordinator | None = None
+
+
+def default_torch_threads(processes: int) -> int:
+    """Splits the host's cores evenly between inference processes."""
+    return max(1, (os.cpu_count() or 1) // processes)
+
+
+def _init_process(factory: CoordinatorFactory | None, torch_threads: int):
+    import torch
+
+    global _process_coordinator
+    torch.set_num_threads(torch_threads)
+    if factory is not None:
+        _process_coordinator = factory()
+    logger.info(
+        "Inference process ready.",
+        pid=os.getpid(),
+        torch_threads=torch_threads,
+        inherited_weights=factory is None,
+    )
+
+
+def _analyze_in_process(
+    texts: List[str],
+) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    return _process_coordinator.analyze_batch_timed(texts)
+
+
+class InferencePool:
+    """
+    Runs `ModelCoordinator.analyze_batch` off the event loop.
+
+    With one process the models live in the worker itself and run in a single
+    thread, as before. With more, a supervisor pool of inference processes is
+    started and batches are spread across it; reading, writing to Mongo and
+    acknowledging stay in the parent, so there is still exactly one writer.
+
+    Each process either loads its own copy of the models (spawn), or, with
+    `share_weights`, inherits the copy loaded in the parent through fork so the
+    weight pages are shared copy-on-write. Only use sharing with the torch
+    backend; ONNX Runtime sessions are not fork-safe. The parent waits for its
+    models to finish loading before forking, since the loader threads would not
+    survive the fork.
+
+    If an inference process dies (e.g. killed for memory), the pool is broken
+    for every batch in flight. It is then replaced by a fresh pool and each of
+    those batches is retried once; a batch that breaks the new pool too fails.
+    """
+
+    def __init__(
+        self,
+        factory: CoordinatorFactory,
+        processes: int = 1,
+        torch_threads: int = 0,
+        share_weights: bool = False,
+    ):
+        global _process_coordinator
+        self.processes = max(1, processes)
+        self.torch_threads = torch_threads or default_torch_threads(self.processes)
+        self.coordinator: ModelCoordinator | None = None
+        self.executor: Executor
+
+        if self.processes == 1:
+            if torch_threads > 0:
+                import torch
+
+                torch.set_num_threads(torch_threads)
+            self.coordinator = factory()
+            self.executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="inference"
+            )
+            return
+
+        if share_weights:
+            _process_coordinator = factory()
+            _process_coordinator.wait_until_loaded()
+            self._context = multiprocessing.get_context("fork")
+            self._initargs = (None, self.torch_threads)
+        else:
+            self._context = multiprocessing.get_context("spawn")
+            self._initargs = (factory, self.torch_threads)
+
+        self.restarts = 0
+        self.executor = self._start_pool()
+        logger.info(
+            "Inference process pool started.",
+            processes=self.processes,
+            torch_threads=self.torch_threads,
+            share_weights=share_weights,
+        )
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=self._context,
+            initializer=_init_process,
+            initargs=self._initargs,
+        )
+
+    def _restart_pool(self, broken: Executor):
+        """Replaces `broken`, unless a concurrent batch already did."""
+        if self.executor is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.executor = self._start_pool()
+        self.restarts += 1
+        logger.error(
+            "Inference process died, restarted the pool.",
+            processes=self.processes,
+            restarts=self.restarts,
+        )
+
+    async def _analyze_in_pool(
+        self, texts: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, _analyze_in_process, texts)
+        except BrokenProcessPool:
+            self._restart_pool(executor)
+            raise
+
+    async def analyze(
+        self, texts: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """Returns the results and the per-step timings of the batch."""
+        if self.coordinator is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, self.coordinator.analyze_batch_timed, texts
+            )
+        try:
+            return await self._analyze_in_pool(texts)
+        except BrokenProcessPool:
+            logger.warning(
+                "Retrying batch on the restarted inference pool.",
+                batch_size=len(texts),
+            )
+            return await self._analyze_in_pool(texts)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
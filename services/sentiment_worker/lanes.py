@@ -0,0 +1,91 @@
+import math
+from typing import Dict, List
+
+from transport import QueueEntry, SentimentQueue
+
+LIVE = "live"
+BACKFILL = "backfill"
+REPROCESS = "reprocess"
+
+
+class PriorityLanes:
+    """
+    Serves sentiment jobs from a live lane and a backfill lane as one queue.
+
+    Fresh messages pushed by the backend go to the live lane; the historical
+    backfill has its own lane, so a large backlog never sits in front of new
+    messages. Each batch is filled from the live lane first, while
+    `backfill_share` of the batch is reserved for backfill so it keeps moving
+    even under sustained live traffic. Slots one lane cannot fill are handed to
+    the other, so backfill uses all spare capacity and live traffic can take the
+    whole batch when there is no backlog. When both lanes are empty the read
+    waits on the live lane.
+
+    An optional `reprocess` lane carries re-analysis of messages scored by an
+    older model version. It has no reserved share and only fills the slots left
+    over by the other two lanes.
+    """
+
+    def __init__(
+        self,
+        live: SentimentQueue,
+        backfill: SentimentQueue,
+        backfill_share: float = 0.1,
+        reprocess: SentimentQueue | None = None,
+    ):
+        self.lanes: Dict[str, SentimentQueue] = {LIVE: live, BACKFILL: backfill}
+        if reprocess is not None:
+            self.lanes[REPROCESS] = reprocess
+        self.backfill_share = backfill_share
+
+    @property
+    def live(self) -> SentimentQueue:
+        return self.lanes[LIVE]
+
+    @property
+    def backfill(self) -> SentimentQueue:
+        return self.lanes[BACKFILL]
+
+    @property
+    def reprocess(self) -> SentimentQueue | None:
+        return self.lanes.get(REPROCESS)
+
+    async def setup(self) -> None:
+        for lane in self.lanes.values():
+            await lane.setup()
+
+    async def enqueue(self, payloads: List[str]) -> None:
+        await self.live.enqueue(payloads)
+
+    async def _read_lane(self, name: str, count: int, wait: bool) -> List[QueueEntry]:
+        if count <= 0 or name not in self.lanes:
+            return []
+        entries = await self.lanes[name].read(count, wait=wait)
+        for entry in entries:
+            entry.lane = name
+        return entries
+
+    async def read(self, count: int, wait: bool = True) -> List[QueueEntry]:
+        reserved = min(count - 1, math.ceil(count * self.backfill_share))
+        entries = await self._read_lane(LIVE, count - reserved, wait=False)
+        entries += await self._read_lane(BACKFILL, count - len(entries), wait=False)
+        entries += await self._read_lane(LIVE, count - len(entries), wait=False)
+        entries += await self._read_lane(REPROCESS, count - len(entries), wait=False)
+        if entries or not wait:
+            return entries
+        return await self._read_lane(LIVE, count, wait=True)
+
+    async def ack(self, entries: List[QueueEntry]) -> None:
+        for name, lane in self.lanes.items():
+            lane_entries = [entry for entry in entries if entry.lane == name]
+            if lane_entries:
+                await lane.ack(lane_entries)
+
+    async def release(self, entries: List[QueueEntry]) -> None:
+        for name, lane in self.lanes.items():
+            lane_entries = [entry for entry in entries if entry.lane == name]
+            if lane_entries:
+                await lane.release(lane_entries)
+
+    async def depth(self) -> int:
+        return sum([await lane.depth() for lane in self.lanes.values()])
@@ -1,15 +1,42 @@
 import asyncio
 import json
-from typing import List
+import signal
+import time
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Dict, List
 import structlog
+from backfill import BackfillScanner
+from batch_controller import (
+    AdaptiveBatchSizer,
+    cuda_memory_headroom,
+    system_memory_headroom,
+)
 from bson import ObjectId
 from config import settings
+from dedupe import JobDeduper, create_deduper
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import UpdateOne
 import redis.asyncio as redis
 from kurisu_core.logging_config import setup_structlog
 from kurisu_core.tracing import setup_tracing
+from inference_pool import InferencePool
+from ml.backends import BackendConfig
 from ml.coordinator import ModelCoordinator
+from ml.fast_path import FastPathClassifier
+from ml.preprocessing import TextPreprocessor
+import metrics
+from lanes import PriorityLanes
+from pipeline import StagePipeline, WorkBatch
+from rollups import (
+    build_rollup_markers,
+    build_rollup_updates,
+    ensure_rollup_indexes,
+    parse_job_date,
+)
+from reprocess import ReprocessScanner
+from result_cache import ResultCache, cache_namespace, text_key
+from transport import ListQueue, QueueEntry, SentimentQueue, StreamQueue
 
 setup_structlog(json_logs=settings.json_logs)
 setup_tracing(service_name=settings.service_name)
@@ -20,23 +47,102 @@ class SentimentWorker:
     """
     Worker that consumes message data from a Redis queue, performs sentiment
     and topic analysis, and updates the results in MongoDB.
-    On startup, it launches a background task to find and enqueue any
-    previously unanalyzed messages from the database, using a Redis Set for deduplication.
+    Reading, inference and writing run as separate stages connected by bounded
+    queues, so the next batch is fetched and the previous one written while the
+    models are busy. Inference can be spread over several processes (see
+    `InferencePool`) while a single write stage keeps Mongo updates in one place.
+    On startup, it launches a resumable background scan (see `BackfillScanner`)
+    that enqueues previously unanalyzed messages into a separate backfill lane,
+    so fresh messages are always read first (see `PriorityLanes`). Every result
+    records the model version; with reprocessing enabled, messages analysed by
+    an older version are re-enqueued at a throttled rate whenever live traffic
+    is idle (see `ReprocessScanner`).
     """
 
     def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_batch_written = False
         self.redis_client = None
         self.mongo_client = None
         self.messages_collection = None
-        self.model_coordinator = ModelCoordinator(
-            sentiment_model_name=settings.sentiment_model,
-            topics_model_name=settings.sensitive_topics_model,
-            device_str=settings.model_device,
+        self.rollups_collection = None
+        self.rollup_markers_collection = None
+        self.inference = InferencePool(
+            self._coordinator_factory(),
+            processes=settings.inference_processes,
+            torch_threads=settings.torch_threads,
+            share_weights=self._can_share_weights(),
+        )
+        self.batch_sizer = AdaptiveBatchSizer(
+            initial=settings.batch_size,
+            min_size=settings.batch_size_min,
+            max_size=settings.batch_size_max,
+            target_batch_seconds=settings.target_batch_seconds,
+            min_memory_headroom=settings.min_memory_headroom,
         )
         self.queue_name = "sentiment_analysis_queue"
+        self.stream_name = "sentiment_analysis_stream"
+        self.stream_group = "sentiment_workers"
+        self.backfill_queue_name = "sentiment_backfill_queue"
+        self.backfill_stream_name = "sentiment_backfill_stream"
+        self.reprocess_queue_name = "sentiment_reprocess_queue"
+        self.reprocess_stream_name = "sentiment_reprocess_stream"
+        self.queue: PriorityLanes | None = None
+        self.result_cache: ResultCache | None = None
+        self.deduper: JobDeduper | None = None
+        self.backfill: BackfillScanner | None = None
+        self.reprocess: ReprocessScanner | None = None
+        self.model_version = settings.model_version or cache_namespace(
+            settings.sentiment_model, settings.sensitive_topics_model
+        )
         self.dedupe_set_name = "sentiment_jobs_in_queue"
         self.is_running = True
-        self.SCAN_ENQUEUE_BATCH_SIZE = 1000
+        self.pipeline = StagePipeline(
+            read=self._read_batch,
+            infer=self._infer_batch,
+            write=self._write_batch,
+            on_failure=self._release_batch,
+            inference_workers=self.inference.processes,
+            prefetch_batches=settings.pipeline_prefetch_batches,
+        )
+
+    @staticmethod
+    def _coordinator_factory() -> partial:
+        """Builds models lazily, so inference processes can construct their own copy."""
+        return partial(
+            ModelCoordinator,
+            sentiment_model_name=settings.sentiment_model,
+            topics_model_name=settings.sensitive_topics_model,
+            device_str=settings.model_device,
+            inference_batch_size=settings.inference_batch_size,
+            max_batch_tokens=settings.max_batch_tokens,
+            bucket_boundaries=settings.bucket_boundaries,
+            backend_config=BackendConfig(
+                kind=settings.inference_backend,
+                onnx_dir=settings.onnx_dir,
+                quantize=settings.onnx_quantize,
+                num_threads=settings.onnx_threads,
+                weights_dir=settings.weights_dir,
+                mmap=settings.mmap_weights,
+            ),
+            preprocessor=(
+                TextPreprocessor(max_chars=settings.preprocess_max_chars)
+                if settings.preprocess_enabled
+                else None
+            ),
+            fast_path=FastPathClassifier() if settings.fast_path_enabled else None,
+            partial_results=settings.partial_startup,
+        )
+
+    @staticmethod
+    def _can_share_weights() -> bool:
+        if settings.share_weights and settings.inference_backend != "torch":
+            logger.warning(
+                "SENTIMENT_SHARE_WEIGHTS only applies to the torch backend, "
+                "each inference process will load its own models."
+            )
+            return False
+        return settings.share_weights
 
     async def connect(self):
         """Initializes connections to Redis and MongoDB."""
@@ -48,7 +154,93 @@ class SentimentWorker:
         self.mongo_client = AsyncIOMotorClient(str(settings.mongodb_url))
         db = self.mongo_client[settings.mongodb_database]
         self.messages_collection = db.messages
-        logger.info("Connections to Redis and MongoDB established.")
+        if settings.rollups_enabled:
+            self.rollups_collection = db.sentiment_rollups
+            self.rollup_markers_collection = db.sentiment_rollup_markers
+            await ensure_rollup_indexes(
+                self.rollups_collection,
+                self.rollup_markers_collection,
+                settings.rollup_marker_ttl_seconds,
+            )
+        self.queue = PriorityLanes(
+            live=self._create_queue(self.queue_name, self.stream_name),
+            backfill=self._create_queue(
+                self.backfill_queue_name, self.backfill_stream_name
+            ),
+            backfill_share=settings.backfill_share,
+            reprocess=(
+                self._create_queue(
+                    self.reprocess_queue_name, self.reprocess_stream_name
+                )
+                if settings.reprocess_enabled
+                else None
+            ),
+        )
+        await self.queue.setup()
+        self.deduper = create_deduper(
+            settings.dedupe_strategy,
+            self.redis_client,
+            self.messages_collection,
+            key=self.dedupe_set_name,
+            bloom_capacity=settings.dedupe_bloom_capacity,
+            bloom_error_rate=settings.dedupe_bloom_error_rate,
+        )
+        self.backfill = BackfillScanner(
+            self.messages_collection,
+            self.redis_client,
+            self.queue.backfill,
+            deduper=self.deduper,
+            batch_size=settings.backfill_batch_size,
+            max_queue_depth=settings.backfill_max_queue_depth,
+            progress_interval_seconds=settings.backfill_progress_interval_seconds,
+        )
+        if settings.reprocess_enabled:
+            self.reprocess = ReprocessScanner(
+                self.messages_collection,
+                self.redis_client,
+                self.queue.reprocess,
+                live_queue=self.queue.live,
+                version=self.model_version,
+                rate_per_second=settings.reprocess_rate_per_second,
+                batch_size=settings.reprocess_batch_size,
+                max_queue_depth=settings.reprocess_max_queue_depth,
+                progress_interval_seconds=settings.backfill_progress_interval_seconds,
+            )
+        if settings.cache_enabled:
+            self.result_cache = ResultCache(
+                max_entries=settings.cache_max_entries,
+                namespace=cache_namespace(
+                    self.model_version,
+                    settings.inference_backend,
+                    str(settings.onnx_quantize),
+                    str(settings.preprocess_enabled),
+                    str(settings.preprocess_max_chars),
+                    str(settings.fast_path_enabled),
+                ),
+                redis_client=(
+                    self.redis_client if settings.cache_redis_enabled else None
+                ),
+                redis_ttl_seconds=settings.cache_redis_ttl_seconds,
+                max_text_length=settings.cache_max_text_length,
+            )
+        logger.info(
+            "Connections to Redis and MongoDB established.",
+            transport=settings.queue_transport,
+        )
+
+    def _create_queue(self, queue_name: str, stream_name: str) -> SentimentQueue:
+        """Builds the configured transport for one lane of sentiment jobs."""
+        if settings.queue_transport == "stream":
+            return StreamQueue(
+                self.redis_client,
+                stream=stream_name,
+                group=self.stream_group,
+                consumer=settings.stream_consumer_name,
+                block_ms=settings.stream_block_ms,
+                claim_idle_ms=settings.stream_claim_idle_ms,
+                max_deliveries=settings.stream_max_deliveries,
+            )
+        return ListQueue(self.redis_client, queue_name)
 
     async def disconnect(self):
         """Closes all active connections."""
@@ -60,99 +252,11 @@ class SentimentWorker:
 
     async def enqueue_missing_analyses(self):
         """
-        Scans for messages needing analysis in batches to avoid cursor timeouts and uses a Redis
-        Set to prevent duplicate jobs from being added to the queue on restart.
+        Runs the resumable backfill that enqueues previously unanalyzed messages,
+        using a Redis Set to prevent duplicate jobs on restart.
         """
-        logger.info("Starting background scan to enqueue unanalyzed messages...")
-        total_enqueued = 0
         try:
-            while self.is_running:
-                pipeline = [
-                    {
-                        "$match": {
-                            "$and": [
-                                {"chat.type": {"$ne": "ChatType.PRIVATE"}},
-                                {"_": "Message"},
-                                {"sentiment": {"$exists": False}},
-                                {
-                                    "$or": [
-                                        {"text": {"$exists": True, "$ne": ""}},
-                                        {"caption": {"$exists": True, "$ne": ""}},
-                                    ]
-                                },
-                                {
-                                    "$or": [
-                                        {"from_user.is_bot": {"$exists": False}},
-                                        {"from_user.is_bot": False},
-                                    ]
-                                },
-                            ]
-                        }
-                    },
-                    {
-                        "$addFields": {
-                            "message_content": {"$ifNull": ["$text", "$caption"]}
-                        }
-                    },
-                    {"$match": {"message_content": {"$not": {"$regex": "^/"}}}},
-                    {"$project": {"_id": 1}},
-                    {"$limit": self.SCAN_ENQUEUE_BATCH_SIZE},
-                ]
-
-                cursor = self.messages_collection.aggregate(pipeline)
-                message_ids_to_process = [doc["_id"] async for doc in cursor]
-
-                if not message_ids_to_process:
-                    logger.info(
-                        "No more messages to enqueue. Background scan finished."
-                    )
-                    break
-
-                pipe = self.redis_client.pipeline()
-                for msg_id in message_ids_to_process:
-                    pipe.sismember(self.dedupe_set_name, str(msg_id))
-                is_member_results = await pipe.execute()
-
-                new_ids_to_enqueue = [
-                    msg_id
-                    for msg_id, is_member in zip(
-                        message_ids_to_process, is_member_results
-                    )
-                    if not is_member
-                ]
-
-                if not new_ids_to_enqueue:
-                    await asyncio.sleep(5)
-                    continue
-
-                await self.redis_client.sadd(
-                    self.dedupe_set_name, *[str(mid) for mid in new_ids_to_enqueue]
-                )
-
-                content_cursor = self.messages_collection.find(
-                    {"_id": {"$in": new_ids_to_enqueue}},
-                    {"_id": 1, "text": 1, "caption": 1},
-                )
-
-                item_batch_json = []
-                async for doc in content_cursor:
-                    item_to_enqueue = {
-                        "_id": str(doc["_id"]),
-                        "text": doc.get("text") or doc.get("caption", ""),
-                    }
-                    item_batch_json.append(json.dumps(item_to_enqueue))
-
-                if item_batch_json:
-                    await self.redis_client.lpush(self.queue_name, *item_batch_json)
-                    total_enqueued += len(item_batch_json)
-                    logger.info(
-                        "Enqueued batch of historical messages",
-                        batch_size=len(item_batch_json),
-                        total_enqueued=total_enqueued,
-                    )
-
-                await asyncio.sleep(0.5)
-
+            await self.backfill.run(lambda: self.is_running)
         except Exception as e:
             logger.error(
                 "Background scan for missing analyses failed.",
@@ -160,92 +264,325 @@ class SentimentWorker:
                 exc_info=True,
             )
 
-        logger.info(
-            "Background scan process has ended.", total_messages_enqueued=total_enqueued
-        )
-
-    async def process_batch(self, batch_data: List[str]):
+    async def reprocess_outdated_analyses(self):
         """
-        Processes a batch of message data from Redis: analyze content, update MongoDB,
-        and remove the processed IDs from the deduplication set.
+        Runs the resumable scan that re-enqueues messages analysed by an older
+        model version, once the backfill has finished.
         """
-        log = logger.bind(batch_size=len(batch_data))
-        log.info("Processing batch for analysis.")
         try:
-            items = [json.loads(data) for data in batch_data]
-        except json.JSONDecodeError:
-            log.error(
-                "Failed to parse JSON from batch data, skipping.", data=batch_data
+            await self.reprocess.run(lambda: self.is_running)
+        except Exception as e:
+            logger.error(
+                "Background scan for outdated analyses failed.",
+                error=str(e),
+                exc_info=True,
             )
-            return
 
-        if not items:
-            log.warning("Batch is empty after parsing.")
-            return
+    async def _run_scans(self):
+        await self.enqueue_missing_analyses()
+        if self.reprocess is not None:
+            await self.reprocess_outdated_analyses()
+
+    def _parse_entries(self, entries: List[QueueEntry]) -> List[Dict[str, Any]]:
+        """Decodes queue payloads, skipping (and logging) malformed ones."""
+        items = []
+        for entry in entries:
+            try:
+                items.append(json.loads(entry.data))
+            except json.JSONDecodeError:
+                logger.error(
+                    "Failed to parse JSON from queue entry, skipping.", data=entry.data
+                )
+        return items
+
+    async def _read_batch(self) -> WorkBatch | None:
+        """Reads and parses the next batch of jobs from the transport."""
+        entries = await self.queue.read(self._pop_size())
+        if not entries:
+            return None
+        metrics.BATCH_SIZE.observe(len(entries))
+        for entry in entries:
+            metrics.LANE_JOBS.labels(lane=entry.lane).inc()
+        started = time.perf_counter()
+        batch = WorkBatch(entries=entries, items=self._parse_entries(entries))
+        batch.items.sort(key=lambda x: len(x.get("text", "")))
+        self.pipeline.stats["read"].record(len(entries), time.perf_counter() - started)
+        return batch
+
+    async def _run_models(self, texts: List[str]) -> List[Dict[str, Any]]:
+        if not texts:
+            return []
+        results, timings = await self.inference.analyze(texts)
+        self.batch_sizer.observe(len(texts), sum(timings.values()))
+        for stage, seconds in timings.items():
+            metrics.STAGE_SECONDS.labels(stage=stage).observe(seconds)
+        metrics.ANALYZED_TEXTS.inc(len(texts))
+        metrics.FAST_PATH_TEXTS.inc(sum(1 for r in results if r.get("fast_path")))
+        return results
+
+    async def _analyze(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyzes texts, serving repeats from the result cache. Each distinct text
+        in a batch reaches the models at most once, and a fully cached batch skips
+        `analyze_batch` altogether.
+        """
+        cache = self.result_cache
+        if cache is None:
+            return await self._run_models(texts)
+
+        keys = [text_key(t) if cache.is_cacheable(t) else None for t in texts]
+        cached = await cache.get_many(dict.fromkeys(k for k in keys if k))
 
-        items.sort(key=lambda x: len(x.get("text", "")))
-        texts_to_analyze = [item.get("text", "") for item in items]
-        analysis_results = self.model_coordinator.analyze_batch(texts_to_analyze)
+        to_analyze: List[str] = []
+        pending: Dict[str, int] = {}
+        slots: List[int | None] = []
+        for text, key in zip(texts, keys):
+            if key is not None and key in cached:
+                slots.append(None)
+            elif key is not None and key in pending:
+                cache.stats.batch_duplicates += 1
+                slots.append(pending[key])
+            else:
+                if key is not None:
+                    pending[key] = len(to_analyze)
+                slots.append(len(to_analyze))
+                to_analyze.append(text)
 
+        analyzed = await self._run_models(to_analyze)
+        await cache.put_many(
+            {
+                key: analyzed[slot]
+                for key, slot in pending.items()
+                if not analyzed[slot].get("partial")
+            }
+        )
+        cache.stats.saved_inferences += len(texts) - len(to_analyze)
+        metrics.SAVED_INFERENCES.inc(len(texts) - len(to_analyze))
+        return [
+            cached[key] if slot is None else analyzed[slot]
+            for key, slot in zip(keys, slots)
+        ]
+
+    async def _infer_batch(self, batch: WorkBatch):
+        """Runs model inference off the event loop."""
+        batch.results = await self._analyze(
+            [item.get("text", "") for item in batch.items]
+        )
+
+    async def _write_batch(self, batch: WorkBatch):
+        """Persists results, acknowledges the jobs and clears their dedupe entries."""
+        started = time.perf_counter()
+        await self._write_results(batch)
+        await self.queue.ack(batch.entries)
+        metrics.STAGE_SECONDS.labels(stage="write").observe(
+            time.perf_counter() - started
+        )
+
+    async def _release_batch(self, batch: WorkBatch):
+        await self.queue.release(batch.entries)
+
+    async def _write_results(self, batch: WorkBatch):
+        """
+        Writes analysis results to MongoDB, together with the per-chat rollup
+        counters, and releases the jobs from the deduper.
+        """
+        log = logger.bind(batch_size=len(batch.items))
         operations = []
-        processed_ids = []
-        for item, analysis in zip(items, analysis_results):
+        for item, analysis in zip(batch.items, batch.results):
             update_payload = {
                 **analysis["sentiment"],
                 "sensitive_topics": analysis["sensitive_topics"],
             }
+            if analysis.get("fast_path"):
+                update_payload["fast_path"] = True
+            if analysis.get("partial"):
+                update_payload["partial"] = True
+            else:
+                update_payload["model_version"] = self.model_version
+            if self.rollups_collection is not None:
+                update_payload["rolled_up"] = True
             operations.append(
                 UpdateOne(
                     {"_id": ObjectId(item["_id"])},
                     {"$set": {"sentiment": update_payload}},
                 )
             )
-            processed_ids.append(item["_id"])
 
         if operations:
-            result = await self.messages_collection.bulk_write(
-                operations, ordered=False
-            )
+            writes = [self.messages_collection.bulk_write(operations, ordered=False)]
+            if self.rollups_collection is not None:
+                writes.append(self._write_rollups(batch))
+            result, *_ = await asyncio.gather(*writes)
             log.info("Batch updated in MongoDB.", modified_count=result.modified_count)
+            metrics.PROCESSED_MESSAGES.inc(len(operations))
+            now = datetime.now(timezone.utc)
+            for item in batch.items:
+                metrics.observe_message_age(parse_job_date(item.get("date")), now)
 
-            if processed_ids:
-                await self.redis_client.srem(self.dedupe_set_name, *processed_ids)
-                log.info(
-                    "Removed processed IDs from deduplication set.",
-                    count=len(processed_ids),
+            await self.deduper.release(batch.items)
+            log.debug("Released processed jobs from the deduper.")
+            if not self.first_batch_written:
+                self.first_batch_written = True
+                logger.info(
+                    "First batch written since startup.",
+                    since_start_seconds=round(time.perf_counter() - self.started_at, 3),
                 )
 
-    async def run(self):
-        """The main worker loop."""
-        await self.connect()
-        asyncio.create_task(self.enqueue_missing_analyses())
-        log = logger.bind(queue=self.queue_name)
-        log.info("Sentiment worker started, now consuming from Redis queue...")
+    async def _write_rollups(self, batch: WorkBatch):
+        """
+        Adds the batch to the rollup counters, skipping jobs whose contribution
+        was already applied by an earlier delivery. The markers are removed again
+        if the counters cannot be written, so the retry counts those jobs.
+        """
+        markers = await self.rollup_markers_collection.bulk_write(
+            build_rollup_markers(batch.items), ordered=False
+        )
+        claimed = sorted(markers.upserted_ids)
+        rollup_operations = build_rollup_updates(
+            [batch.items[i] for i in claimed], [batch.results[i] for i in claimed]
+        )
+        if not rollup_operations:
+            return
+        try:
+            await self.rollups_collection.bulk_write(rollup_operations, ordered=False)
+        except Exception:
+            await self.rollup_markers_collection.delete_many(
+                {"_id": {"$in": [markers.upserted_ids[i] for i in claimed]}}
+            )
+            raise
+
+    async def _report_pipeline_stats(self):
+        """Periodically logs per-stage throughput, utilisation and queue depths."""
+        while self.is_running:
+            await asyncio.sleep(settings.pipeline_stats_interval_seconds)
+            logger.info(
+                "Pipeline stats",
+                read=self.pipeline.stats["read"].snapshot(),
+                infer=self.pipeline.stats["infer"].snapshot(),
+                write=self.pipeline.stats["write"].snapshot(),
+                inference_queue_depth=self.pipeline.inference_queue.qsize(),
+                write_queue_depth=self.pipeline.write_queue.qsize(),
+                result_cache=(
+                    self.result_cache.stats.snapshot() if self.result_cache else None
+                ),
+            )
+
+    def _pop_size(self) -> int:
+        if settings.adaptive_batch_size:
+            return self.batch_sizer.size
+        return settings.batch_size
+
+    def _memory_headroom(self) -> float:
+        coordinator = self.inference.coordinator
+        if coordinator is not None and coordinator.device.type == "cuda":
+            return cuda_memory_headroom(coordinator.device)
+        return system_memory_headroom()
+
+    async def _tune_batch_size(self):
+        """
+        Periodically lets the adaptive controller resize the pop size from queue
+        depth, inference time per item and memory headroom. Every decision is
+        logged and exported.
+        """
+        metrics.BATCH_SIZE_TARGET.set(self.batch_sizer.size)
         while self.is_running:
+            await asyncio.sleep(settings.batch_controller_interval_seconds)
             try:
-                batch_data = await self.redis_client.lpop(
-                    self.queue_name, settings.batch_size
+                decision = self.batch_sizer.decide(
+                    queue_depth=await self.queue.depth(),
+                    memory_headroom=self._memory_headroom(),
                 )
-                if not batch_data:
-                    await asyncio.sleep(1)
-                    continue
-                if not isinstance(batch_data, list):
-                    batch_data = [batch_data]
-                await self.process_batch(batch_data)
             except Exception:
-                log.exception("Error in worker loop, continuing...")
-                await asyncio.sleep(5)
+                logger.exception("Batch size controller failed, keeping size.")
+                continue
+            metrics.BATCH_SIZE_TARGET.set(decision.size)
+            metrics.BATCH_SIZE_DECISIONS.labels(
+                action=decision.action, reason=decision.reason
+            ).inc()
+            logger.info("Batch size decision", **decision.as_log_fields())
+
+    async def _report_model_loading(self):
+        """Logs when the in-process models have finished loading."""
+        coordinator = self.inference.coordinator
+        if coordinator is None:
+            return
+        loop = asyncio.get_running_loop()
+        seconds = await loop.run_in_executor(None, coordinator.wait_until_loaded)
+        logger.info(
+            "All models loaded.",
+            load_seconds=round(seconds, 3),
+            since_start_seconds=round(time.perf_counter() - self.started_at, 3),
+        )
+
+    async def _sample_metrics(self):
+        """Refreshes gauges that are read from the transport and the backfill."""
+        while self.is_running:
+            try:
+                for lane_name, lane in self.queue.lanes.items():
+                    metrics.QUEUE_DEPTH.labels(queue=lane_name).set(await lane.depth())
+                metrics.QUEUE_DEPTH.labels(queue="inference").set(
+                    self.pipeline.inference_queue.qsize()
+                )
+                metrics.QUEUE_DEPTH.labels(queue="write").set(
+                    self.pipeline.write_queue.qsize()
+                )
+                progress = self.backfill.progress
+                metrics.BACKFILL_SCANNED.set(progress.scanned)
+                metrics.BACKFILL_ENQUEUED.set(progress.enqueued)
+                metrics.BACKFILL_REMAINING.set(progress.remaining)
+                metrics.BACKFILL_ETA_SECONDS.set(progress.eta_seconds or 0)
+                if self.reprocess is not None:
+                    metrics.REPROCESS_ENQUEUED.set(self.reprocess.progress.enqueued)
+                    metrics.REPROCESS_REMAINING.set(self.reprocess.progress.remaining)
+            except Exception:
+                logger.exception("Failed to sample worker metrics.")
+            await asyncio.sleep(settings.metrics_sample_interval_seconds)
+
+    async def run(self):
+        """Starts the backfill scan and the read, inference and write stages."""
+        await self.connect()
+        metrics.start_metrics_server(settings.metrics_port)
+        asyncio.create_task(self._run_scans())
+        asyncio.create_task(self._report_model_loading())
+        logger.info(
+            "Sentiment worker started, now consuming from Redis queue...",
+            since_start_seconds=round(time.perf_counter() - self.started_at, 3),
+            transport=settings.queue_transport,
+            prefetch_batches=settings.pipeline_prefetch_batches,
+            inference_processes=self.inference.processes,
+        )
+        background = [
+            asyncio.create_task(self._report_pipeline_stats()),
+            asyncio.create_task(self._sample_metrics()),
+        ]
+        if settings.adaptive_batch_size:
+            background.append(asyncio.create_task(self._tune_batch_size()))
+        try:
+            await self.pipeline.run()
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+
+    def stop(self):
+        """Stops reading; `run` returns once the batches in flight are written."""
+        self.is_running = False
+        self.pipeline.stop()
 
     async def shutdown(self):
         """Initiates a graceful shutdown of the worker."""
         self.is_running = False
         logger.info("Shutting down worker...")
         await self.disconnect()
+        self.inference.shutdown()
 
 
 async def main():
     """Entry point for the sentiment worker application."""
     worker = SentimentWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
     try:
         await worker.run()
     except KeyboardInterrupt:
@@ -0,0 +1,100 @@
+from datetime import datetime
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+QUEUE_DEPTH = Gauge(
+    "kurisu_sentiment_queue_depth",
+    "Jobs waiting in a Redis lane (live, backfill) or an in-process pipeline queue.",
+    ["queue"],
+)
+BATCH_SIZE = Histogram(
+    "kurisu_sentiment_batch_size",
+    "Number of jobs per batch read from the transport.",
+    buckets=(1, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096),
+)
+LANE_JOBS = Counter(
+    "kurisu_sentiment_lane_jobs_total",
+    "Jobs read from each priority lane.",
+    ["lane"],
+)
+BATCH_SIZE_TARGET = Gauge(
+    "kurisu_sentiment_batch_size_target",
+    "Pop size currently chosen by the adaptive batch controller.",
+)
+BATCH_SIZE_DECISIONS = Counter(
+    "kurisu_sentiment_batch_size_decisions_total",
+    "Adaptive batch controller decisions.",
+    ["action", "reason"],
+)
+STAGE_SECONDS = Histogram(
+    "kurisu_sentiment_stage_seconds",
+    "Time spent per batch in each processing step.",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+MESSAGE_AGE_SECONDS = Histogram(
+    "kurisu_sentiment_message_age_seconds",
+    "Time between a message's date and the moment its analysis was written.",
+    buckets=(1, 5, 15, 60, 300, 900, 3600, 21600, 86400, 604800, 2592000, 31536000),
+)
+PROCESSED_MESSAGES = Counter(
+    "kurisu_sentiment_processed_messages_total",
+    "Messages whose analysis was written to MongoDB.",
+)
+ANALYZED_TEXTS = Counter(
+    "kurisu_sentiment_analyzed_texts_total",
+    "Texts passed to the model coordinator after the result cache.",
+)
+FAST_PATH_TEXTS = Counter(
+    "kurisu_sentiment_fast_path_texts_total",
+    "Texts labelled by the rule-based fast path without running the models.",
+)
+CACHE_HITS = Counter(
+    "kurisu_sentiment_cache_hits_total",
+    "Result cache hits by tier.",
+    ["tier"],
+)
+CACHE_LOOKUPS = Counter(
+    "kurisu_sentiment_cache_lookups_total",
+    "Distinct texts looked up in the result cache.",
+)
+SAVED_INFERENCES = Counter(
+    "kurisu_sentiment_saved_inferences_total",
+    "Messages answered from the result cache or an identical text in the same batch.",
+)
+BACKFILL_SCANNED = Gauge(
+    "kurisu_sentiment_backfill_scanned",
+    "Unanalysed messages scanned by the current backfill run.",
+)
+BACKFILL_ENQUEUED = Gauge(
+    "kurisu_sentiment_backfill_enqueued",
+    "Jobs enqueued by the current backfill run.",
+)
+BACKFILL_REMAINING = Gauge(
+    "kurisu_sentiment_backfill_remaining",
+    "Estimated unanalysed messages left for the current backfill run.",
+)
+BACKFILL_ETA_SECONDS = Gauge(
+    "kurisu_sentiment_backfill_eta_seconds",
+    "Estimated seconds until the current backfill run finishes.",
+)
+
+REPROCESS_ENQUEUED = Gauge(
+    "kurisu_sentiment_reprocess_enqueued",
+    "Jobs enqueued by the current reprocessing run.",
+)
+REPROCESS_REMAINING = Gauge(
+    "kurisu_sentiment_reprocess_remaining",
+    "Estimated messages with an outdated model version left to reprocess.",
+)
+
+
+def start_metrics_server(port: int):
+    """Serves /metrics for Prometheus on a background thread."""
+    start_http_server(port)
+
+
+def observe_message_age(date: datetime | None, now: datetime):
+    """Records how old a message was when its analysis was written."""
+    if date is not None:
+        MESSAGE_AGE_SECONDS.observe(max((now - date).total_seconds(), 0.0))
@@ -0,0 +1,266 @@
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Mapping, Protocol
+
+import numpy as np
+import structlog
+import torch
+import torch.nn.functional as F
+from safetensors.torch import load_file
+from transformers import (
+    AutoConfig,
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    PreTrainedModel,
+    PreTrainedTokenizerBase,
+)
+from transformers.modeling_utils import no_init_weights
+
+logger = structlog.get_logger(__name__)
+
+ONNX_INPUT_NAMES = ("input_ids", "attention_mask")
+ONNX_OPSET = 17
+WEIGHTS_FILENAME = "model.safetensors"
+
+
+class InferenceBackend(Protocol):
+    """
+    Runs a sequence classification model on a padded batch.
+    Models only see class probabilities, so the execution engine can be swapped
+    without touching label mapping or post-processing.
+    """
+
+    def probabilities(self, encoded: Mapping[str, Any]) -> np.ndarray:
+        """Returns a (batch, num_labels) array of softmax probabilities."""
+        ...
+
+
+@dataclass(frozen=True)
+class BackendConfig:
+    """How the worker should execute its models."""
+
+    kind: Literal["torch", "onnx"] = "torch"
+    onnx_dir: str = "/opt/kurisu/cache/onnx"
+    quantize: bool = True
+    num_threads: int = 0
+    weights_dir: str = "/opt/kurisu/cache/weights"
+    mmap: bool = False
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _as_int64(value: Any) -> np.ndarray:
+    if isinstance(value, torch.Tensor):
+        value = value.cpu().numpy()
+    return np.asarray(value, dtype=np.int64)
+
+
+class TorchBackend:
+    """Eager PyTorch execution on the configured device."""
+
+    def __init__(self, model: PreTrainedModel, device: torch.device):
+        self.device = device
+        self.model = model.to(device)
+        self.model.eval()
+
+    def probabilities(self, encoded: Mapping[str, Any]) -> np.ndarray:
+        inputs = {name: tensor.to(self.device) for name, tensor in encoded.items()}
+        with torch.no_grad():
+            logits = self.model(**inputs).logits
+            return F.softmax(logits, dim=-1).cpu().numpy()
+
+
+class OnnxBackend:
+    """ONNX Runtime execution on CPU, optionally with an int8 quantized graph."""
+
+    def __init__(self, model_path: Path, num_threads: int = 0):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError(
+                "SENTIMENT_INFERENCE_BACKEND=onnx requires the 'onnxruntime' package."
+            ) from e
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def probabilities(self, encoded: Mapping[str, Any]) -> np.ndarray:
+        inputs = {name: _as_int64(encoded[name]) for name in self.input_names}
+        (logits,) = self.session.run(["logits"], inputs)
+        return softmax(logits)
+
+
+def weights_artifact_dir(model_name: str, config: BackendConfig) -> Path:
+    return Path(config.weights_dir) / model_name.replace("/", "--")
+
+
+def ensure_weights_artifact(model_name: str, config: BackendConfig) -> Path:
+    """
+    Returns a local directory holding the model as a single safetensors file,
+    its config and its tokenizer, saving it from the Hugging Face cache on first
+    use. Later starts load from it without resolving the model on the Hub.
+    The snapshot is written to a temporary directory and renamed into place,
+    so concurrent inference processes never see a partial one.
+    """
+    target = weights_artifact_dir(model_name, config)
+    if (target / WEIGHTS_FILENAME).exists():
+        return target
+
+    logger.info("Saving model weights snapshot...", model=model_name, path=str(target))
+    staging = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.save_pretrained(staging, safe_serialization=True, max_shard_size="100GB")
+    AutoTokenizer.from_pretrained(model_name, use_fast=True).save_pretrained(staging)
+    del model
+    try:
+        staging.rename(target)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not (target / WEIGHTS_FILENAME).exists():
+            raise
+    return target
+
+
+def load_tokenizer(model_name: str, config: BackendConfig) -> PreTrainedTokenizerBase:
+    """Loads the tokenizer from the local snapshot of the model."""
+    return AutoTokenizer.from_pretrained(
+        ensure_weights_artifact(model_name, config),
+        use_fast=True,
+        local_files_only=True,
+    )
+
+
+def load_torch_model(path: Path, mmap: bool = False) -> PreTrainedModel:
+    """
+    Loads a weights snapshot. With `mmap`, parameters are assigned straight from
+    the memory-mapped safetensors file instead of being copied, so on CPU they
+    stay in the page cache and are shared by every process loading the same file.
+    A snapshot that does not cover every weight of the model is rejected, since
+    the model is built without initialising its weights.
+    """
+    if not mmap:
+        return AutoModelForSequenceClassification.from_pretrained(
+            path, local_files_only=True, low_cpu_mem_usage=True
+        )
+    with no_init_weights():
+        model = AutoModelForSequenceClassification.from_config(
+            AutoConfig.from_pretrained(path, local_files_only=True)
+        )
+    weights = load_file(path / WEIGHTS_FILENAME)
+    result = model.load_state_dict(weights, strict=False, assign=True)
+    model.tie_weights()
+    tensors = model.state_dict(keep_vars=True)
+    loaded = {tensors[key].data_ptr() for key in weights if key in tensors}
+    missing = [k for k in result.missing_keys if tensors[k].data_ptr() not in loaded]
+    if missing or result.unexpected_keys:
+        raise RuntimeError(
+            f"Weights snapshot {path} does not match the model: "
+            f"missing {missing}, unexpected {result.unexpected_keys}."
+        )
+    return model
+
+
+def export_onnx(model: PreTrainedModel, path: Path) -> Path:
+    """
+    Exports a sequence classification model to ONNX with dynamic batch and
+    sequence axes, taking only input ids and the attention mask.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    model.eval()
+    dummy_ids = torch.ones((1, 8), dtype=torch.long)
+    dummy_mask = torch.ones((1, 8), dtype=torch.long)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in ONNX_INPUT_NAMES}
+    dynamic_axes["logits"] = {0: "batch"}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy_ids, dummy_mask),
+            str(path),
+            input_names=list(ONNX_INPUT_NAMES),
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET,
+            dynamo=False,
+        )
+    return path
+
+
+def quantize_onnx(source: Path, target: Path) -> Path:
+    """Applies dynamic int8 quantization to the weights of an exported graph."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(str(source), str(target), weight_type=QuantType.QInt8)
+    return target
+
+
+def onnx_artifact_path(model_name: str, config: BackendConfig) -> Path:
+    filename = "model.int8.onnx" if config.quantize else "model.onnx"
+    return Path(config.onnx_dir) / model_name.replace("/", "--") / filename
+
+
+def ensure_onnx_artifact(model_name: str, config: BackendConfig) -> Path:
+    """
+    Returns the cached ONNX graph for a model, exporting (and quantizing) it on
+    first use. Artifacts live next to the Hugging Face cache so restarts reuse them.
+    """
+    target = onnx_artifact_path(model_name, config)
+    if target.exists():
+        return target
+
+    fp32_path = target.with_name("model.onnx")
+    if not fp32_path.exists():
+        logger.info("Exporting model to ONNX...", model=model_name, path=str(fp32_path))
+        model = load_torch_model(ensure_weights_artifact(model_name, config))
+        export_onnx(model, fp32_path)
+        del model
+
+    if config.quantize:
+        logger.info("Quantizing ONNX model to int8...", model=model_name)
+        quantize_onnx(fp32_path, target)
+    return target
+
+
+def create_backend(
+    model_name: str, device: torch.device, config: BackendConfig
+) -> InferenceBackend:
+    """
+    Builds the backend selected by `config` for a Hugging Face model name, from
+    the serialized artifacts on the cache volume, and logs how long it took.
+    """
+    started = time.perf_counter()
+    if config.kind == "onnx":
+        model_path = ensure_onnx_artifact(model_name, config)
+        backend = OnnxBackend(model_path, num_threads=config.num_threads)
+        logger.info(
+            "Using ONNX Runtime backend.",
+            model=model_name,
+            path=str(model_path),
+            quantized=config.quantize,
+            load_seconds=round(time.perf_counter() - started, 3),
+        )
+        return backend
+
+    path = ensure_weights_artifact(model_name, config)
+    mmap = config.mmap and device.type == "cpu"
+    backend = TorchBackend(load_torch_model(path, mmap=mmap), device)
+    logger.info(
+        "Using PyTorch backend.",
+        model=model_name,
+        path=str(path),
+        mmap=mmap,
+        load_seconds=round(time.perf_counter() - started, 3),
+    )
+    return backend
@@ -0,0 +1,67 @@
+from bisect import bisect_left
+from typing import List, Sequence
+
+DEFAULT_BUCKET_BOUNDARIES = (16, 32, 64, 128, 256, 512)
+
+
+def bucket_by_length(lengths: List[int], batch_size: int) -> List[List[int]]:
+    """
+    Groups item indexes into batches of similar token length.
+
+    Indexes are sorted by length and cut into consecutive chunks of at most
+    `batch_size`, so every batch is padded only to the length of its own longest
+    member instead of the longest text in the whole request.
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def token_budget_batches(
+    lengths: List[int],
+    max_tokens: int,
+    max_rows: int,
+    boundaries: Sequence[int] = DEFAULT_BUCKET_BOUNDARIES,
+) -> List[List[int]]:
+    """
+    Splits item indexes into micro-batches bounded by a padded-token budget.
+
+    Items are first assigned to length buckets delimited by `boundaries` (an item
+    of length L goes to the first boundary >= L, longer items to the last bucket),
+    so short and long texts never share a batch. Inside a bucket, items are taken
+    in length order while `rows * longest_row <= max_tokens` and `rows <= max_rows`.
+    A single item longer than the budget still gets a batch of its own.
+    """
+    bounds = sorted(boundaries)
+    buckets: List[List[int]] = [[] for _ in range(len(bounds) + 1)]
+    for idx in sorted(range(len(lengths)), key=lengths.__getitem__):
+        buckets[bisect_left(bounds, lengths[idx])].append(idx)
+
+    batches: List[List[int]] = []
+    for bucket in buckets:
+        current: List[int] = []
+        for idx in bucket:
+            longest = lengths[idx]
+            if current and (
+                len(current) >= max_rows or (len(current) + 1) * longest > max_tokens
+            ):
+                batches.append(current)
+                current = []
+            current.append(idx)
+        if current:
+            batches.append(current)
+    return batches
+
+
+def padded_tokens(lengths: List[int], batches: List[List[int]]) -> int:
+    """Total number of token slots (real + padding) the given batches will occupy."""
+    return sum(len(batch) * max(lengths[i] for i in batch) for batch in batches)
+
+
+def clip_ids(ids: List[int], max_length: int) -> List[int]:
+    """
+    Truncates an encoded sequence to `max_length` while keeping its final token,
+    which for BERT-style tokenizers is the closing special token ([SEP]).
+    """
+    if len(ids) <= max_length:
+        return ids
+    return ids[: max_length - 1] + ids[-1:]
@@ -1,26 +1,211 @@
-from typing import Dict, List, Any
+import time
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict, List, Any, Sequence, Tuple
 import torch
 import structlog
+from transformers import PreTrainedTokenizerBase
 
+from .backends import BackendConfig
+from .batching import DEFAULT_BUCKET_BOUNDARIES, clip_ids, token_budget_batches
+from .fast_path import FastPathClassifier
+from .preprocessing import TextPreprocessor
 from .sentiment import SentimentModel
 from .topics import SensitiveTopicsModel
 
 logger = structlog.get_logger(__name__)
 
+RESULT_KEYS = {"sentiment": "sentiment", "topics": "sensitive_topics"}
+
 
 class ModelCoordinator:
     """
     Loads all ML models and orchestrates the analysis pipeline.
+
+    Texts are tokenized once per request. When both models ship the same fast
+    tokenizer vocabulary the encoding is shared and only clipped to each model's
+    max length; otherwise each model gets its own (unpadded) encoding. Either way
+    texts are bucketed by token length once and split into micro-batches whose
+    padded size (rows x longest row) stays within `max_batch_tokens`. Both models
+    consume the same micro-batches, so one long message no longer pads a whole
+    request to 512 tokens.
+
+    `backend_config` selects how the models execute: eager PyTorch on the
+    configured device, or ONNX Runtime on CPU with an optional int8 graph.
+
+    With a `preprocessor`, texts are cleaned before tokenization; texts it drops
+    (link- or mention-only messages) skip the models and are labelled "skip".
+    With a `fast_path`, trivial texts ("ок", "спс", a lone emoji) are labelled
+    by rule before any of that; their results carry `fast_path: True`.
+
+    Both models load concurrently in background threads, so the constructor
+    returns immediately and loading time is the slower model's rather than the
+    sum. `sentiment_model` and `topics_model` block until their model is ready.
+    With `partial_results`, batches arriving while only one model is loaded are
+    analysed with that model alone and marked `partial: True`; otherwise they
+    wait for both. Partial results carry no `model_version`, so they are only
+    completed later if reprocessing is enabled.
     """
 
     def __init__(
-        self, sentiment_model_name: str, topics_model_name: str, device_str: str
+        self,
+        sentiment_model_name: str,
+        topics_model_name: str,
+        device_str: str,
+        inference_batch_size: int = 64,
+        max_batch_tokens: int = 16384,
+        bucket_boundaries: Sequence[int] = DEFAULT_BUCKET_BOUNDARIES,
+        backend_config: BackendConfig | None = None,
+        preprocessor: TextPreprocessor | None = None,
+        fast_path: FastPathClassifier | None = None,
+        partial_results: bool = False,
     ):
+        self.partial_results = partial_results
+        self.preprocessor = preprocessor
+        self.fast_path = fast_path
+        self.backend_config = backend_config or BackendConfig()
         self.device = torch.device(device_str if torch.cuda.is_available() else "cpu")
-        logger.info(f"ModelCoordinator initializing on device: {self.device}")
+        if (
+            self.backend_config.kind == "torch"
+            and self.device.type == "cpu"
+            and device_str != "cpu"
+        ):
+            logger.warning(
+                "CUDA is not available, running eager PyTorch on CPU. "
+                "Set SENTIMENT_INFERENCE_BACKEND=onnx for faster CPU inference.",
+                requested_device=device_str,
+            )
+        logger.info(
+            f"ModelCoordinator initializing on device: {self.device}",
+            backend=self.backend_config.kind,
+        )
+
+        self.inference_batch_size = inference_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.bucket_boundaries = tuple(bucket_boundaries)
+        self._shared_tokenizer: PreTrainedTokenizerBase | None = None
+        self._tokenizer_checked = False
+        self._started_at = time.perf_counter()
+        self._loader = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="model-loader"
+        )
+        self._models: Dict[str, Future] = {
+            "sentiment": self._loader.submit(
+                self._load, "sentiment", SentimentModel, sentiment_model_name
+            ),
+            "topics": self._loader.submit(
+                self._load, "topics", SensitiveTopicsModel, topics_model_name
+            ),
+        }
+        self._loader.shutdown(wait=False)
 
-        self.sentiment_model = SentimentModel(sentiment_model_name, self.device)
-        self.topics_model = SensitiveTopicsModel(topics_model_name, self.device)
+    def _load(self, name: str, model_class: type, model_name: str):
+        started = time.perf_counter()
+        model = model_class(model_name, self.device, self.backend_config)
+        logger.info(
+            "Model ready.",
+            model=name,
+            load_seconds=round(time.perf_counter() - started, 3),
+            since_start_seconds=round(time.perf_counter() - self._started_at, 3),
+        )
+        return model
+
+    @property
+    def sentiment_model(self) -> SentimentModel:
+        return self._models["sentiment"].result()
+
+    @property
+    def topics_model(self) -> SensitiveTopicsModel:
+        return self._models["topics"].result()
+
+    def wait_until_loaded(self) -> float:
+        """Blocks until both models are loaded and returns the seconds it took."""
+        for future in self._models.values():
+            future.result()
+        return time.perf_counter() - self._started_at
+
+    def ready_models(self) -> List[str]:
+        """
+        Names of the loaded models. Blocks until at least one is ready, and until
+        both are unless `partial_results` is set.
+        """
+        futures = list(self._models.values())
+        wait(
+            futures,
+            return_when=FIRST_COMPLETED if self.partial_results else ALL_COMPLETED,
+        )
+        return [name for name, future in self._models.items() if future.done()]
+
+    @property
+    def shared_tokenizer(self) -> PreTrainedTokenizerBase | None:
+        if not self._tokenizer_checked:
+            self._shared_tokenizer = self._find_shared_tokenizer()
+            self._tokenizer_checked = True
+            logger.info(
+                "Tokenization strategy selected.",
+                shared=self._shared_tokenizer is not None,
+                inference_batch_size=self.inference_batch_size,
+                max_batch_tokens=self.max_batch_tokens,
+                bucket_boundaries=self.bucket_boundaries,
+            )
+        return self._shared_tokenizer
+
+    def _find_shared_tokenizer(self) -> PreTrainedTokenizerBase | None:
+        """Returns a tokenizer usable by both models, if their vocabularies match."""
+        sentiment_tok = self.sentiment_model.tokenizer
+        topics_tok = self.topics_model.tokenizer
+        if not (sentiment_tok.is_fast and topics_tok.is_fast):
+            return None
+        if type(sentiment_tok) is not type(topics_tok):
+            return None
+        if sentiment_tok.get_vocab() != topics_tok.get_vocab():
+            return None
+        return sentiment_tok
+
+    @staticmethod
+    def _encode(
+        tokenizer: PreTrainedTokenizerBase, texts: List[str], max_length: int
+    ) -> List[List[int]]:
+        return tokenizer(texts, max_length=max_length, truncation=True, padding=False)[
+            "input_ids"
+        ]
+
+    @staticmethod
+    def _pad(tokenizer: PreTrainedTokenizerBase, ids_batch: List[List[int]]):
+        return tokenizer.pad(
+            {"input_ids": ids_batch}, padding=True, return_tensors="pt"
+        )
+
+    def tokenize(self, texts: List[str]) -> tuple[List[List[int]], List[List[int]]]:
+        """Returns unpadded input ids for the sentiment and the topics model."""
+        sentiment_max = self.sentiment_model.max_length
+        topics_max = self.topics_model.max_length
+        if self.shared_tokenizer is not None:
+            ids = self._encode(
+                self.shared_tokenizer, texts, max(sentiment_max, topics_max)
+            )
+            return (
+                [clip_ids(seq, sentiment_max) for seq in ids],
+                [clip_ids(seq, topics_max) for seq in ids],
+            )
+        return (
+            self._encode(self.sentiment_model.tokenizer, texts, sentiment_max),
+            self._encode(self.topics_model.tokenizer, texts, topics_max),
+        )
+
+    def plan_batches(self, lengths: List[int]) -> List[List[int]]:
+        """Splits item indexes into token-budgeted micro-batches."""
+        return token_budget_batches(
+            lengths,
+            max_tokens=self.max_batch_tokens,
+            max_rows=self.inference_batch_size,
+            boundaries=self.bucket_boundaries,
+        )
 
     def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
         """
@@ -30,16 +215,68 @@ class ModelCoordinator:
             A list of combined analysis results for each text.
             e.g., [{'sentiment': {...}, 'sensitive_topics': {...}}, ...]
         """
+        return self.analyze_batch_timed(texts)[0]
+
+    def analyze_batch_timed(
+        self, texts: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """
+        Same as `analyze_batch`, but also returns the seconds spent on the fast
+        path and preprocessing, tokenizing and running the models,
+        e.g. {'preprocess': 0.001, 'tokenize': 0.01, 'inference': 0.4}.
+        """
+        ready = self.ready_models()
+        started = time.perf_counter()
+        fast_labels = self.fast_path(texts) if self.fast_path else [None] * len(texts)
+        results: List[Dict[str, Any]] = [
+            {"sentiment": SentimentModel.skip_result(), "sensitive_topics": {}}
+            if label is None
+            else {
+                "sentiment": SentimentModel.fixed_result(label),
+                "sensitive_topics": {},
+                "fast_path": True,
+            }
+            for label in fast_labels
+        ]
+        kept = [i for i, label in enumerate(fast_labels) if label is None]
+        texts = [texts[i] for i in kept]
+        if self.preprocessor is not None:
+            cleaned = self.preprocessor(texts)
+            kept = [i for i, text in zip(kept, cleaned) if text is not None]
+            texts = [text for text in cleaned if text is not None]
+        preprocessed = time.perf_counter()
+
         if not texts:
-            return []
+            return results, {
+                "preprocess": preprocessed - started,
+                "tokenize": 0.0,
+                "inference": 0.0,
+            }
 
-        sentiment_results = self.sentiment_model.predict(texts)
-        topics_results = self.topics_model.predict(texts)
+        if len(ready) == len(self._models):
+            sentiment_ids, topics_ids = self.tokenize(texts)
+            ids = {"sentiment": sentiment_ids, "topics": topics_ids}
+        else:
+            model = self._models[ready[0]].result()
+            ids = {ready[0]: self._encode(model.tokenizer, texts, model.max_length)}
+            for idx in kept:
+                results[idx].update(
+                    {RESULT_KEYS[name]: {} for name in self._models if name not in ids}
+                )
+                results[idx]["partial"] = True
+        tokenized = time.perf_counter()
+        buckets = self.plan_batches([len(seq) for seq in next(iter(ids.values()))])
 
-        combined_results = []
-        for sentiment, topics in zip(sentiment_results, topics_results):
-            combined_results.append(
-                {"sentiment": sentiment, "sensitive_topics": topics}
-            )
+        for bucket in buckets:
+            for name, model_ids in ids.items():
+                model = self._models[name].result()
+                encoded = self._pad(model.tokenizer, [model_ids[i] for i in bucket])
+                for idx, result in zip(bucket, model.predict_encoded(encoded)):
+                    results[kept[idx]][RESULT_KEYS[name]] = result
 
-        return combined_results
+        timings = {
+            "preprocess": preprocessed - started,
+            "tokenize": tokenized - preprocessed,
+            "inference": time.perf_counter() - tokenized,
+        }
+        return results, timings
@@ -0,0 +1,132 @@
+import re
+from typing import Dict, Iterable, List
+
+from .preprocessing import EMOJI_ATOM_PATTERN
+
+LEXICON: Dict[str, Iterable[str]] = {
+    "neutral": (
+        "ок",
+        "окей",
+        "ok",
+        "да",
+        "нет",
+        "ага",
+        "угу",
+        "неа",
+        "хз",
+        "понял",
+        "поняла",
+        "ясно",
+        "норм",
+        "согл",
+        "ну да",
+        "ну",
+        "мб",
+        "?",
+        "??",
+        "-",
+        ".",
+    ),
+    "positive": (
+        "+",
+        "++",
+        "лол",
+        "кек",
+        "база",
+        "жиза",
+        "топ",
+        "класс",
+        "круто",
+        "кайф",
+        "имба",
+        "огонь",
+        "красава",
+    ),
+    "negative": (
+        "жаль",
+        "грустно",
+        "отстой",
+        "кринж",
+        "капец",
+        "ужас",
+        "треш",
+    ),
+    "speech_act": (
+        "спс",
+        "спасибо",
+        "пасиб",
+        "благодарю",
+        "привет",
+        "прив",
+        "здравствуйте",
+        "пока",
+        "доброе утро",
+        "спокойной ночи",
+        "сорян",
+        "извини",
+    ),
+}
+
+POSITIVE_EMOJI = frozenset("😂🤣😁😄😃😀😊🙂😍🥰😘❤🔥👍👏💪🎉✅💯😎🤩😆😅🙏")
+NEGATIVE_EMOJI = frozenset("😢😭😡🤬😠👎💩😞😔😒🙄😤😩😫💔🤮😱")
+
+LAUGH_PATTERN = re.compile(r"а?(?:х[аеыи]+)+х?|(?:ha){2,}h?|l+o+l+")
+SMILE_PATTERN = re.compile(r"[)]+|:-?\)+|[=;]\)+|xd+|хд+")
+FROWN_PATTERN = re.compile(r"[(]+|:-?\(+")
+TRAILING_PUNCTUATION = re.compile(r"[.!,]+$")
+EMOJI_MODIFIERS = re.compile("[️‍\U0001f3fb-\U0001f3ff]")
+
+
+class FastPathClassifier:
+    """
+    Labels trivial messages without running the transformer models.
+
+    A text qualifies when it has at most `max_words` words and is a known
+    reply from the lexicon ("ок", "спс", "база"), a laugh ("ахахах"), a bracket
+    smiley (")))", "((("), or consists only of emoji that all lean the same way.
+    Everything else returns None and goes to the models. The output is a pure
+    function of the text, so the same message always gets the same label.
+    """
+
+    def __init__(
+        self,
+        lexicon: Dict[str, Iterable[str]] | None = None,
+        max_words: int = 2,
+    ):
+        self.max_words = max_words
+        self.lookup = {
+            word: label
+            for label, words in (lexicon or LEXICON).items()
+            for word in words
+        }
+
+    @staticmethod
+    def _emoji_label(text: str) -> str | None:
+        atoms = EMOJI_ATOM_PATTERN.findall(text)
+        if not atoms or EMOJI_ATOM_PATTERN.sub("", text).strip():
+            return None
+        bases = {EMOJI_MODIFIERS.sub("", atom) for atom in atoms}
+        if bases <= POSITIVE_EMOJI:
+            return "positive"
+        if bases <= NEGATIVE_EMOJI:
+            return "negative"
+        return None
+
+    def classify_one(self, text: str) -> str | None:
+        """Returns the sentiment label for a trivial text, or None."""
+        normalized = " ".join(text.lower().split())
+        if not normalized or len(normalized.split()) > self.max_words:
+            return None
+        label = self.lookup.get(normalized) or self.lookup.get(
+            TRAILING_PUNCTUATION.sub("", normalized)
+        )
+        if label is not None:
+            return label
+        if LAUGH_PATTERN.fullmatch(normalized) or SMILE_PATTERN.fullmatch(normalized):
+            return "positive"
+        if FROWN_PATTERN.fullmatch(normalized):
+            return "negative"
+        return self._emoji_label(normalized)
+
+    def __call__(self, texts: List[str]) -> List[str | None]:
+        return [self.classify_one(text) for text in texts]
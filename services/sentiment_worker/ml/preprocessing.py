@@ -0,0 +1,74 @@
+import re
+from typing import List
+
+URL_PATTERN = re.compile(
+    r"(?:https?://|www\.|t\.me/)\S+|\b[\w-]+\.(?:com|ru|org|net|io|me|ly|be)/\S*",
+    re.IGNORECASE,
+)
+MENTION_PATTERN = re.compile(r"(?<!\w)@\w{3,}")
+CODE_BLOCK_PATTERN = re.compile(r"```.*?(?:```|$)", re.DOTALL)
+REPEATED_CHAR_PATTERN = re.compile(r"(\w|[^\w\s])\1{3,}")
+EMOJI = "[\U0001f000-\U0001faff☀-➿⬀-⯿]"
+EMOJI_RUN_PATTERN = re.compile(rf"(?:{EMOJI}[️‍\U0001f3fb-\U0001f3ff]*){{4,}}")
+EMOJI_ATOM_PATTERN = re.compile(rf"{EMOJI}[️‍\U0001f3fb-\U0001f3ff]*")
+WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n+")
+CONTENT_PATTERN = re.compile(rf"\w|{EMOJI}")
+
+
+class TextPreprocessor:
+    """
+    Cleans message texts before tokenization so the models spend tokens on prose.
+
+    - fenced code blocks, URLs and @mentions are removed;
+    - characters repeated more than `max_repeat` times are collapsed
+      ("ахааааа" -> "ахааа", "!!!!!!" -> "!!!");
+    - runs of more than `max_emoji_run` emoji keep only the first ones;
+    - texts left without letters, digits or emoji once links, mentions and code
+      are gone are dropped and returned as None; short replies such as "+" are
+      kept;
+    - texts longer than `max_chars` keep their head and tail, since the opening
+      and the closing of a long message usually carry its tone.
+
+    All patterns are compiled once and applied to the whole batch.
+    """
+
+    def __init__(
+        self,
+        max_chars: int = 1000,
+        head_ratio: float = 0.6,
+        max_repeat: int = 3,
+        max_emoji_run: int = 3,
+    ):
+        self.max_chars = max_chars
+        self.head_chars = int(max_chars * head_ratio)
+        self.tail_chars = max_chars - self.head_chars
+        self.max_repeat = max_repeat
+        self.max_emoji_run = max_emoji_run
+
+    def _collapse_emoji_run(self, match: re.Match) -> str:
+        return "".join(EMOJI_ATOM_PATTERN.findall(match.group(0))[: self.max_emoji_run])
+
+    def _window(self, text: str) -> str:
+        if len(text) <= self.max_chars:
+            return text
+        head = text[: self.head_chars].rsplit(" ", 1)[0]
+        tail = text[-self.tail_chars :].split(" ", 1)[-1]
+        return f"{head} … {tail}"
+
+    def clean(self, text: str) -> str | None:
+        """Returns the cleaned text, or None when nothing worth analysing is left."""
+        stripped = CODE_BLOCK_PATTERN.sub(" ", text)
+        stripped = URL_PATTERN.sub(" ", stripped)
+        stripped = MENTION_PATTERN.sub(" ", stripped)
+        if stripped != text and not CONTENT_PATTERN.search(stripped):
+            return None
+        text = stripped
+        text = REPEATED_CHAR_PATTERN.sub(lambda m: m.group(1) * self.max_repeat, text)
+        text = EMOJI_RUN_PATTERN.sub(self._collapse_emoji_run, text)
+        text = WHITESPACE_PATTERN.sub(" ", text)
+        text = BLANK_LINES_PATTERN.sub("\n", text).strip()
+        return self._window(text)
+
+    def __call__(self, texts: List[str]) -> List[str | None]:
+        return [self.clean(text) for text in texts]
@@ -1,8 +1,10 @@
 from typing import Dict, List
 import torch
-from transformers import pipeline
+from transformers import BatchEncoding
 import structlog
 
+from .backends import BackendConfig, create_backend, load_tokenizer
+
 logger = structlog.get_logger(__name__)
 
 
@@ -16,39 +18,61 @@ class SentimentModel:
         3: "skip",
         4: "speech_act",
     }
+    max_length = 512
 
-    def __init__(self, model_name: str, device: torch.device):
+    def __init__(
+        self,
+        model_name: str,
+        device: torch.device,
+        backend_config: BackendConfig | None = None,
+    ):
         logger.info("Loading sentiment model...", model=model_name, device=str(device))
-        logger.info("test")
-        self.pipeline = pipeline(
-            task="text-classification", model=model_name, device=device, top_k=None
-        )
+        self.device = device
+        backend_config = backend_config or BackendConfig()
+        self.tokenizer = load_tokenizer(model_name, backend_config)
+        self.backend = create_backend(model_name, device, backend_config)
         logger.info("Sentiment model loaded successfully.")
 
-    def predict(self, texts: List[str]) -> List[Dict[str, float]]:
+    @classmethod
+    def fixed_result(cls, label: str) -> Dict[str, float]:
+        """A result that puts all probability on `label`, for texts decided by rule."""
+        return {name: float(name == label) for name in cls._ID_TO_NAME.values()}
+
+    @classmethod
+    def skip_result(cls) -> Dict[str, float]:
+        """The result given to texts with nothing to analyse, e.g. a bare link."""
+        return cls.fixed_result("skip")
+
+    def predict_encoded(self, encoded: BatchEncoding) -> List[Dict[str, float]]:
         """
-        Predicts sentiment for a batch of texts using a model that outputs LABEL_X format.
+        Runs the model on an already tokenized and padded batch.
         Returns:
             A list of dictionaries, where each dictionary contains label-score pairs.
             e.g., [{'negative': 0.9, 'neutral': 0.05, 'positive': 0.01, 'skip': 0.02, 'speech_act': 0.02}, ...]
         """
+        probabilities = self.backend.probabilities(encoded)
+
+        return [
+            {
+                self._ID_TO_NAME[idx]: float(prob)
+                for idx, prob in enumerate(probs)
+                if idx in self._ID_TO_NAME
+            }
+            for probs in probabilities
+        ]
+
+    def predict(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Predicts sentiment for a batch of texts, tokenizing them on its own.
+        See `predict_encoded` for the output format.
+        """
         if not texts:
             return []
-        with torch.no_grad():
-            raw_results = self.pipeline(texts, truncation=True, max_length=512)
-        processed_results = []
-        for batch_result in raw_results:
-            score_map = {}
-            for item in batch_result:
-                try:
-                    label_id = int(item["label"].split("_")[-1])
-                    label_name = self._ID_TO_NAME[label_id]
-                    score_map[label_name] = item["score"]
-                except (ValueError, KeyError, IndexError) as e:
-                    logger.warning(
-                        "Could not parse model output label",
-                        label=item.get("label"),
-                        error=str(e),
-                    )
-            processed_results.append(score_map)
-        return processed_results
+        encoded = self.tokenizer(
+            texts,
+            max_length=self.max_length,
+            padding=True,
+            truncation=True,
+            return_tensors="pt",
+        )
+        return self.predict_encoded(encoded)
@@ -2,26 +2,32 @@ import json
 from pathlib import Path
 from typing import Dict, List
 import torch
-import torch.nn.functional as F
-from transformers import BertForSequenceClassification, BertTokenizer
+from transformers import BatchEncoding
 import structlog
 
+from .backends import BackendConfig, create_backend, load_tokenizer
+
 logger = structlog.get_logger(__name__)
 
 
 class SensitiveTopicsModel:
     """Encapsulates the sensitive topics detection model and its logic."""
 
-    def __init__(self, model_name: str, device: torch.device):
+    max_length = 256
+
+    def __init__(
+        self,
+        model_name: str,
+        device: torch.device,
+        backend_config: BackendConfig | None = None,
+    ):
         logger.info(
             "Loading sensitive topics model...", model=model_name, device=str(device)
         )
         self.device = device
-        self.tokenizer = BertTokenizer.from_pretrained(model_name)
-        self.model = BertForSequenceClassification.from_pretrained(model_name).to(
-            self.device
-        )
-        self.model.eval()
+        backend_config = backend_config or BackendConfig()
+        self.tokenizer = load_tokenizer(model_name, backend_config)
+        self.backend = create_backend(model_name, device, backend_config)
 
         topic_file = Path(__file__).parent.parent / "id2topic.json"
         with topic_file.open() as f:
@@ -29,31 +35,18 @@ class SensitiveTopicsModel:
 
         logger.info("Sensitive topics model loaded successfully.")
 
-    def predict(
-        self, texts: List[str], threshold: float = 0.1
+    def predict_encoded(
+        self, encoded: BatchEncoding, threshold: float = 0.1
     ) -> List[Dict[str, float]]:
         """
-        Predicts sensitive topics for a batch of texts.
+        Runs the model on an already tokenized and padded batch.
 
         Returns:
             A list of dictionaries, where each key is a topic and value is its score,
             filtered by the threshold.
             e.g., [{'politics': 0.87, 'insults': 0.23}, {}, ...]
         """
-        if not texts:
-            return []
-
-        with torch.no_grad():
-            encoded = self.tokenizer.batch_encode_plus(
-                texts,
-                max_length=256,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-            ).to(self.device)
-
-            outputs = self.model(**encoded)
-            probabilities = F.softmax(outputs.logits, dim=-1).cpu().numpy()
+        probabilities = self.backend.probabilities(encoded)
 
         return [
             {
@@ -63,3 +56,21 @@ class SensitiveTopicsModel:
             }
             for probs in probabilities
         ]
+
+    def predict(
+        self, texts: List[str], threshold: float = 0.1
+    ) -> List[Dict[str, float]]:
+        """
+        Predicts sensitive topics for a batch of texts, tokenizing them on its own.
+        See `predict_encoded` for the output format.
+        """
+        if not texts:
+            return []
+        encoded = self.tokenizer(
+            texts,
+            max_length=self.max_length,
+            padding=True,
+            truncation=True,
+            return_tensors="pt",
+        )
+        return self.predict_encoded(encoded, threshold)
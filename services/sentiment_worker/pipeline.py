@@ -0,0 +1,173 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+import structlog
+
+from transport import QueueEntry
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class WorkBatch:
+    """A batch of jobs travelling through the read -> infer -> write stages."""
+
+    entries: List[QueueEntry]
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    read_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class StageStats:
+    """Running counters for a single pipeline stage."""
+
+    name: str
+    batches: int = 0
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    _window_items: int = 0
+    _window_busy: float = 0.0
+    _window_started: float = field(default_factory=time.monotonic)
+
+    def record(self, items: int, busy_seconds: float):
+        self.batches += 1
+        self.items += items
+        self.busy_seconds += busy_seconds
+        self._window_items += items
+        self._window_busy += busy_seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns totals plus throughput and utilisation since the last snapshot."""
+        now = time.monotonic()
+        elapsed = max(now - self._window_started, 1e-9)
+        snapshot = {
+            "batches": self.batches,
+            "items": self.items,
+            "errors": self.errors,
+            "items_per_sec": round(self._window_items / elapsed, 2),
+            "busy_ratio": round(min(self._window_busy / elapsed, 1.0), 3),
+        }
+        self._window_items = 0
+        self._window_busy = 0.0
+        self._window_started = now
+        return snapshot
+
+
+class StagePipeline:
+    """
+    Connects the read, infer and write stages of the worker with bounded queues.
+
+    `read` returns the next batch, or None when there was nothing to read.
+    `infer` fills in the results of a batch, and `write` persists and
+    acknowledges it. A full queue blocks the stage in front of it, so at most
+    `prefetch_batches` batches wait between two stages. `infer` runs as
+    `inference_workers` concurrent copies. A batch whose infer or write step
+    raises is handed to `on_failure` and not retried here.
+
+    `stop` ends reading. `run` then returns once every batch already read has
+    been written or has failed, so nothing is left behind in the queues.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Awaitable[WorkBatch | None]],
+        infer: Callable[[WorkBatch], Awaitable[None]],
+        write: Callable[[WorkBatch], Awaitable[None]],
+        on_failure: Callable[[WorkBatch], Awaitable[None]],
+        inference_workers: int = 1,
+        prefetch_batches: int = 2,
+        error_sleep: float = 5.0,
+    ):
+        self._read = read
+        self._infer = infer
+        self._write = write
+        self._on_failure = on_failure
+        self.inference_workers = max(1, inference_workers)
+        self.error_sleep = error_sleep
+        self.is_running = True
+        self.inference_queue: asyncio.Queue[WorkBatch] = asyncio.Queue(
+            maxsize=max(prefetch_batches, self.inference_workers)
+        )
+        self.write_queue: asyncio.Queue[WorkBatch] = asyncio.Queue(
+            maxsize=prefetch_batches
+        )
+        self.stats = {name: StageStats(name) for name in ("read", "infer", "write")}
+
+    def stop(self):
+        """Stops reading new batches; batches in flight still drain."""
+        self.is_running = False
+
+    async def _fail(self, batch: WorkBatch):
+        try:
+            await self._on_failure(batch)
+        except Exception:
+            logger.exception("Failed to release a failed batch.")
+
+    async def _read_stage(self):
+        while self.is_running:
+            try:
+                batch = await self._read()
+            except Exception:
+                self.stats["read"].errors += 1
+                logger.exception("Error in read stage, continuing...")
+                await asyncio.sleep(self.error_sleep)
+                continue
+            if batch is not None:
+                await self.inference_queue.put(batch)
+
+    async def _inference_stage(self):
+        stats = self.stats["infer"]
+        while True:
+            batch = await self.inference_queue.get()
+            try:
+                started = time.perf_counter()
+                await self._infer(batch)
+                stats.record(len(batch.items), time.perf_counter() - started)
+                await self.write_queue.put(batch)
+            except Exception:
+                stats.errors += 1
+                logger.exception(
+                    "Error in inference stage, dropping batch.",
+                    batch_size=len(batch.items),
+                )
+                await self._fail(batch)
+            finally:
+                self.inference_queue.task_done()
+
+    async def _write_stage(self):
+        stats = self.stats["write"]
+        while True:
+            batch = await self.write_queue.get()
+            try:
+                started = time.perf_counter()
+                await self._write(batch)
+                stats.record(len(batch.items), time.perf_counter() - started)
+            except Exception:
+                stats.errors += 1
+                logger.exception(
+                    "Error in write stage, batch left unacknowledged.",
+                    batch_size=len(batch.items),
+                )
+                await self._fail(batch)
+            finally:
+                self.write_queue.task_done()
+
+    async def run(self):
+        """Runs the stages until `stop` is called and the queues are drained."""
+        workers = [
+            asyncio.create_task(self._inference_stage())
+            for _ in range(self.inference_workers)
+        ]
+        workers.append(asyncio.create_task(self._write_stage()))
+        try:
+            await self._read_stage()
+            await self.inference_queue.join()
+            await self.write_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import redis.asyncio as redis
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from backfill import BackfillScanner
+from dedupe import NullDeduper
+from transport import SentimentQueue
+
+RESULT_METADATA_FIELDS = (
+    "sensitive_topics",
+    "fast_path",
+    "partial",
+    "model_version",
+    "rolled_up",
+)
+
+
+def previous_result(sentiment: Dict[str, Any]) -> Dict[str, Any] | None:
+    """
+    Extracts the label scores and topics of a stored result, in the shape the
+    rollups need to take the old analysis back out of their counters. Returns
+    None for results that never reached the rollups, so the message is counted
+    as new instead.
+    """
+    if not sentiment.get("rolled_up"):
+        return None
+    return {
+        "sentiment": {
+            label: score
+            for label, score in sentiment.items()
+            if label not in RESULT_METADATA_FIELDS
+        },
+        "sensitive_topics": list(sentiment.get("sensitive_topics") or {}),
+    }
+
+
+class ReprocessScanner(BackfillScanner):
+    """
+    Re-enqueues messages analysed by an older model version.
+
+    Reuses the resumable `_id`-ordered scan of `BackfillScanner` with its own
+    checkpoint, over messages whose `sentiment.model_version` differs from the
+    current one (results written before versions were recorded included). Jobs
+    go to the lowest-priority lane and carry the stored result if it was counted,
+    so the rollups replace its contribution instead of counting the message twice.
+
+    Live traffic always comes first: the scanner only enqueues while the live
+    lane is empty, and never faster than `rate_per_second` messages.
+    """
+
+    name = "reprocess"
+    checkpoint_key = "sentiment_reprocess_state"
+    projection: Tuple[str, ...] = BackfillScanner.projection + ("sentiment",)
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        redis_client: redis.Redis,
+        queue: SentimentQueue,
+        live_queue: SentimentQueue,
+        version: str,
+        rate_per_second: float = 50.0,
+        batch_size: int = 200,
+        max_queue_depth: int = 1000,
+        progress_interval_seconds: float = 30.0,
+        idle_sleep: float = 1.0,
+    ):
+        super().__init__(
+            collection,
+            redis_client,
+            queue,
+            deduper=NullDeduper(),
+            batch_size=batch_size,
+            max_queue_depth=max_queue_depth,
+            progress_interval_seconds=progress_interval_seconds,
+        )
+        self.live_queue = live_queue
+        self.version = version
+        self.rate_per_second = rate_per_second
+        self.idle_sleep = idle_sleep
+        self._next_batch_at = 0.0
+
+    async def ensure_index(self):
+        return None
+
+    def _range_filter(self, after: ObjectId | None) -> Dict[str, Any]:
+        query: Dict[str, Any] = {
+            "sentiment": {"$ne": None},
+            "sentiment.model_version": {"$ne": self.version},
+        }
+        if after is not None:
+            query["_id"] = {"$gt": after}
+        return query
+
+    async def _wait_for_queue_room(self, is_running: Callable[[], bool]):
+        while is_running():
+            delay = self._next_batch_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if (
+                await self.live_queue.depth() == 0
+                and await self.queue.depth() <= self.max_queue_depth
+            ):
+                break
+            await asyncio.sleep(self.idle_sleep)
+        self._next_batch_at = time.monotonic() + self.batch_size / self.rate_per_second
+
+    def _payload(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **super()._payload(doc),
+            "previous": previous_result(doc.get("sentiment") or {}),
+        }
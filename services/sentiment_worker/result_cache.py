@@ -0,0 +1,153 @@
+import hashlib
+import json
+import re
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+
+import redis.asyncio as redis
+import structlog
+from redis.exceptions import RedisError
+
+import metrics
+
+logger = structlog.get_logger(__name__)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Folds trivial variations (unicode forms, case, whitespace) of the same message."""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def text_key(text: str) -> str:
+    """Returns the cache key for a message text."""
+    return hashlib.blake2b(
+        normalize_text(text).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how much inference the cache avoided."""
+
+    lookups: int = 0
+    local_hits: int = 0
+    redis_hits: int = 0
+    batch_duplicates: int = 0
+    saved_inferences: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.lookups:
+            return 0.0
+        return (self.local_hits + self.redis_hits) / self.lookups
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "batch_duplicates": self.batch_duplicates,
+            "saved_inferences": self.saved_inferences,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResultCache:
+    """
+    Analysis results keyed by a hash of the normalized message text.
+
+    Lookups go through a bounded in-process LRU first and, when a Redis client is
+    given, a shared Redis tier second, so replicas benefit from each other's work.
+    `namespace` should change whenever the models do, which orphans old entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        namespace: str,
+        redis_client: redis.Redis | None = None,
+        redis_ttl_seconds: int = 7 * 24 * 3600,
+        max_text_length: int = 256,
+    ):
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.redis = redis_client
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.max_text_length = max_text_length
+        self.stats = CacheStats()
+        self._local: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def is_cacheable(self, text: str) -> bool:
+        """Long texts almost never repeat, so they are not worth the memory."""
+        return len(text) <= self.max_text_length
+
+    def _redis_key(self, key: str) -> str:
+        return f"sentiment_cache:{self.namespace}:{key}"
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        self._local[key] = result
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns cached results for the given keys; missing keys are omitted."""
+        found: Dict[str, Dict[str, Any]] = {}
+        remote: List[str] = []
+        for key in keys:
+            self.stats.lookups += 1
+            metrics.CACHE_LOOKUPS.inc()
+            result = self._local.get(key)
+            if result is None:
+                remote.append(key)
+                continue
+            self._local.move_to_end(key)
+            found[key] = result
+            self.stats.local_hits += 1
+            metrics.CACHE_HITS.labels(tier="local").inc()
+
+        if remote and self.redis is not None:
+            try:
+                values = await self.redis.mget([self._redis_key(key) for key in remote])
+            except RedisError as e:
+                logger.warning("Result cache lookup in Redis failed.", error=str(e))
+                return found
+            for key, value in zip(remote, values):
+                if value is None:
+                    continue
+                result = json.loads(value)
+                self._remember(key, result)
+                found[key] = result
+                self.stats.redis_hits += 1
+                metrics.CACHE_HITS.labels(tier="redis").inc()
+        return found
+
+    async def put_many(self, results: Dict[str, Dict[str, Any]]):
+        """Stores freshly computed results in both tiers."""
+        for key, result in results.items():
+            self._remember(key, result)
+        if results and self.redis is not None:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, result in results.items():
+                pipe.set(
+                    self._redis_key(key), json.dumps(result), ex=self.redis_ttl_seconds
+                )
+            try:
+                await pipe.execute()
+            except RedisError as e:
+                logger.warning("Result cache write to Redis failed.", error=str(e))
+
+
+def cache_namespace(*model_names: str) -> str:
+    """
+    Derives a short tag from the models (and settings) that produce the results.
+    Also serves as the `model_version` stored with each result.
+    """
+    return hashlib.blake2b("|".join(model_names).encode(), digest_size=6).hexdigest()
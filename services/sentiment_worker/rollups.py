@@ -0,0 +1,126 @@
+import hashlib
+import json
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
+
+GRANULARITIES = ("hour", "day")
+
+
+def parse_job_date(value: Any) -> datetime | None:
+    """Reads the message date carried by a job as an aware UTC datetime."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def bucket_start(date: datetime, granularity: str) -> datetime:
+    start = date.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        start = start.replace(hour=0)
+    return start
+
+
+async def ensure_rollup_indexes(
+    collection: AsyncIOMotorCollection,
+    markers_collection: AsyncIOMotorCollection,
+    marker_ttl_seconds: int,
+):
+    await collection.create_index(
+        [("chat_id", ASCENDING), ("granularity", ASCENDING), ("bucket", ASCENDING)],
+        unique=True,
+        name="chat_granularity_bucket",
+    )
+    await markers_collection.create_index(
+        "applied_at", expireAfterSeconds=marker_ttl_seconds, name="applied_at_ttl"
+    )
+
+
+def rollup_marker_id(item: Dict[str, Any]) -> str:
+    """
+    Identifies the rollup contribution of one job. A redelivered job maps to the
+    same id, while reprocessing a message again after its stored result changed
+    does not.
+    """
+    previous = item.get("previous")
+    if previous is None:
+        return str(item["_id"])
+    digest = hashlib.blake2b(
+        json.dumps(previous, sort_keys=True).encode(), digest_size=8
+    ).hexdigest()
+    return f"{item['_id']}:{digest}"
+
+
+def build_rollup_markers(items: List[Dict[str, Any]]) -> List[UpdateOne]:
+    """
+    Builds one insert-if-absent per job. In the bulk write result, the indexes
+    in `upserted_ids` are the jobs whose contribution is not applied yet.
+    """
+    now = datetime.now(timezone.utc)
+    return [
+        UpdateOne(
+            {"_id": rollup_marker_id(item)},
+            {"$setOnInsert": {"applied_at": now}},
+            upsert=True,
+        )
+        for item in items
+    ]
+
+
+def build_rollup_updates(
+    items: List[Dict[str, Any]], results: List[Dict[str, Any]]
+) -> List[UpdateOne]:
+    """
+    Folds a batch of analysis results into per-chat hourly and daily counters.
+
+    Every (chat, granularity, bucket) touched by the batch becomes one `$inc`
+    upsert holding the message count, the summed score of every sentiment label
+    and the number of messages flagged with each sensitive topic. Jobs without a
+    chat id or a date are left out. Reprocessing jobs carry the `previous`
+    result, which is subtracted instead of counting the message again. Callers
+    pass only the jobs claimed through `build_rollup_markers`, so a redelivered
+    job is not counted twice.
+    """
+    increments: Dict[Tuple[int, str, datetime], Dict[str, float]] = defaultdict(
+        lambda: defaultdict(float)
+    )
+    for item, analysis in zip(items, results):
+        chat_id = item.get("chat_id")
+        date = parse_job_date(item.get("date"))
+        if chat_id is None or date is None:
+            continue
+        for granularity in GRANULARITIES:
+            counters = increments[
+                (chat_id, granularity, bucket_start(date, granularity))
+            ]
+            previous = item.get("previous")
+            if previous is None:
+                counters["messages"] += 1
+            else:
+                for label, score in previous["sentiment"].items():
+                    counters[f"sentiment.{label}"] -= score
+                for topic in previous["sensitive_topics"]:
+                    counters[f"topics.{topic}"] -= 1
+            for label, score in analysis["sentiment"].items():
+                counters[f"sentiment.{label}"] += score
+            for topic in analysis["sensitive_topics"]:
+                counters[f"topics.{topic}"] += 1
+
+    return [
+        UpdateOne(
+            {"chat_id": chat_id, "granularity": granularity, "bucket": bucket},
+            {"$inc": dict(counters)},
+            upsert=True,
+        )
+        for (chat_id, granularity, bucket), counters in increments.items()
+    ]
@@ -0,0 +1,280 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Protocol, Set
+
+import redis.asyncio as redis
+import structlog
+from redis.exceptions import ResponseError
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class QueueEntry:
+    """A single job read from the sentiment queue."""
+
+    data: str
+    entry_id: str | None = None
+    lane: str | None = None
+
+
+class SentimentQueue(Protocol):
+    """
+    Defines the interface for the transport carrying sentiment jobs.
+    Producers enqueue JSON payloads, the worker reads and acknowledges them.
+    """
+
+    async def setup(self) -> None: ...
+
+    async def enqueue(self, payloads: List[str]) -> None: ...
+
+    async def read(self, count: int, wait: bool = True) -> List[QueueEntry]:
+        """
+        Returns up to `count` entries. With `wait`, an empty transport is waited
+        on for a short while instead of returning immediately.
+        """
+        ...
+
+    async def ack(self, entries: List[QueueEntry]) -> None: ...
+
+    async def release(self, entries: List[QueueEntry]) -> None:
+        """
+        Gives up on entries that were read but could not be processed, leaving
+        them to be redelivered.
+        """
+        ...
+
+    async def depth(self) -> int: ...
+
+
+class ListQueue:
+    """
+    The original Redis list transport: LPUSH on the producer side and LPOP here.
+    Jobs are removed on read, so a crash before the write loses them.
+    """
+
+    def __init__(self, redis_client: redis.Redis, name: str, idle_sleep: float = 1.0):
+        self.redis = redis_client
+        self.name = name
+        self.idle_sleep = idle_sleep
+
+    async def setup(self) -> None:
+        return None
+
+    async def enqueue(self, payloads: List[str]) -> None:
+        if payloads:
+            await self.redis.lpush(self.name, *payloads)
+
+    async def read(self, count: int, wait: bool = True) -> List[QueueEntry]:
+        batch_data = await self.redis.lpop(self.name, count)
+        if not batch_data:
+            if wait:
+                await asyncio.sleep(self.idle_sleep)
+            return []
+        if not isinstance(batch_data, list):
+            batch_data = [batch_data]
+        return [QueueEntry(data=data) for data in batch_data]
+
+    async def ack(self, entries: List[QueueEntry]) -> None:
+        return None
+
+    async def release(self, entries: List[QueueEntry]) -> None:
+        return None
+
+    async def depth(self) -> int:
+        return await self.redis.llen(self.name)
+
+
+class StreamQueue:
+    """
+    Redis Streams transport backed by a consumer group.
+
+    Entries stay in the group's pending list until `ack` is called after the
+    results are persisted, so a crashed worker resumes from its own pending entries
+    on restart, and entries left idle by a dead replica are taken over with
+    XAUTOCLAIM. Acknowledged entries are deleted to keep the stream small.
+
+    Each entry is handed out at most once while it is in flight: the own pending
+    list is walked forward once after a restart, and reclaimed entries that this
+    consumer is still processing are skipped. An entry delivered more than
+    `max_deliveries` times (e.g. one that crashes the worker) is acknowledged
+    and moved to `dead_letter_stream` instead of being processed again.
+    """
+
+    PAYLOAD_FIELD = "data"
+    DEAD_LETTER_MAXLEN = 10000
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        stream: str,
+        group: str,
+        consumer: str,
+        block_ms: int = 5000,
+        claim_idle_ms: int = 60000,
+        max_deliveries: int = 5,
+        dead_letter_stream: str | None = None,
+    ):
+        self.redis = redis_client
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+        self.dead_letter_stream = dead_letter_stream or f"{stream}:dead"
+        self._pending_cursor: str | None = "0"
+        self._claim_cursor = "0-0"
+        self._last_claim_at = 0.0
+        self._in_flight: Set[str] = set()
+        self._log = logger.bind(stream=stream, group=group, consumer=consumer)
+
+    async def setup(self) -> None:
+        try:
+            await self.redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+            self._log.info("Created consumer group for sentiment stream.")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def enqueue(self, payloads: List[str]) -> None:
+        if not payloads:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for payload in payloads:
+            pipe.xadd(self.stream, {self.PAYLOAD_FIELD: payload})
+        await pipe.execute()
+
+    def _to_entries(self, messages) -> List[QueueEntry]:
+        return [
+            QueueEntry(data=fields[self.PAYLOAD_FIELD], entry_id=entry_id)
+            for entry_id, fields in messages
+            if fields and self.PAYLOAD_FIELD in fields
+        ]
+
+    async def _drop_poisoned(self, entries: List[QueueEntry]) -> List[QueueEntry]:
+        """
+        Moves redelivered entries that exceeded `max_deliveries` to the
+        dead-letter stream and returns the others.
+        """
+        if not entries:
+            return entries
+        pending = await self.redis.xpending_range(
+            self.stream,
+            self.group,
+            min=entries[0].entry_id,
+            max=entries[-1].entry_id,
+            count=len(entries),
+            consumername=self.consumer,
+        )
+        deliveries = {p["message_id"]: p["times_delivered"] for p in pending}
+        poisoned = [
+            entry
+            for entry in entries
+            if deliveries.get(entry.entry_id, 0) > self.max_deliveries
+        ]
+        if not poisoned:
+            return entries
+        pipe = self.redis.pipeline(transaction=False)
+        for entry in poisoned:
+            pipe.xadd(
+                self.dead_letter_stream,
+                {
+                    self.PAYLOAD_FIELD: entry.data,
+                    "entry_id": entry.entry_id,
+                    "deliveries": deliveries[entry.entry_id],
+                },
+                maxlen=self.DEAD_LETTER_MAXLEN,
+                approximate=True,
+            )
+        poisoned_ids = [entry.entry_id for entry in poisoned]
+        pipe.xack(self.stream, self.group, *poisoned_ids)
+        pipe.xdel(self.stream, *poisoned_ids)
+        await pipe.execute()
+        self._log.error(
+            "Moved repeatedly failing sentiment entries to the dead-letter stream.",
+            count=len(poisoned),
+            dead_letter_stream=self.dead_letter_stream,
+            entry_ids=poisoned_ids,
+        )
+        skipped = set(poisoned_ids)
+        return [entry for entry in entries if entry.entry_id not in skipped]
+
+    async def _take(self, entries: List[QueueEntry]) -> List[QueueEntry]:
+        """Skips entries already in flight and marks the rest as in flight."""
+        entries = [e for e in entries if e.entry_id not in self._in_flight]
+        entries = await self._drop_poisoned(entries)
+        self._in_flight.update(entry.entry_id for entry in entries)
+        return entries
+
+    async def _read_own_pending(self, count: int) -> List[QueueEntry]:
+        response = await self.redis.xreadgroup(
+            self.group, self.consumer, {self.stream: self._pending_cursor}, count=count
+        )
+        messages = response[0][1] if response else []
+        if not messages:
+            self._pending_cursor = None
+            return []
+        self._pending_cursor = messages[-1][0]
+        entries = await self._take(self._to_entries(messages))
+        if entries:
+            self._log.info("Resuming own pending entries.", count=len(entries))
+        return entries
+
+    async def _claim_stale(self, count: int) -> List[QueueEntry]:
+        result = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            start_id=self._claim_cursor,
+            count=count,
+        )
+        self._claim_cursor = result[0]
+        entries = await self._take(self._to_entries(result[1]))
+        if entries:
+            self._log.warning("Reclaimed stale sentiment entries.", count=len(entries))
+        return entries
+
+    async def read(self, count: int, wait: bool = True) -> List[QueueEntry]:
+        while self._pending_cursor is not None:
+            entries = await self._read_own_pending(count)
+            if entries:
+                return entries
+
+        now = time.monotonic()
+        if now - self._last_claim_at >= self.claim_idle_ms / 1000:
+            self._last_claim_at = now
+            entries = await self._claim_stale(count)
+            if entries:
+                return entries
+
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: ">"},
+            count=count,
+            block=self.block_ms if wait else None,
+        )
+        entries = self._to_entries(response[0][1]) if response else []
+        self._in_flight.update(entry.entry_id for entry in entries)
+        return entries
+
+    async def ack(self, entries: List[QueueEntry]) -> None:
+        entry_ids = [entry.entry_id for entry in entries if entry.entry_id]
+        if not entry_ids:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.xack(self.stream, self.group, *entry_ids)
+        pipe.xdel(self.stream, *entry_ids)
+        await pipe.execute()
+        self._in_flight.difference_update(entry_ids)
+
+    async def release(self, entries: List[QueueEntry]) -> None:
+        self._in_flight.difference_update(entry.entry_id for entry in entries)
+
+    async def depth(self) -> int:
+        return await self.redis.xlen(self.stream)
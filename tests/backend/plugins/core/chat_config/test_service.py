@@ -0,0 +1,103 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.backend.plugins.core.chat_config.service import ChatConfigService
+
+
+@pytest.fixture
+def mock_repository() -> AsyncMock:
+    """Provides a mock for the ChatConfigRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    """Provides a mock for the async Redis client with a recording pipeline."""
+    redis_client = AsyncMock()
+    redis_client.pipeline = MagicMock()
+    redis_client.pipeline.return_value.execute = AsyncMock()
+    redis_client.register_script = MagicMock(return_value=AsyncMock())
+    return redis_client
+
+
+@pytest.fixture
+def chat_config_service(
+    mock_repository: AsyncMock, mock_redis: AsyncMock
+) -> ChatConfigService:
+    return ChatConfigService(mock_repository, mock_redis)
+
+
+@pytest.mark.asyncio
+async def test_get_config_reads_loaded_chat_from_hash(
+    chat_config_service: ChatConfigService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that a cached chat is served from its hash, including parameters that
+    are not set, without touching the database.
+    """
+    mock_redis.hmget.return_value = [json.dumps(False), "1"]
+    config = await chat_config_service.get_config(-100, "nsfw_enabled")
+    assert config.param_value is False
+
+    mock_redis.hmget.return_value = [None, "1"]
+    assert await chat_config_service.get_config(-100, "unset_param") is None
+
+    mock_redis.hmget.assert_awaited_with(
+        "chat_config:-100", ["unset_param", ChatConfigService.LOADED_FIELD]
+    )
+    mock_repository.find_all_configs_for_chat.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_all_configs_loads_chat_without_overwriting_newer_fields(
+    chat_config_service: ChatConfigService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that a cache miss loads the whole chat once and fills the hash with
+    HSETNX, so a value written through concurrently is kept.
+    """
+    mock_redis.hgetall.return_value = {}
+    mock_repository.find_all_configs_for_chat.return_value = [
+        {"chat_id": -100, "param_name": "nsfw_enabled", "param_value": True},
+        {"chat_id": -100, "param_name": "summary_roast", "param_value": "off"},
+    ]
+
+    configs = await chat_config_service.get_all_configs_for_chat(-100)
+
+    assert configs == {"nsfw_enabled": True, "summary_roast": "off"}
+    pipe = mock_redis.pipeline.return_value
+    assert [c.args for c in pipe.hsetnx.call_args_list] == [
+        ("chat_config:-100", "nsfw_enabled", "true"),
+        ("chat_config:-100", "summary_roast", '"off"'),
+    ]
+    pipe.hset.assert_called_once_with(
+        "chat_config:-100", ChatConfigService.LOADED_FIELD, "1"
+    )
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_config_writes_through_only_to_loaded_chats(
+    mock_repository: AsyncMock,
+):
+    """
+    Tests that a write updates the hash of a cached chat but does not create a
+    hash, without marker or expiry, for a chat that was never loaded.
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    service = ChatConfigService(mock_repository, client)
+    await client.hset("chat_config:-100", ChatConfigService.LOADED_FIELD, "1")
+
+    await service.set_config(-100, "nsfw_enabled", True)
+    await service.set_config(-200, "nsfw_enabled", True)
+
+    assert await client.hget("chat_config:-100", "nsfw_enabled") == "true"
+    assert not await client.exists("chat_config:-200")
@@ -0,0 +1,126 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from utils.local_cache import LocalTTLCache
+
+from services.backend.plugins.core.config.models import ConfigItem, SetConfigRequest
+from services.backend.plugins.core.config.service import ConfigService
+
+
+@pytest.fixture
+def mock_repository() -> AsyncMock:
+    """Provides a mock for the ConfigRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    """Provides a mock for the async Redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def config_service(mock_repository: AsyncMock, mock_redis: AsyncMock) -> ConfigService:
+    cache = LocalTTLCache(name="config", max_size=16, ttl_seconds=60)
+    return ConfigService(mock_repository, mock_redis, local_cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_get_serves_repeated_reads_from_local_cache(
+    config_service: ConfigService, mock_redis: AsyncMock
+):
+    """
+    Tests that only the first read of a key reaches Redis, and that callers get
+    their own copy of a cached value.
+    """
+    mock_redis.get.return_value = json.dumps(["a", "b"])
+
+    first = await config_service.get("plugin.blacklist")
+    first.append("mutated")
+    second = await config_service.get("plugin.blacklist")
+
+    assert second == ["a", "b"]
+    mock_redis.get.assert_awaited_once_with("config:plugin.blacklist")
+
+
+@pytest.mark.asyncio
+async def test_set_invalidates_local_cache_and_notifies_replicas(
+    config_service: ConfigService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that a write evicts the key locally and publishes it for other replicas.
+    """
+    mock_redis.get.return_value = json.dumps(1)
+    assert await config_service.get("plugin.limit") == 1
+    mock_repository.upsert_config.return_value = ConfigItem(key="plugin.limit", value=2)
+
+    await config_service.set(SetConfigRequest(key="plugin.limit", value=2))
+
+    mock_redis.publish.assert_awaited_once_with(
+        ConfigService.INVALIDATION_CHANNEL, "plugin.limit"
+    )
+    mock_redis.get.return_value = json.dumps(2)
+    assert await config_service.get("plugin.limit") == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_batches_cache_and_database_round_trips(
+    config_service: ConfigService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that keys are read with one MGET, misses with one database query, and
+    that only keys absent from the database are created, in one bulk write.
+    """
+    mock_redis.mget.return_value = [json.dumps(5), None, None]
+    mock_redis.get.return_value = None
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.execute = AsyncMock()
+    mock_repository.get_config.return_value = None
+    mock_repository.get_configs.return_value = {
+        "b": ConfigItem(key="b", value="stored")
+    }
+    mock_repository.insert_missing_configs.return_value = {
+        "c": ConfigItem(key="c", value=[1])
+    }
+
+    values = await config_service.get_or_create_many(
+        {"a": (1, None), "b": ("default", None), "c": ([1], "List value.")}
+    )
+
+    assert values == {"a": 5, "b": "stored", "c": [1]}
+    mock_redis.mget.assert_awaited_once_with(["config:a", "config:b", "config:c"])
+    mock_repository.get_configs.assert_awaited_once_with(["b", "c"])
+    mock_repository.insert_missing_configs.assert_awaited_once_with(
+        {"c": ([1], "List value.")}
+    )
+    mock_repository.get_config.assert_awaited_once_with(ConfigService.TTL_CONFIG_KEY)
+    mock_redis.pipeline.return_value.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_loads_ttl_key_present_only_in_database(
+    config_service: ConfigService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that a TTL key found only in the database is used to cache itself and
+    the requested key, without looking the TTL up again.
+    """
+    mock_redis.get.return_value = None
+    mock_repository.get_config.side_effect = lambda key: ConfigItem(
+        key=key, value=300 if key == ConfigService.TTL_CONFIG_KEY else "on"
+    )
+
+    assert await config_service.get("plugin.mode") == "on"
+
+    assert mock_repository.get_config.await_count == 2
+    mock_redis.set.assert_any_await(
+        f"config:{ConfigService.TTL_CONFIG_KEY}", json.dumps(300), ex=300
+    )
+    mock_redis.set.assert_any_await("config:plugin.mode", json.dumps("on"), ex=300)
@@ -0,0 +1,85 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from bson import ObjectId
+
+from services.backend.plugins.core.messages.service import MessageService
+
+
+@pytest.fixture
+def mock_repository() -> AsyncMock:
+    """Provides a mock for the MessageRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    """Provides a mock for the async Redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def message_service(
+    mock_repository: AsyncMock, mock_redis: AsyncMock
+) -> MessageService:
+    return MessageService(repository=mock_repository, redis_client=mock_redis)
+
+
+def _make_message(text: str, chat_type: str = "ChatType.SUPERGROUP") -> dict:
+    return {
+        "_": "Message",
+        "chat": {"id": -100, "type": chat_type},
+        "from_user": {"id": 1, "is_bot": False},
+        "date": "2025-01-01T12:00:00",
+        "text": text,
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_and_process_messages_enqueues_in_one_push(
+    message_service: MessageService,
+    mock_repository: AsyncMock,
+    mock_redis: AsyncMock,
+):
+    """
+    Tests that a batch is written with one repository call and that only the
+    analysable, successfully inserted messages reach the queue in a single LPUSH.
+    """
+    first_id, second_id = ObjectId(), ObjectId()
+    messages = [
+        _make_message("привет"),
+        _make_message("/command"),
+        _make_message("dm text", chat_type="ChatType.PRIVATE"),
+        _make_message("rejected by mongo"),
+        _make_message("пока"),
+    ]
+    mock_repository.save_many.return_value = [
+        first_id,
+        ObjectId(),
+        ObjectId(),
+        None,
+        second_id,
+    ]
+
+    saved_ids = await message_service.save_and_process_messages(messages)
+
+    assert len(saved_ids) == 4
+    mock_repository.save_many.assert_awaited_once_with(messages)
+    mock_redis.lpush.assert_awaited_once()
+    queue_name, *payloads = mock_redis.lpush.call_args.args
+    assert queue_name == MessageService.SENTIMENT_QUEUE_NAME
+    assert [json.loads(p) for p in payloads] == [
+        {
+            "_id": str(first_id),
+            "text": "привет",
+            "date": "2025-01-01T12:00:00",
+            "chat_id": -100,
+        },
+        {
+            "_id": str(second_id),
+            "text": "пока",
+            "date": "2025-01-01T12:00:00",
+            "chat_id": -100,
+        },
+    ]
@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from utils.local_cache import MISSING, CacheInvalidationListener, LocalTTLCache
+
+
+def test_entries_expire_and_least_recently_used_is_evicted():
+    """
+    Tests that entries expire after the TTL and that the least recently used
+    entry is evicted once the cache is full.
+    """
+    cache = LocalTTLCache(name="test", max_size=2, ttl_seconds=10)
+    with patch("kurisu_core.local_cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", None)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+    with patch("kurisu_core.local_cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is MISSING
+    assert len(cache) == 1
+
+
+def test_set_is_dropped_after_a_racing_invalidation():
+    """
+    Tests that a value loaded before an invalidation is not stored, and that a
+    listener message evicts a key or clears the whole cache.
+    """
+    cache = LocalTTLCache(name="test", max_size=10, ttl_seconds=10)
+    listener = CacheInvalidationListener(None, {"channel": cache})
+    version = cache.version
+    listener.handle("channel", "a")
+    cache.set("a", "stale", version)
+    assert cache.get("a") is MISSING
+
+    cache.set("a", 1, cache.version)
+    cache.set("b", 2)
+    listener.handle("channel", "a")
+    assert cache.get("a") is MISSING
+    assert cache.get("b") == 2
+    listener.handle("channel", CacheInvalidationListener.CLEAR_ALL)
+    assert cache.get("b") is MISSING
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from utils.exceptions import TooManyRequestsError
+from utils.write_buffer import WriteBehindBuffer
+
+
+def _make_buffer(flush_func, **overrides) -> WriteBehindBuffer:
+    options = {"flush_size": 3, "flush_interval_seconds": 60, "max_size": 5}
+    options.update(overrides)
+    return WriteBehindBuffer(name="test", flush_func=flush_func, **options)
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_items_in_chunks():
+    """
+    Tests that a manual flush hands items to the callback in chunks of `flush_size`.
+    """
+    flush_func = AsyncMock()
+    buffer = _make_buffer(flush_func)
+    buffer.add_many([1, 2, 3, 4])
+
+    assert await buffer.flush() is True
+
+    assert [c.args[0] for c in flush_func.await_args_list] == [[1, 2, 3], [4]]
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_add_rejects_when_full():
+    """
+    Tests that writes beyond `max_size` are rejected with a 429 instead of growing memory.
+    """
+    buffer = _make_buffer(AsyncMock())
+    buffer.add_many([1, 2, 3, 4, 5])
+
+    with pytest.raises(TooManyRequestsError):
+        buffer.add(6)
+
+    assert len(buffer) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_items_for_retry():
+    """
+    Tests that a failing chunk is put back at the head of the buffer.
+    """
+    flush_func = AsyncMock(side_effect=[RuntimeError("mongo down"), None])
+    buffer = _make_buffer(flush_func)
+    buffer.add_many([1, 2])
+
+    assert await buffer.flush() is False
+    assert len(buffer) == 2
+
+    assert await buffer.flush() is True
+    flush_func.assert_awaited_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_chunk_is_dropped_after_max_attempts():
+    """
+    Tests that a chunk failing `max_attempts` times is dropped so later chunks
+    are flushed instead of being blocked behind it.
+    """
+    flush_func = AsyncMock(side_effect=[RuntimeError("bad chunk")] * 2 + [None])
+    buffer = _make_buffer(flush_func, max_attempts=2)
+    buffer.add_many([1, 2, 3, 4])
+
+    assert await buffer.flush() is False
+    assert await buffer.flush() is True
+
+    flush_func.assert_awaited_with([4])
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_size_threshold_triggers_background_flush_and_close_drains():
+    """
+    Tests that reaching `flush_size` wakes the background loop and that close()
+    drains the remainder.
+    """
+    flush_func = AsyncMock()
+    buffer = _make_buffer(flush_func)
+    buffer.start()
+
+    buffer.add_many([1, 2, 3])
+    await asyncio.sleep(0.05)
+    flush_func.assert_awaited_once_with([1, 2, 3])
+
+    buffer.add(4)
+    await buffer.close()
+
+    flush_func.assert_awaited_with([4])
+    assert len(buffer) == 0
@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pyrogram")
+
+from pyrogram.enums import ChatType
+from utils import chat_config
+from utils.config_cache import (
+    CHAT_CONFIG_CHANNEL,
+    chat_config_cache,
+    config_cache_listener,
+)
+
+CHAT_ID = -100123
+
+
+class FakeBackend:
+    """Answers chat config reads with the current value, optionally held back."""
+
+    def __init__(self, values: dict):
+        self.values = values
+        self.calls = []
+        self.hold = None
+
+    async def get(self, path: str, message=None):
+        self.calls.append(path)
+        value = self.values[path.rsplit("/", 1)[-1]]
+        if self.hold is not None:
+            hold, self.hold = self.hold, None
+            await hold.wait()
+        return {"param_value": value}
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    chat_config_cache.clear()
+    chat_config_cache.active = True
+    fake = FakeBackend({"nsfw_enabled": False, "language": "en"})
+    monkeypatch.setattr(chat_config, "backend_client", fake)
+    yield fake
+    chat_config_cache.clear()
+    chat_config_cache.active = False
+
+
+def _message():
+    return SimpleNamespace(chat=SimpleNamespace(id=CHAT_ID, type=ChatType.SUPERGROUP))
+
+
+def test_invalidation_evicts_only_the_published_chat_param(backend):
+    async def scenario():
+        message = _message()
+        await chat_config.get_chat_config(message, "nsfw_enabled")
+        await chat_config.get_chat_config(message, "language")
+        backend.values["nsfw_enabled"] = True
+
+        config_cache_listener.handle(CHAT_CONFIG_CHANNEL, f"{CHAT_ID}:nsfw_enabled")
+
+        return (
+            await chat_config.get_chat_config(message, "nsfw_enabled"),
+            await chat_config.get_chat_config(message, "language"),
+        )
+
+    assert asyncio.run(scenario()) == (True, "en")
+    assert backend.calls == [
+        f"/core/chat_config/{CHAT_ID}/nsfw_enabled",
+        f"/core/chat_config/{CHAT_ID}/language",
+        f"/core/chat_config/{CHAT_ID}/nsfw_enabled",
+    ]
+
+
+def test_read_started_before_an_invalidation_does_not_overwrite_newer_value(backend):
+    async def scenario():
+        message = _message()
+        backend.hold = asyncio.Event()
+        release = backend.hold
+        stale_read = asyncio.create_task(
+            chat_config.get_chat_config(message, "nsfw_enabled")
+        )
+        await asyncio.sleep(0)
+
+        backend.values["nsfw_enabled"] = True
+        config_cache_listener.handle(CHAT_CONFIG_CHANNEL, f"{CHAT_ID}:nsfw_enabled")
+        fresh = await chat_config.get_chat_config(message, "nsfw_enabled")
+        release.set()
+        stale = await stale_read
+
+        return stale, fresh, await chat_config.get_chat_config(message, "nsfw_enabled")
+
+    assert asyncio.run(scenario()) == (False, True, True)
+    assert len(backend.calls) == 2
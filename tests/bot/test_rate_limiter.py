@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from utils.rate_limiter import RateLimiter
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+def _hits(limiter: RateLimiter, key: str, times: list) -> list:
+    async def scenario():
+        return [await limiter.hit(key, 3, 60, now=now) for now in times]
+
+    return asyncio.run(scenario())
+
+
+def test_allows_a_burst_then_refills_evenly():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    limiter = RateLimiter(client)
+
+    results = _hits(limiter, "ratelimit:cmd", [1000.0, 1000.0, 1000.0, 1000.0, 1019.0])
+    assert [r.allowed for r in results] == [True, True, True, False, False]
+    assert results[3].retry_after == pytest.approx(20.0)
+    assert results[4].retry_after == pytest.approx(1.0)
+
+    results = _hits(limiter, "ratelimit:cmd", [1020.0, 1020.0])
+    assert [r.allowed for r in results] == [True, False]
+    assert results[1].retry_after == pytest.approx(20.0)
+
+
+def test_denied_requests_do_not_consume_capacity_and_keys_expire():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    limiter = RateLimiter(client)
+
+    _hits(limiter, "ratelimit:cmd", [1000.0] * 10)
+    results = _hits(limiter, "ratelimit:cmd", [1020.0])
+    assert results[0].allowed
+
+    ttl = asyncio.run(client.pttl("ratelimit:cmd"))
+    assert 0 < ttl <= 60_000
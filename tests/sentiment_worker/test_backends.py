@@ -0,0 +1,59 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from ml.backends import OnnxBackend, TorchBackend, export_onnx, quantize_onnx
+
+
+@pytest.fixture(scope="module")
+def tiny_model():
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=128,
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=64,
+        num_labels=5,
+    )
+    return transformers.BertForSequenceClassification(config).eval()
+
+
+@pytest.fixture(scope="module")
+def onnx_path(tiny_model, tmp_path_factory):
+    return export_onnx(tiny_model, tmp_path_factory.mktemp("onnx") / "model.onnx")
+
+
+@pytest.fixture
+def padded_batch():
+    generator = torch.Generator().manual_seed(1)
+    input_ids = torch.randint(1, 128, (4, 24), generator=generator)
+    attention_mask = torch.ones_like(input_ids)
+    for row, length in enumerate((24, 17, 5, 1)):
+        input_ids[row, length:] = 0
+        attention_mask[row, length:] = 0
+    return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+
+def test_onnx_matches_torch(tiny_model, onnx_path, padded_batch):
+    """The exported fp32 graph should reproduce PyTorch probabilities, padding included."""
+    expected = TorchBackend(tiny_model, torch.device("cpu")).probabilities(padded_batch)
+    actual = OnnxBackend(onnx_path).probabilities(padded_batch)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+
+def test_quantized_onnx_stays_close_to_torch(tiny_model, onnx_path, padded_batch):
+    """Dynamic int8 quantization should only shift probabilities slightly."""
+    quantized = quantize_onnx(onnx_path, onnx_path.with_name("model.int8.onnx"))
+    expected = TorchBackend(tiny_model, torch.device("cpu")).probabilities(padded_batch)
+    actual = OnnxBackend(quantized).probabilities(padded_batch)
+
+    assert np.abs(actual - expected).max() < 0.05
+    np.testing.assert_allclose(actual.sum(axis=-1), 1.0, atol=1e-5)
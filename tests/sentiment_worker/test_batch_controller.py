@@ -0,0 +1,47 @@
+from batch_controller import AdaptiveBatchSizer
+
+
+def make_sizer(**overrides) -> AdaptiveBatchSizer:
+    options = dict(initial=64, min_size=16, max_size=1024, target_batch_seconds=2.0)
+    options.update(overrides)
+    return AdaptiveBatchSizer(**options)
+
+
+def test_backlog_grows_until_time_budget():
+    sizer = make_sizer()
+    sizer.observe(items=64, seconds=0.64)
+
+    sizes = [
+        sizer.decide(queue_depth=100_000, memory_headroom=0.8).size for _ in range(8)
+    ]
+
+    assert sizes[0] == 96
+    assert sizes[-1] == 200
+    assert all(b >= a for a, b in zip(sizes, sizes[1:]))
+
+
+def test_short_queue_shrinks_to_depth_within_bounds():
+    sizer = make_sizer(initial=512)
+
+    decision = sizer.decide(queue_depth=3, memory_headroom=0.8)
+
+    assert decision.action == "shrink"
+    assert decision.reason == "short_queue"
+    assert decision.size == 16
+
+
+def test_low_memory_halves_before_anything_else():
+    sizer = make_sizer(initial=256)
+
+    decision = sizer.decide(queue_depth=100_000, memory_headroom=0.05)
+
+    assert (decision.size, decision.reason) == (128, "low_memory")
+
+
+def test_slow_batches_shrink_to_budget():
+    sizer = make_sizer(initial=512)
+    sizer.observe(items=512, seconds=10.24)
+
+    decision = sizer.decide(queue_depth=100_000, memory_headroom=0.8)
+
+    assert (decision.size, decision.reason) == (100, "over_time_budget")
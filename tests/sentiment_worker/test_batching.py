@@ -0,0 +1,46 @@
+from ml.batching import clip_ids, padded_tokens, token_budget_batches
+
+
+def test_batches_respect_token_budget_and_row_limit():
+    lengths = [10, 12, 9, 15, 11, 14, 13, 16]
+
+    batches = token_budget_batches(lengths, max_tokens=48, max_rows=3, boundaries=[16])
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= 3
+        assert len(batch) * max(lengths[i] for i in batch) <= 48
+    assert [len(batch) for batch in batches] == [3, 3, 2]
+
+
+def test_budget_boundary_is_inclusive():
+    assert token_budget_batches([8] * 4, max_tokens=32, max_rows=10) == [[0, 1, 2, 3]]
+    assert token_budget_batches([8] * 4, max_tokens=31, max_rows=10) == [
+        [0, 1, 2],
+        [3],
+    ]
+
+
+def test_oversized_message_gets_its_own_batch():
+    lengths = [5, 600, 6]
+
+    batches = token_budget_batches(lengths, max_tokens=100, max_rows=8)
+
+    assert [1] in batches
+    assert sorted(map(sorted, batches)) == [[0, 2], [1]]
+
+
+def test_short_and_long_texts_never_share_a_batch():
+    lengths = [4, 200, 5, 180]
+
+    batches = token_budget_batches(
+        lengths, max_tokens=10_000, max_rows=64, boundaries=[16, 256]
+    )
+
+    assert batches == [[0, 2], [3, 1]]
+    assert padded_tokens(lengths, batches) == 2 * 5 + 2 * 200
+
+
+def test_clip_ids_keeps_the_closing_token():
+    assert clip_ids([101, 1, 2, 3, 102], 4) == [101, 1, 2, 102]
+    assert clip_ids([101, 1, 102], 4) == [101, 1, 102]
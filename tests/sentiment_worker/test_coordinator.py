@@ -0,0 +1,100 @@
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from ml.batching import DEFAULT_BUCKET_BOUNDARIES
+from ml.coordinator import ModelCoordinator
+from ml.sentiment import SentimentModel
+
+
+class FakeTokenizer:
+    """Encodes "<id> w w ..." as one token per word, every token being <id>."""
+
+    is_fast = False
+
+    def __call__(self, texts, max_length, truncation, padding):
+        return {
+            "input_ids": [
+                [int(text.split()[0])] * min(len(text.split()), max_length)
+                for text in texts
+            ]
+        }
+
+    def pad(self, inputs, padding, return_tensors):
+        return inputs["input_ids"]
+
+
+class FakeModel:
+    max_length = 8
+    tokenizer = FakeTokenizer()
+
+    def __init__(self, key: str):
+        self.key = key
+        self.batch_sizes = []
+
+    def predict_encoded(self, rows):
+        self.batch_sizes.append(len(rows))
+        return [{self.key: row[0]} for row in rows]
+
+
+def loaded(model) -> Future:
+    future = Future()
+    future.set_result(model)
+    return future
+
+
+def make_coordinator(models, partial_results=False, fast_path=None):
+    coordinator = ModelCoordinator.__new__(ModelCoordinator)
+    coordinator.partial_results = partial_results
+    coordinator.preprocessor = None
+    coordinator.fast_path = fast_path
+    coordinator.inference_batch_size = 2
+    coordinator.max_batch_tokens = 1000
+    coordinator.bucket_boundaries = DEFAULT_BUCKET_BOUNDARIES
+    coordinator._shared_tokenizer = None
+    coordinator._tokenizer_checked = True
+    coordinator._models = models
+    return coordinator
+
+
+def texts_of_lengths(*lengths):
+    return [f"{i} " + "w " * (n - 1) for i, n in enumerate(lengths)]
+
+
+def test_results_follow_input_order_across_micro_batches():
+    sentiment, topics = FakeModel("s"), FakeModel("t")
+    coordinator = make_coordinator(
+        {"sentiment": loaded(sentiment), "topics": loaded(topics)}
+    )
+
+    results = coordinator.analyze_batch(texts_of_lengths(7, 1, 12, 2, 6))
+
+    assert [r["sentiment"] for r in results] == [{"s": i} for i in range(5)]
+    assert [r["sensitive_topics"] for r in results] == [{"t": i} for i in range(5)]
+    assert max(sentiment.batch_sizes) <= 2
+    assert sum(sentiment.batch_sizes) == 5
+
+
+def test_falls_back_to_the_loaded_model_and_fast_path():
+    coordinator = make_coordinator(
+        {"sentiment": loaded(FakeModel("s")), "topics": Future()},
+        partial_results=True,
+        fast_path=lambda texts: ["positive" if t == "ок" else None for t in texts],
+    )
+
+    results = coordinator.analyze_batch(["0 w", "ок", "2 w w"])
+
+    assert results[0] == {
+        "sentiment": {"s": 0},
+        "sensitive_topics": {},
+        "partial": True,
+    }
+    assert results[1] == {
+        "sentiment": SentimentModel.fixed_result("positive"),
+        "sensitive_topics": {},
+        "fast_path": True,
+    }
+    assert results[2]["sentiment"] == {"s": 2} and results[2]["partial"]
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from dedupe import BloomDeduper, SetDeduper, bloom_parameters
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def test_bloom_parameters_match_textbook_sizing():
+    bits, hashes = bloom_parameters(10_000_000, 0.001)
+
+    assert 140_000_000 < bits < 150_000_000
+    assert hashes == 10
+
+
+@pytest.mark.parametrize(
+    "make_deduper",
+    [
+        lambda client: SetDeduper(client, "jobs"),
+        lambda client: BloomDeduper(client, "jobs:bloom", capacity=1000),
+    ],
+)
+def test_claim_skips_pending_messages(make_deduper):
+    deduper = make_deduper(fakeredis.FakeAsyncRedis(decode_responses=True))
+    first = [{"_id": f"{i:024x}"} for i in range(10)]
+    second = [{"_id": f"{i:024x}"} for i in range(5, 15)]
+
+    async def scenario():
+        await deduper.claim(first)
+        return await deduper.claim(second)
+
+    claimed = asyncio.run(scenario())
+
+    assert [doc["_id"] for doc in claimed] == [f"{i:024x}" for i in range(10, 15)]
+
+
+def test_set_release_allows_reenqueue():
+    deduper = SetDeduper(fakeredis.FakeAsyncRedis(decode_responses=True), "jobs")
+    docs = [{"_id": "a"}, {"_id": "b"}]
+
+    async def scenario():
+        await deduper.claim(docs)
+        await deduper.release([{"_id": "a"}])
+        return await deduper.claim(docs)
+
+    assert asyncio.run(scenario()) == [{"_id": "a"}]
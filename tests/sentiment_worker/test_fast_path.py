@@ -0,0 +1,30 @@
+from ml.fast_path import FastPathClassifier
+
+
+def test_labels_trivial_replies():
+    classifier = FastPathClassifier()
+
+    assert classifier(["Ок", "спс!", "база", "ахах", ")))", "((", "👍👍🔥"]) == [
+        "neutral",
+        "speech_act",
+        "positive",
+        "positive",
+        "positive",
+        "negative",
+        "positive",
+    ]
+
+
+def test_leaves_everything_else_to_the_models():
+    classifier = FastPathClassifier()
+
+    assert classifier(
+        ["ну да, конечно, отличная идея", "да нет наверное", "😂😭", "ок 👍", ""]
+    ) == [None, None, None, None, None]
+
+
+def test_is_deterministic():
+    classifier = FastPathClassifier()
+    texts = ["ок", "😢", "понял", "кринж", "что"]
+
+    assert classifier(texts) == classifier(texts) == FastPathClassifier()(texts)
@@ -0,0 +1,56 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("torch")
+
+from inference_pool import InferencePool
+
+
+class EchoCoordinator:
+    """Stands in for the models; the text "crash" kills its process."""
+
+    def analyze_batch_timed(self, texts):
+        if "crash" in texts:
+            os._exit(1)
+        return [{"text": t, "pid": os.getpid()} for t in texts], {"inference": 0.0}
+
+
+def make_coordinator():
+    return EchoCoordinator()
+
+
+def test_spawned_processes_return_results_in_order():
+    pool = InferencePool(make_coordinator, processes=2, torch_threads=1)
+    batches = [[f"{b}-{i}" for i in range(b + 1)] for b in range(6)]
+
+    async def scenario():
+        return await asyncio.gather(*(pool.analyze(batch) for batch in batches))
+
+    try:
+        outputs = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    for batch, (results, _) in zip(batches, outputs):
+        assert [r["text"] for r in results] == batch
+        assert all(r["pid"] != os.getpid() for r in results)
+
+
+def test_pool_is_restarted_after_a_process_dies():
+    pool = InferencePool(make_coordinator, processes=2, torch_threads=1)
+
+    async def scenario():
+        with pytest.raises(BrokenProcessPool):
+            await pool.analyze(["crash"])
+        return await pool.analyze(["ok"])
+
+    try:
+        results, _ = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+    assert [r["text"] for r in results] == ["ok"]
+    assert pool.restarts == 2
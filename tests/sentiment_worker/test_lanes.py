@@ -0,0 +1,92 @@
+import asyncio
+from typing import List
+
+from lanes import BACKFILL, LIVE, REPROCESS, PriorityLanes
+from transport import QueueEntry
+
+
+class MemoryLane:
+    def __init__(self, size: int):
+        self.items = [f"job-{i}" for i in range(size)]
+        self.acked: List[QueueEntry] = []
+
+    async def setup(self):
+        pass
+
+    async def enqueue(self, payloads):
+        self.items += payloads
+
+    async def read(self, count, wait=True):
+        taken, self.items = self.items[:count], self.items[count:]
+        return [QueueEntry(data=item) for item in taken]
+
+    async def ack(self, entries):
+        self.acked += entries
+
+    async def depth(self):
+        return len(self.items)
+
+
+def read_lanes(live_size: int, backfill_size: int, count: int = 100):
+    lanes = PriorityLanes(
+        live=MemoryLane(live_size),
+        backfill=MemoryLane(backfill_size),
+        backfill_share=0.1,
+    )
+    entries = asyncio.run(lanes.read(count))
+    return lanes, [entry.lane for entry in entries]
+
+
+def test_backfill_keeps_its_share_under_live_load():
+    _, lanes = read_lanes(live_size=1000, backfill_size=1000)
+
+    assert lanes.count(LIVE) == 90
+    assert lanes.count(BACKFILL) == 10
+
+
+def test_backfill_takes_spare_capacity():
+    _, lanes = read_lanes(live_size=5, backfill_size=1000)
+
+    assert lanes.count(LIVE) == 5
+    assert lanes.count(BACKFILL) == 95
+
+
+def test_live_takes_unused_backfill_share():
+    _, lanes = read_lanes(live_size=1000, backfill_size=0)
+
+    assert lanes.count(LIVE) == 100
+
+
+def test_ack_goes_back_to_the_owning_lane():
+    priority, _ = read_lanes(live_size=3, backfill_size=3, count=4)
+    entries = [
+        QueueEntry(data="a", lane=LIVE),
+        QueueEntry(data="b", lane=BACKFILL),
+        QueueEntry(data="c", lane=LIVE),
+    ]
+
+    asyncio.run(priority.ack(entries))
+
+    assert [e.data for e in priority.live.acked] == ["a", "c"]
+    assert [e.data for e in priority.backfill.acked] == ["b"]
+
+
+def test_reprocess_only_fills_leftover_slots():
+    lanes = PriorityLanes(
+        live=MemoryLane(1000),
+        backfill=MemoryLane(1000),
+        reprocess=MemoryLane(1000),
+    )
+    busy = [entry.lane for entry in asyncio.run(lanes.read(100))]
+
+    lanes = PriorityLanes(
+        live=MemoryLane(20), backfill=MemoryLane(30), reprocess=MemoryLane(1000)
+    )
+    idle = [entry.lane for entry in asyncio.run(lanes.read(100))]
+
+    assert REPROCESS not in busy
+    assert (idle.count(LIVE), idle.count(BACKFILL), idle.count(REPROCESS)) == (
+        20,
+        30,
+        50,
+    )
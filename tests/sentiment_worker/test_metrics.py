@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta
+
+import metrics
+from prometheus_client import REGISTRY
+
+AGE = "kurisu_sentiment_message_age_seconds"
+
+
+def sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_observe_message_age_records_buckets():
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    before = {le: sample(f"{AGE}_bucket", {"le": le}) for le in ("1.0", "5.0", "15.0")}
+    count = sample(f"{AGE}_count")
+    total = sample(f"{AGE}_sum")
+
+    metrics.observe_message_age(now - timedelta(seconds=10), now)
+    metrics.observe_message_age(now + timedelta(seconds=30), now)
+    metrics.observe_message_age(None, now)
+
+    assert sample(f"{AGE}_count") == count + 2
+    assert sample(f"{AGE}_sum") == total + 10
+    assert sample(f"{AGE}_bucket", {"le": "1.0"}) == before["1.0"] + 1
+    assert sample(f"{AGE}_bucket", {"le": "5.0"}) == before["5.0"] + 1
+    assert sample(f"{AGE}_bucket", {"le": "15.0"}) == before["15.0"] + 2
+
+
+def test_labelled_metrics_record_per_label():
+    lane = sample("kurisu_sentiment_lane_jobs_total", {"lane": "backfill"})
+    stage = {"stage": "write", "le": "0.05"}
+    write = sample("kurisu_sentiment_stage_seconds_bucket", stage)
+    below = sample("kurisu_sentiment_stage_seconds_bucket", {**stage, "le": "0.025"})
+
+    metrics.LANE_JOBS.labels(lane="backfill").inc()
+    metrics.STAGE_SECONDS.labels(stage="write").observe(0.04)
+    metrics.QUEUE_DEPTH.labels(queue="live").set(7)
+
+    assert sample("kurisu_sentiment_lane_jobs_total", {"lane": "backfill"}) == lane + 1
+    assert sample("kurisu_sentiment_stage_seconds_bucket", stage) == write + 1
+    assert (
+        sample("kurisu_sentiment_stage_seconds_bucket", {**stage, "le": "0.025"})
+        == below
+    )
+    assert sample("kurisu_sentiment_queue_depth", {"queue": "live"}) == 7
@@ -0,0 +1,86 @@
+import asyncio
+
+from pipeline import StagePipeline, WorkBatch
+from transport import QueueEntry
+
+
+class FakeStages:
+    def __init__(self, batches: int):
+        self.remaining = batches
+        self.read = 0
+        self.written = []
+        self.failed = []
+        self.infer_gate = asyncio.Event()
+        self.infer_gate.set()
+
+    async def read_batch(self):
+        if self.remaining == 0:
+            await asyncio.sleep(0.001)
+            return None
+        self.remaining -= 1
+        self.read += 1
+        return WorkBatch(entries=[QueueEntry(data=str(self.read))], items=[{}])
+
+    async def infer(self, batch: WorkBatch):
+        await self.infer_gate.wait()
+        if batch.entries[0].data == "3":
+            raise RuntimeError("model failed")
+        batch.results = [{"ok": True}]
+
+    async def write(self, batch: WorkBatch):
+        self.written.append(batch.entries[0].data)
+
+    async def fail(self, batch: WorkBatch):
+        self.failed.append(batch.entries[0].data)
+
+
+def make_pipeline(stages: FakeStages, **kwargs) -> StagePipeline:
+    return StagePipeline(
+        read=stages.read_batch,
+        infer=stages.infer,
+        write=stages.write,
+        on_failure=stages.fail,
+        **kwargs,
+    )
+
+
+def test_stalled_inference_blocks_reading():
+    stages = FakeStages(batches=100)
+    stages.infer_gate.clear()
+    pipeline = make_pipeline(stages, inference_workers=2, prefetch_batches=2)
+
+    async def scenario():
+        task = asyncio.create_task(pipeline.run())
+        await asyncio.sleep(0.05)
+        read_while_stalled = stages.read
+        pipeline.stop()
+        stages.infer_gate.set()
+        await asyncio.wait_for(task, timeout=1)
+        return read_while_stalled
+
+    read_while_stalled = asyncio.run(scenario())
+
+    assert read_while_stalled == 2 + 2 + 1
+    assert sorted(stages.written + stages.failed, key=int) == [
+        str(i) for i in range(1, read_while_stalled + 1)
+    ]
+
+
+def test_stop_drains_every_batch_already_read():
+    stages = FakeStages(batches=20)
+    pipeline = make_pipeline(stages, inference_workers=3, prefetch_batches=1)
+
+    async def scenario():
+        task = asyncio.create_task(pipeline.run())
+        while stages.remaining:
+            await asyncio.sleep(0.001)
+        pipeline.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert stages.failed == ["3"]
+    assert sorted(stages.written, key=int) == [str(i) for i in range(1, 21) if i != 3]
+    assert pipeline.inference_queue.empty() and pipeline.write_queue.empty()
+    assert pipeline.stats["infer"].errors == 1
+    assert pipeline.stats["write"].batches == 19
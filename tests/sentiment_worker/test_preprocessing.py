@@ -0,0 +1,36 @@
+from ml.preprocessing import TextPreprocessor
+
+
+def test_strips_links_mentions_and_code():
+    cleaned = TextPreprocessor()(
+        [
+            "глянь https://example.com/a?b=1 это огонь",
+            "@someone_here спасибо",
+            "вот код ```print(1)\nprint(2)``` не работает",
+        ]
+    )
+    assert cleaned == ["глянь это огонь", "спасибо", "вот код не работает"]
+
+
+def test_drops_link_and_mention_only_texts():
+    assert TextPreprocessor()(
+        ["https://t.me/channel/123", "@someone @another", "  www.site.ru  "]
+    ) == [None, None, None]
+
+
+def test_collapses_repeats_and_emoji_runs():
+    cleaned = TextPreprocessor()(["ахахаааааааа!!!!!!", "🔥🔥🔥🔥🔥🔥 жесть"])
+    assert cleaned == ["ахахааа!!!", "🔥🔥🔥 жесть"]
+
+
+def test_long_texts_keep_head_and_tail():
+    text = " ".join(f"w{i}" for i in range(1000))
+    cleaned = TextPreprocessor(max_chars=200)([text])[0]
+    assert len(cleaned) <= 200 + 3
+    assert cleaned.startswith("w0 w1 ")
+    assert cleaned.endswith(" w998 w999")
+    assert " … " in cleaned
+
+
+def test_keeps_short_punctuation_replies():
+    assert TextPreprocessor()(["+", "?!"]) == ["+", "?!"]
@@ -0,0 +1,12 @@
+from reprocess import previous_result
+
+
+def test_previous_result_only_for_counted_results():
+    stored = {"negative": 0.75, "positive": 0.25, "sensitive_topics": {"drugs": 0.5}}
+
+    assert previous_result(stored) is None
+    assert previous_result({**stored, "model_version": "abc"}) is None
+    assert previous_result({**stored, "model_version": "abc", "rolled_up": True}) == {
+        "sentiment": {"negative": 0.75, "positive": 0.25},
+        "sensitive_topics": ["drugs"],
+    }
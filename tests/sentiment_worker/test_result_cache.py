@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from result_cache import ResultCache, normalize_text, text_key
+
+RESULT = {"sentiment": {"positive": 0.9}, "sensitive_topics": {}}
+
+
+def test_text_key_ignores_case_and_whitespace():
+    assert normalize_text("  Ахах\n\tахах ") == "ахах ахах"
+    assert text_key("АХАХ") == text_key(" ахах ")
+    assert text_key("ахах") != text_key("ахахах")
+
+
+def test_local_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2, namespace="test")
+
+    async def scenario():
+        await cache.put_many({"a": RESULT, "b": RESULT})
+        assert await cache.get_many(["a"]) == {"a": RESULT}
+        await cache.put_many({"c": RESULT})
+        return await cache.get_many(["a", "b", "c"])
+
+    found = asyncio.run(scenario())
+
+    assert set(found) == {"a", "c"}
+    assert len(cache) == 2
+    assert cache.stats.local_hits == 3
+    assert cache.stats.lookups == 4
+
+
+def test_redis_tier_is_shared_between_instances():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    writer = ResultCache(max_entries=10, namespace="test", redis_client=redis_client)
+    reader = ResultCache(max_entries=10, namespace="test", redis_client=redis_client)
+
+    async def scenario():
+        await writer.put_many({"a": RESULT})
+        return await reader.get_many(["a", "missing"])
+
+    assert asyncio.run(scenario()) == {"a": RESULT}
+    assert reader.stats.redis_hits == 1
+    assert len(reader) == 1
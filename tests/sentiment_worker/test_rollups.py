@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+from rollups import build_rollup_updates, rollup_marker_id
+
+
+def analysis(negative: float, positive: float, topics=()):
+    return {
+        "sentiment": {"negative": negative, "neutral": 0.0, "positive": positive},
+        "sensitive_topics": {topic: 0.5 for topic in topics},
+    }
+
+
+def test_batch_folds_into_one_upsert_per_chat_and_bucket():
+    items = [
+        {"_id": "a", "chat_id": -1, "date": "2025-01-01T10:15:00"},
+        {"_id": "b", "chat_id": -1, "date": "2025-01-01T10:45:00+00:00"},
+        {"_id": "c", "chat_id": -1, "date": "2025-01-01T23:59:00"},
+        {"_id": "d", "chat_id": -2, "date": None},
+    ]
+    results = [
+        analysis(0.75, 0.25, topics=["politics"]),
+        analysis(0.25, 0.75),
+        analysis(0.5, 0.5, topics=["politics", "drugs"]),
+        analysis(1.0, 0.0),
+    ]
+
+    updates = {
+        (op._filter["granularity"], op._filter["bucket"]): op._doc["$inc"]
+        for op in build_rollup_updates(items, results)
+    }
+
+    ten = datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+    day = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert set(updates) == {
+        ("hour", ten),
+        ("hour", datetime(2025, 1, 1, 23, tzinfo=timezone.utc)),
+        ("day", day),
+    }
+    assert updates[("hour", ten)] == {
+        "messages": 2,
+        "sentiment.negative": 1.0,
+        "sentiment.neutral": 0.0,
+        "sentiment.positive": 1.0,
+        "topics.politics": 1,
+    }
+    assert updates[("day", day)]["messages"] == 3
+    assert updates[("day", day)]["topics.politics"] == 2
+    assert updates[("day", day)]["topics.drugs"] == 1
+
+
+def test_reprocessed_message_replaces_its_previous_contribution():
+    previous = analysis(1.0, 0.0, topics=["politics"])
+    items = [
+        {
+            "_id": "a",
+            "chat_id": -1,
+            "date": "2025-01-01T10:15:00",
+            "previous": {
+                "sentiment": previous["sentiment"],
+                "sensitive_topics": list(previous["sensitive_topics"]),
+            },
+        }
+    ]
+
+    updates = build_rollup_updates(items, [analysis(0.25, 0.75)])
+
+    assert len(updates) == 2
+    assert updates[0]._doc["$inc"] == {
+        "sentiment.negative": -0.75,
+        "sentiment.neutral": 0.0,
+        "sentiment.positive": 0.75,
+        "topics.politics": -1,
+    }
+
+
+def test_marker_id_is_stable_across_redeliveries_only():
+    previous = analysis(1.0, 0.0, topics=["politics"])
+    job = {"_id": "a", "chat_id": -1, "date": "2025-01-01T10:15:00"}
+    reprocess = {**job, "previous": {"sentiment": previous["sentiment"]}}
+    again = {**job, "previous": {"sentiment": analysis(0.0, 1.0)["sentiment"]}}
+
+    assert rollup_marker_id(job) == rollup_marker_id(dict(job)) == "a"
+    assert rollup_marker_id(reprocess) == rollup_marker_id(dict(reprocess))
+    assert rollup_marker_id(reprocess) != rollup_marker_id(again)
+    assert rollup_marker_id(reprocess).startswith("a:")
@@ -0,0 +1,63 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from transport import StreamQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_queue(client, **kwargs) -> StreamQueue:
+    return StreamQueue(
+        client, stream="jobs", group="workers", consumer="worker-1", **kwargs
+    )
+
+
+async def drain(queue: StreamQueue, count: int = 2):
+    delivered = []
+    while entries := await queue.read(count, wait=False):
+        delivered += entries
+    return delivered
+
+
+def test_restart_delivers_each_pending_entry_once():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def scenario():
+        crashed = make_queue(client)
+        await crashed.setup()
+        await crashed.enqueue([f"job-{i}" for i in range(5)])
+        await drain(crashed)
+        restarted = make_queue(client, claim_idle_ms=0)
+        await restarted.enqueue(["job-5"])
+        delivered = await drain(restarted)
+        await restarted.ack(delivered)
+        return delivered, await restarted.depth()
+
+    delivered, depth = asyncio.run(scenario())
+
+    counts = Counter(entry.data for entry in delivered)
+    assert counts == Counter(f"job-{i}" for i in range(6))
+    assert depth == 0
+
+
+def test_entry_is_dead_lettered_after_max_deliveries():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def scenario():
+        queue = make_queue(client, max_deliveries=2)
+        await queue.setup()
+        await queue.enqueue(["poison"])
+        deliveries = 0
+        for _ in range(4):
+            queue = make_queue(client, max_deliveries=2)
+            deliveries += len(await drain(queue))
+        dead = await client.xrange("jobs:dead")
+        return deliveries, dead, await queue.depth()
+
+    deliveries, dead, depth = asyncio.run(scenario())
+
+    assert deliveries == 2
+    assert [fields["data"] for _, fields in dead] == ["poison"]
+    assert depth == 0
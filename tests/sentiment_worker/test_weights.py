@@ -0,0 +1,55 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+safetensors_torch = pytest.importorskip("safetensors.torch")
+
+from ml.backends import WEIGHTS_FILENAME, load_torch_model
+
+
+@pytest.fixture(scope="module")
+def snapshot(tmp_path_factory):
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=128,
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=64,
+        num_labels=5,
+    )
+    model = transformers.BertForSequenceClassification(config).eval()
+    path = tmp_path_factory.mktemp("weights")
+    model.save_pretrained(path, safe_serialization=True)
+    assert (path / WEIGHTS_FILENAME).exists()
+    return model, path
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_snapshot_reproduces_the_model(snapshot, mmap):
+    """Loading the safetensors snapshot, mapped or not, gives the same logits."""
+    model, path = snapshot
+    loaded = load_torch_model(path, mmap=mmap).eval()
+    input_ids = torch.randint(
+        1, 128, (3, 16), generator=torch.Generator().manual_seed(1)
+    )
+
+    with torch.no_grad():
+        expected = model(input_ids=input_ids).logits
+        actual = loaded(input_ids=input_ids).logits
+
+    torch.testing.assert_close(actual, expected)
+
+
+def test_mapped_snapshot_missing_weights_is_rejected(snapshot, tmp_path):
+    model, path = snapshot
+    model.config.save_pretrained(tmp_path)
+    weights = safetensors_torch.load_file(path / WEIGHTS_FILENAME)
+    del weights["classifier.weight"]
+    safetensors_torch.save_file(
+        weights, tmp_path / WEIGHTS_FILENAME, metadata={"format": "pt"}
+    )
+
+    with pytest.raises(RuntimeError, match="classifier.weight"):
+        load_torch_model(tmp_path, mmap=True)